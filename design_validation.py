@@ -18,16 +18,202 @@ This is NOT optional documentation - it's a required gate in the development
 process.
 """
 
+import atexit
+import copy
+import functools
 import hashlib
+import hmac
 import json
 import os
+import queue
 import re
-import uuid
-from datetime import datetime
+import sys
+import threading
+import time
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple, Union
 
-import yaml
+try:
+    import orjson
+except ImportError:  # optional speed-up - stdlib json is the fallback
+    orjson = None
+
+try:
+    import jsonschema
+except ImportError:  # optional - proposal fields are then checked directly
+    jsonschema = None
+
+
+# Prefix for tokens issued by this version; "valid-" tokens are legacy
+_TOKEN_PREFIX = "valid2"
+
+
+def _compile_patterns(patterns: List[str]) -> Tuple["re.Pattern[str]", ...]:
+    """Precompile one check category's patterns (case-insensitive)."""
+    return tuple(re.compile(p, re.IGNORECASE) for p in patterns)
+
+
+# Built-in check patterns, compiled once at import. Each matching pattern is
+# reported to the user, so each category keeps one regex per pattern.
+
+# Hardcoded configuration
+_HARDCODE_RES = _compile_patterns(
+    [
+        r"staging",
+        r"production",
+        r"pi-k8",
+        r"teleport\.tw\.ee",
+        r"ALLOWED_CLUSTERS\s*=",
+    ]
+)
+
+# Ansible-first anti-patterns
+_ANSIBLE_RES = _compile_patterns(
+    [
+        r"\.sh\s+script",
+        r"bash.*install",
+        r"manual.*installation",
+        r"install\.sh",
+    ]
+)
+
+# Concrete dependencies instead of abstractions
+_CONCRETE_RES = _compile_patterns(
+    [
+        r"directly calls.*ssh",
+        r"hardcoded.*command",
+        r"assumes.*exists",
+    ]
+)
+
+# God tools (action parameters) and wording that suggests reaching into
+# another layer's internals - only whether they match matters
+_GOD_TOOL_RE = re.compile(r"action.*parameter", re.IGNORECASE)
+_COUPLING_RE = re.compile(r"import|internal|private", re.IGNORECASE)
+
+
+def _keyword_re(keywords: List[str]) -> "re.Pattern[str]":
+    """Compile literal keywords into one alternation scanned in a single pass."""
+    return re.compile("|".join(re.escape(k) for k in keywords))
+
+
+# Team-specific terms that don't belong in platform layer tool purposes
+_TEAM_KEYWORDS_RE = _keyword_re(["flux", "kustomization", "k8s-master"])
+
+
+# proposal_schema type names -> Python types (used without jsonschema)
+_SCHEMA_TYPES = {
+    "string": str,
+    "boolean": bool,
+    "array": (list, tuple),
+    "object": dict,
+}
+
+
+def _proposal_schema_errors(
+    schema: Dict[str, Any], proposal: Dict[str, Any]
+) -> List[str]:
+    """
+    Check a proposal's fields against the checklist's proposal_schema.
+
+    Uses jsonschema when it is installed. Otherwise the top-level fields
+    are checked directly for what the schema declares: required, type,
+    enum, minLength and the type of array items.
+    """
+    if jsonschema is not None:
+        errors = []
+        for error in jsonschema.Draft7Validator(schema).iter_errors(proposal):
+            path = ".".join(str(p) for p in error.absolute_path)
+            errors.append(f"'{path}': {error.message}" if path else error.message)
+        return errors
+
+    errors = [
+        f"'{name}' is required"
+        for name in schema.get("required", [])
+        if name not in proposal
+    ]
+    for name, rules in schema.get("properties", {}).items():
+        if name not in proposal:
+            continue
+        value = proposal[name]
+
+        expected = _SCHEMA_TYPES.get(rules.get("type"))
+        if expected and not isinstance(value, expected):
+            errors.append(f"'{name}' must be of type {rules['type']}")
+            continue
+        if "enum" in rules and value not in rules["enum"]:
+            errors.append(f"'{name}' must be one of: {rules['enum']} (got {value!r})")
+        if isinstance(value, str) and len(value) < rules.get("minLength", 0):
+            errors.append(
+                f"'{name}' must be at least {rules['minLength']} character(s)"
+            )
+
+        item_type_name = rules.get("items", {}).get("type")
+        item_type = _SCHEMA_TYPES.get(item_type_name)
+        if item_type and isinstance(value, (list, tuple)):
+            errors.extend(
+                f"'{name}[{i}]' must be of type {item_type_name}"
+                for i, item in enumerate(value)
+                if not isinstance(item, item_type)
+            )
+    return errors
+
+
+@functools.lru_cache(maxsize=8)
+def _load_checklist_cached(
+    path_str: str, mtime: float
+) -> Tuple[Dict[str, Any], Dict[str, "re.Pattern[str]"]]:
+    """
+    Parse the checklist and compile its red flag patterns.
+
+    Keyed by (path, mtime) so edits to the YAML are picked up without a
+    restart, while repeat validators share one parsed copy.
+    """
+    # Deferred import: yaml is only needed once a validator is constructed,
+    # not to import this module. CSafeLoader exists only with libyaml.
+    import yaml
+
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    with open(path_str, "r") as f:
+        checklist = yaml.load(f, Loader=loader) or {}
+
+    red_flag_res = {
+        key: re.compile(flag["pattern"])
+        for key, flag in checklist.get("red_flags", {}).items()
+        if isinstance(flag, dict) and flag.get("pattern")
+    }
+    return checklist, red_flag_res
+
+
+@functools.lru_cache(maxsize=256)
+def _load_proposal_cached(path_str: str, mtime_ns: int) -> Dict[str, Any]:
+    """Parse one proposal file; the mtime key invalidates stale entries."""
+    with open(path_str, "rb") as f:
+        raw = f.read()
+    return orjson.loads(raw) if orjson is not None else json.loads(raw)
+
+
+def _load_proposal(path: Union[str, Path]) -> Dict[str, Any]:
+    """
+    Load a proposal file through the in-process LRU cache.
+
+    The returned dict is shared between callers - treat it as read-only.
+    Raises FileNotFoundError if the proposal has been removed.
+    """
+    return _load_proposal_cached(str(path), os.stat(path).st_mtime_ns)
+
+
+def _utc_timestamp() -> str:
+    """
+    Current UTC time as ISO 8601 with microseconds and a "Z" suffix.
+
+    Formatted straight from time.time() - cheaper than building a datetime,
+    and avoids datetime.utcnow(), which is deprecated from Python 3.12.
+    """
+    now = time.time()
+    base = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(now))
+    micros = int(now % 1 * 1_000_000)
+    return f"{base}.{micros:06d}Z"
 
 
 class ValidationError(Exception):
@@ -64,16 +250,67 @@ class DesignValidator:
         # Directory for storing validated proposals
         self.proposals_dir = script_dir / ".ephemeral" / "tool-proposals"
         self.proposals_dir.mkdir(parents=True, exist_ok=True)
+        flush_pending_writes()
+
+        # proposal_id -> proposal file, from the {id}_{tool}.json file names,
+        # so lookups by ID don't need a directory glob
+        self._proposal_id_to_path: Dict[str, Path] = {
+            entry.name.split("_", 1)[0]: Path(entry.path)
+            for entry in self._proposal_entries()
+        }
+
+        # proposal_id -> (expected token, proposal file), so verify_token can
+        # reject bad tokens without touching disk
+        self._token_cache: Dict[str, Tuple[str, Path]] = {}
+        for filepath in self._proposal_id_to_path.values():
+            try:
+                data = _load_proposal(filepath)
+                self._cache_token(
+                    data["validation_results"]["proposal_id"],
+                    data["tool_name"],
+                    data["validation_results"]["timestamp"],
+                    filepath,
+                )
+            except (OSError, ValueError, KeyError, TypeError):
+                # Unreadable proposal - verify_token falls back to disk
+                continue
+
+        # Proposals saved before index.jsonl existed must be indexed before
+        # the first append, or list_proposals would miss them
+        if not (self.proposals_dir / "index.jsonl").exists():
+            self._rebuild_index()
+
+    def _proposal_entries(self, prefix: str = "") -> List[os.DirEntry]:
+        """
+        List proposal files (optionally by name prefix), sorted by name.
+
+        Uses os.scandir, which avoids building a Path per directory entry.
+        """
+        with os.scandir(self.proposals_dir) as it:
+            entries = [
+                e for e in it if e.name.endswith(".json") and e.name.startswith(prefix)
+            ]
+        entries.sort(key=lambda e: e.name)
+        return entries
 
     def _load_checklist(self) -> Dict[str, Any]:
-        """Load and parse the design checklist."""
-        if not self.checklist_path.exists():
+        """
+        Load and parse the design checklist.
+
+        The parsed dict (and its compiled red flag patterns) is shared across
+        validator instances - treat it as read-only.
+        """
+        try:
+            mtime = self.checklist_path.stat().st_mtime
+        except FileNotFoundError:
             raise FileNotFoundError(
                 f"Design checklist not found: {self.checklist_path}"
             )
 
-        with open(self.checklist_path, "r") as f:
-            return yaml.safe_load(f)
+        checklist, self._red_flag_res = _load_checklist_cached(
+            str(self.checklist_path), mtime
+        )
+        return checklist
 
     def validate_tool_proposal(
         self,
@@ -113,21 +350,39 @@ class DesignValidator:
         """
         results = {
             "valid": False,
-            "proposal_id": str(uuid.uuid4())[:8],
+            # 8 hex chars straight from the OS RNG (no UUID build + slice)
+            "proposal_id": os.urandom(4).hex(),
             "tool_name": tool_name,
             "issues": [],
             "warnings": [],
             "checklist_results": {},
-            "timestamp": datetime.utcnow().isoformat() + "Z",
+            "timestamp": _utc_timestamp(),
         }
 
         # Run checklist validations
         checklist_results = {}
 
-        # 1. Configuration vs Code
-        config_check = self._check_configuration(
-            tool_name, implementation_approach, dependencies
+        # 0. Proposal structure (proposal_schema in the checklist). Nothing
+        # below is safe to run on a malformed proposal, so stop here.
+        schema_check = self._check_proposal_schema(
+            tool_name,
+            purpose,
+            layer,
+            dependencies,
+            requires_system_state_change,
+            implementation_approach,
         )
+        checklist_results["schema"] = schema_check
+        if not schema_check["pass"]:
+            results["issues"].extend(schema_check["issues"])
+            results["checklist_results"] = checklist_results
+            return results
+
+        # Dependency checks match against the names joined into one string
+        deps_str = " ".join(dependencies)
+
+        # 1. Configuration vs Code
+        config_check = self._check_configuration(tool_name, implementation_approach)
         checklist_results["configuration"] = config_check
         if not config_check["pass"]:
             results["issues"].extend(config_check["issues"])
@@ -139,7 +394,7 @@ class DesignValidator:
             results["issues"].extend(layer_check["issues"])
 
         # 3. Dependencies
-        dep_check = self._check_dependencies(dependencies, layer)
+        dep_check = self._check_dependencies(deps_str, layer)
         checklist_results["dependencies"] = dep_check
         if not dep_check["pass"]:
             results["issues"].extend(dep_check["issues"])
@@ -152,9 +407,7 @@ class DesignValidator:
                 results["issues"].extend(ansible_check["issues"])
 
         # 5. Red flag detection
-        red_flags = self._detect_red_flags(
-            tool_name, implementation_approach, dependencies
-        )
+        red_flags = self._detect_red_flags(tool_name, implementation_approach, deps_str)
         checklist_results["red_flags"] = red_flags
         if red_flags["found"]:
             results["warnings"].extend(red_flags["warnings"])
@@ -165,12 +418,9 @@ class DesignValidator:
         if len(results["issues"]) == 0:
             results["valid"] = True
             # Generate validation token
-            token_data = {
-                "proposal_id": results["proposal_id"],
-                "tool_name": tool_name,
-                "timestamp": results["timestamp"],
-            }
-            results["token"] = self._generate_token(token_data)
+            results["token"] = self._generate_token(
+                results["proposal_id"], tool_name, results["timestamp"]
+            )
 
             # Save the proposal
             proposal_path = self._save_proposal(
@@ -190,24 +440,16 @@ class DesignValidator:
         return results
 
     def _check_configuration(
-        self, tool_name: str, implementation: str, dependencies: List[str]
+        self, tool_name: str, implementation: str
     ) -> Dict[str, Any]:
         """Check if configuration is properly externalized."""
         issues = []
 
         # Check for hardcoded values in implementation description
-        hardcode_patterns = [
-            r"staging",
-            r"production",
-            r"pi-k8",
-            r"teleport\.tw\.ee",
-            r"ALLOWED_CLUSTERS\s*=",
-        ]
-
-        for pattern in hardcode_patterns:
-            if re.search(pattern, implementation, re.IGNORECASE):
+        for regex in _HARDCODE_RES:
+            if regex.search(implementation):
                 issues.append(
-                    f"⚠️  Potential hardcoded configuration detected: '{pattern}'. "
+                    f"⚠️  Potential hardcoded configuration detected: '{regex.pattern}'. "
                     "Consider using config/clusters.yaml or similar."
                 )
 
@@ -217,15 +459,45 @@ class DesignValidator:
             "category": "Configuration vs Code",
         }
 
+    def _check_proposal_schema(
+        self,
+        tool_name: Any,
+        purpose: Any,
+        layer: Any,
+        dependencies: Any,
+        requires_system_state_change: Any,
+        implementation_approach: Any,
+    ) -> Dict[str, Any]:
+        """Check proposal field presence, types and allowed values."""
+        issues = []
+
+        schema = self.checklist.get("proposal_schema")
+        if schema:
+            fields = {
+                "tool_name": tool_name,
+                "purpose": purpose,
+                # Layer names are case-insensitive
+                "layer": layer.lower() if isinstance(layer, str) else layer,
+                "dependencies": dependencies,
+                "requires_system_state_change": requires_system_state_change,
+                "implementation_approach": implementation_approach,
+            }
+            # A field left as None counts as not provided
+            proposal = {k: v for k, v in fields.items() if v is not None}
+            for error in _proposal_schema_errors(schema, proposal):
+                issues.append(f"❌ Invalid proposal: {error}")
+
+        return {
+            "pass": len(issues) == 0,
+            "issues": issues,
+            "category": "Proposal Schema",
+        }
+
     def _check_layer_placement(
         self, layer: str, dependencies: List[str], purpose: str
     ) -> Dict[str, Any]:
-        """Validate layer placement."""
+        """Validate layer placement (layer names are checked by the schema)."""
         issues = []
-        valid_layers = ["platform", "team", "personal"]
-
-        if layer.lower() not in valid_layers:
-            issues.append(f"❌ Invalid layer '{layer}'. Must be one of: {valid_layers}")
 
         # Check layer contracts
         layer_contracts = self.checklist.get("layer_contracts", {})
@@ -233,8 +505,7 @@ class DesignValidator:
 
         if layer.lower() == "platform":
             # Platform layer should not depend on team-specific tools
-            team_keywords = ["flux", "kustomization", "k8s-master"]
-            if any(keyword in purpose.lower() for keyword in team_keywords):
+            if _TEAM_KEYWORDS_RE.search(purpose.lower()):
                 issues.append(
                     "⚠️  Platform layer tool appears to have team-specific assumptions. "
                     "Platform tools should work for ANY team."
@@ -246,24 +517,15 @@ class DesignValidator:
             "category": "Layer Placement",
         }
 
-    def _check_dependencies(
-        self, dependencies: List[str], layer: str
-    ) -> Dict[str, Any]:
-        """Check dependency structure."""
+    def _check_dependencies(self, deps_str: str, layer: str) -> Dict[str, Any]:
+        """Check dependency structure (dependencies joined by spaces)."""
         issues = []
 
         # Dependencies should be abstractions, not implementations
-        concrete_patterns = [
-            r"directly calls.*ssh",
-            r"hardcoded.*command",
-            r"assumes.*exists",
-        ]
-
-        deps_str = " ".join(dependencies).lower()
-        for pattern in concrete_patterns:
-            if re.search(pattern, deps_str):
+        for regex in _CONCRETE_RES:
+            if regex.search(deps_str):
                 issues.append(
-                    f"⚠️  Dependency appears too concrete: '{pattern}'. "
+                    f"⚠️  Dependency appears too concrete: '{regex.pattern}'. "
                     "Consider depending on abstractions (interfaces) instead."
                 )
 
@@ -278,17 +540,10 @@ class DesignValidator:
         issues = []
 
         # If system state change is required, should use Ansible
-        anti_patterns = [
-            r"\.sh\s+script",
-            r"bash.*install",
-            r"manual.*installation",
-            r"install\.sh",
-        ]
-
-        for pattern in anti_patterns:
-            if re.search(pattern, implementation, re.IGNORECASE):
+        for regex in _ANSIBLE_RES:
+            if regex.search(implementation):
                 issues.append(
-                    f"❌ Ansible-first principle violation: '{pattern}'. "
+                    f"❌ Ansible-first principle violation: '{regex.pattern}'. "
                     "System state changes must be managed by Ansible playbooks, not shell scripts."
                 )
 
@@ -299,7 +554,10 @@ class DesignValidator:
         }
 
     def _detect_red_flags(
-        self, tool_name: str, implementation: str, dependencies: List[str]
+        self,
+        tool_name: str,
+        implementation: str,
+        deps_str: str,
     ) -> Dict[str, Any]:
         """Detect anti-patterns from the red flags list."""
         warnings = []
@@ -308,24 +566,23 @@ class DesignValidator:
         red_flags = self.checklist.get("red_flags", {})
 
         # Check for hardcoded infrastructure
-        if "hardcoded_infrastructure" in red_flags:
+        if "hardcoded_infrastructure" in self._red_flag_res:
             flag = red_flags["hardcoded_infrastructure"]
-            if re.search(flag["pattern"], implementation):
+            if self._red_flag_res["hardcoded_infrastructure"].search(implementation):
                 warnings.append(f"🚩 {flag['name']}: {flag['problem']}")
                 found_flags.append("hardcoded_infrastructure")
 
         # Check for god tools (action parameters)
         if "god_tools" in red_flags:
             flag = red_flags["god_tools"]
-            if re.search(r"action.*parameter", implementation, re.IGNORECASE):
+            if _GOD_TOOL_RE.search(implementation):
                 warnings.append(
                     f"🚩 {flag['name']}: Tools should be focused and single-purpose"
                 )
                 found_flags.append("god_tools")
 
         # Check for tight coupling
-        deps_str = " ".join(dependencies).lower()
-        if any(word in deps_str for word in ["import", "internal", "private"]):
+        if _COUPLING_RE.search(deps_str):
             warnings.append(
                 "🚩 Tight Coupling: Avoid importing internal/private modules from other layers"
             )
@@ -337,23 +594,114 @@ class DesignValidator:
             "flags": found_flags,
         }
 
-    def _generate_token(self, token_data: Dict[str, Any]) -> str:
-        """Generate a validation token."""
-        # Create a hash of the token data
-        token_str = json.dumps(token_data, sort_keys=True)
-        token_hash = hashlib.sha256(token_str.encode()).hexdigest()[:16]
-        return f"valid-{token_data['proposal_id']}-{token_hash}"
+    def _generate_token(self, proposal_id: str, tool_name: str, timestamp: str) -> str:
+        """
+        Generate a validation token.
+
+        Token format: valid2-{proposal_id}-{hash}, where hash is a 16-hex-char
+        BLAKE2b digest of the three fields joined by the ASCII unit separator
+        (\x1f), which can't collide with characters in tool names.
+        """
+        canon = f"{proposal_id}\x1f{tool_name}\x1f{timestamp}"
+        token_hash = hashlib.blake2b(canon.encode("utf-8"), digest_size=8).hexdigest()
+        return f"{_TOKEN_PREFIX}-{proposal_id}-{token_hash}"
+
+    def _generate_legacy_token(
+        self, proposal_id: str, tool_name: str, timestamp: str
+    ) -> str:
+        """
+        Generate the token older releases issued for a proposal.
+
+        The original format: "valid-" plus the first 16 hex chars of a
+        SHA-256 over the sorted-key JSON of the token fields.
+        """
+        token_str = json.dumps(
+            {
+                "proposal_id": proposal_id,
+                "tool_name": tool_name,
+                "timestamp": timestamp,
+            },
+            sort_keys=True,
+        ).encode()
+        return f"valid-{proposal_id}-{hashlib.sha256(token_str).hexdigest()[:16]}"
+
+    def _cache_token(
+        self, proposal_id: str, tool_name: str, timestamp: str, filepath: Path
+    ) -> Tuple[str, Path]:
+        """Record the token that is valid for a saved proposal."""
+        entry = (self._generate_token(proposal_id, tool_name, timestamp), filepath)
+        self._token_cache[proposal_id] = entry
+        self._proposal_id_to_path[proposal_id] = filepath
+        return entry
+
+    def _forget_proposal(self, proposal_id: str) -> None:
+        """Drop a proposal's cached token and path (its file is gone or unsaved)."""
+        self._token_cache.pop(proposal_id, None)
+        self._proposal_id_to_path.pop(proposal_id, None)
 
     def _save_proposal(self, proposal_id: str, proposal_data: Dict[str, Any]) -> Path:
         """Save an approved proposal to disk."""
         filename = f"{proposal_id}_{proposal_data['tool_name']}.json"
         filepath = self.proposals_dir / filename
 
-        with open(filepath, "w") as f:
-            json.dump(proposal_data, f, indent=2, default=str)
+        # Serialize now - callers may mutate the results dict after we
+        # return (e.g. adding a "message") - but leave the disk I/O to the
+        # background writer so it stays off the request path.
+        if orjson is not None:
+            payload = orjson.dumps(
+                proposal_data, option=orjson.OPT_INDENT_2, default=str
+            )
+        else:
+            payload = json.dumps(proposal_data, indent=2, default=str).encode()
 
+        index_line = self._encode_index_line(
+            self._proposal_summary(proposal_data, filepath)
+        )
+        with _writes_done:
+            _pending_writes.add(filepath)
+        _writer_queue().put(
+            (
+                filepath,
+                payload,
+                self.proposals_dir,
+                index_line,
+                functools.partial(self._forget_proposal, proposal_id),
+            )
+        )
+
+        self._cache_token(
+            proposal_id,
+            proposal_data["tool_name"],
+            proposal_data["validation_results"]["timestamp"],
+            filepath,
+        )
         return filepath
 
+    @staticmethod
+    def _proposal_summary(
+        data: Dict[str, Any], filepath: Union[str, Path]
+    ) -> Dict[str, Any]:
+        """Extract the fields list_proposals reports for one proposal."""
+        return {
+            "proposal_id": data["validation_results"]["proposal_id"],
+            "tool_name": data["tool_name"],
+            "layer": data["layer"],
+            "timestamp": data["validation_results"]["timestamp"],
+            "filepath": str(filepath),
+        }
+
+    @staticmethod
+    def _encode_index_line(summary: Dict[str, Any]) -> bytes:
+        """Encode one summary record as a compact JSON line."""
+        if orjson is not None:
+            return orjson.dumps(summary) + b"\n"
+        return (json.dumps(summary, separators=(",", ":")) + "\n").encode()
+
+    def _append_index(self, summary: Dict[str, Any]) -> None:
+        """Append one summary record to the proposals index."""
+        with open(self.proposals_dir / "index.jsonl", "ab") as f:
+            f.write(self._encode_index_line(summary))
+
     def verify_token(self, token: str) -> Dict[str, Any]:
         """
         Verify a validation token.
@@ -372,7 +720,7 @@ class DesignValidator:
         """
         # Extract proposal ID from token
         parts = token.split("-")
-        if len(parts) < 3 or parts[0] != "valid":
+        if len(parts) < 3 or parts[0] not in (_TOKEN_PREFIX, "valid"):
             return {
                 "valid": False,
                 "message": "❌ Invalid token format",
@@ -380,28 +728,78 @@ class DesignValidator:
 
         proposal_id = parts[1]
 
-        # Find the proposal file
-        proposal_files = list(self.proposals_dir.glob(f"{proposal_id}_*.json"))
-        if not proposal_files:
+        # STEP 1: Look up expected token (cache first, then disk)
+        entry = self._token_cache.get(proposal_id)
+        if entry is None:
+            proposal_path = self._proposal_id_to_path.get(proposal_id)
+            if proposal_path is None:
+                # Possibly saved by another process since we started
+                proposal_files = self._proposal_entries(f"{proposal_id}_")
+                if not proposal_files:
+                    return {
+                        "valid": False,
+                        "proposal_id": proposal_id,
+                        "message": f"❌ No proposal found for ID: {proposal_id}",
+                    }
+                proposal_path = Path(proposal_files[0].path)
+
+            try:
+                proposal_data = _load_proposal(proposal_path)
+            except FileNotFoundError:
+                self._proposal_id_to_path.pop(proposal_id, None)
+                return {
+                    "valid": False,
+                    "proposal_id": proposal_id,
+                    "message": f"❌ No proposal found for ID: {proposal_id}",
+                }
+            entry = self._cache_token(
+                proposal_id,
+                proposal_data["tool_name"],
+                proposal_data["validation_results"]["timestamp"],
+                proposal_path,
+            )
+
+        # STEP 2: Constant-time compare against the expected token
+        expected_token, proposal_path = entry
+        token_bytes = token.encode()
+        matched = hmac.compare_digest(token_bytes, expected_token.encode())
+
+        # A mismatched current-format token is rejected without disk access
+        if not matched and parts[0] == _TOKEN_PREFIX:
             return {
                 "valid": False,
                 "proposal_id": proposal_id,
-                "message": f"❌ No proposal found for ID: {proposal_id}",
+                "message": "❌ Token verification failed (tampered or expired)",
             }
 
-        # Load and verify
-        with open(proposal_files[0], "r") as f:
-            proposal_data = json.load(f)
+        # STEP 3: Load the proposal for the caller - once its queued write
+        # (if any) has finished; only this proposal's write is waited for
+        if not _wait_for_write(proposal_path):
+            return {
+                "valid": False,
+                "proposal_id": proposal_id,
+                "message": f"❌ Proposal {proposal_id} could not be saved",
+            }
+        try:
+            proposal_data = _load_proposal(proposal_path)
+        except FileNotFoundError:
+            self._forget_proposal(proposal_id)
+            return {
+                "valid": False,
+                "proposal_id": proposal_id,
+                "message": f"❌ No proposal found for ID: {proposal_id}",
+            }
 
-        # Regenerate token to verify
-        token_data = {
-            "proposal_id": proposal_id,
-            "tool_name": proposal_data["tool_name"],
-            "timestamp": proposal_data["validation_results"]["timestamp"],
-        }
-        expected_token = self._generate_token(token_data)
+        # Tokens issued in the older "valid-" format are still honoured
+        if not matched:
+            legacy = self._generate_legacy_token(
+                proposal_id,
+                proposal_data["tool_name"],
+                proposal_data["validation_results"]["timestamp"],
+            )
+            matched = hmac.compare_digest(token_bytes, legacy.encode())
 
-        if token != expected_token:
+        if not matched:
             return {
                 "valid": False,
                 "proposal_id": proposal_id,
@@ -411,30 +809,151 @@ class DesignValidator:
         return {
             "valid": True,
             "proposal_id": proposal_id,
-            "proposal_data": proposal_data,
+            # A copy, so callers can't corrupt the shared LRU-cached dict
+            "proposal_data": copy.deepcopy(proposal_data),
             "message": "✅ Token is valid",
         }
 
     def list_proposals(self) -> List[Dict[str, Any]]:
-        """List all validated proposals."""
+        """
+        List all validated proposals.
+
+        Reads the append-only index.jsonl written by _save_proposal. If the
+        index is missing (proposals saved before it existed), it is rebuilt
+        once from the proposal files. Being append-only, the index can hold
+        repeated IDs (the last line wins) and files since deleted (skipped).
+        """
+        index_path = self.proposals_dir / "index.jsonl"
+        flush_pending_writes()
+
+        try:
+            with open(index_path, "rb") as f:
+                raw = f.read()
+        except FileNotFoundError:
+            return self._rebuild_index()
+
+        loads = orjson.loads if orjson is not None else json.loads
+        by_id: Dict[str, Dict[str, Any]] = {}
+        for line in raw.splitlines():
+            if line.strip():
+                summary = loads(line)
+                by_id[summary["proposal_id"]] = summary
+
+        on_disk = {entry.name for entry in self._proposal_entries()}
+        proposals = [p for p in by_id.values() if Path(p["filepath"]).name in on_disk]
+        proposals.sort(key=lambda p: p["filepath"])
+        return proposals
+
+    def _rebuild_index(self) -> List[Dict[str, Any]]:
+        """Build index.jsonl by reading every proposal file (one-time cost)."""
         proposals = []
 
-        for filepath in sorted(self.proposals_dir.glob("*.json")):
-            with open(filepath, "r") as f:
-                data = json.load(f)
-                proposals.append(
-                    {
-                        "proposal_id": data["validation_results"]["proposal_id"],
-                        "tool_name": data["tool_name"],
-                        "layer": data["layer"],
-                        "timestamp": data["validation_results"]["timestamp"],
-                        "filepath": str(filepath),
-                    }
-                )
+        for entry in self._proposal_entries():
+            data = _load_proposal(entry.path)
+            proposals.append(self._proposal_summary(data, entry.path))
+
+        for summary in proposals:
+            self._append_index(summary)
 
         return proposals
 
 
+# =============================================================================
+# BACKGROUND PROPOSAL WRITER
+# =============================================================================
+# Proposal files are written by a single daemon thread so that
+# propose_tool_design doesn't wait on disk. verify_token waits for its own
+# proposal's write only, list_proposals calls flush_pending_writes() first,
+# and an atexit hook drains the queue before the process exits.
+
+# (file, payload, proposals dir, index line, called if the write fails)
+_WriteJob = Tuple[Path, bytes, Path, bytes, Callable[[], None]]
+
+_write_queue: Optional["queue.Queue[_WriteJob]"] = None
+_write_queue_lock = threading.Lock()
+
+# Proposal files still queued, and those whose write failed
+_pending_writes: Set[Path] = set()
+_failed_writes: Set[Path] = set()
+_writes_done = threading.Condition()
+
+
+def _writer_loop(q: "queue.Queue[_WriteJob]") -> None:
+    """Write queued proposals (file first, then its index line) forever."""
+    while True:
+        filepath, payload, proposals_dir, index_line, on_failure = q.get()
+        failed = False
+        try:
+            with open(filepath, "wb") as f:
+                f.write(payload)
+            with open(proposals_dir / "index.jsonl", "ab") as f:
+                f.write(index_line)
+        except OSError as e:
+            # stdout carries the MCP protocol - report on stderr only
+            print(f"❌ Failed to save proposal {filepath}: {e}", file=sys.stderr)
+            failed = True
+            # The token issued for it can never verify - stop honouring it
+            on_failure()
+        finally:
+            with _writes_done:
+                _pending_writes.discard(filepath)
+                if failed:
+                    _failed_writes.add(filepath)
+                _writes_done.notify_all()
+            q.task_done()
+
+
+def _wait_for_write(filepath: Path) -> bool:
+    """Wait until filepath is no longer queued; False if its write failed."""
+    with _writes_done:
+        _writes_done.wait_for(lambda: filepath not in _pending_writes)
+        return filepath not in _failed_writes
+
+
+def _writer_queue() -> "queue.Queue[_WriteJob]":
+    """Return the write queue, starting the writer thread on first use."""
+    global _write_queue
+    if _write_queue is None:
+        with _write_queue_lock:
+            if _write_queue is None:
+                q: "queue.Queue[_WriteJob]" = queue.Queue()
+                threading.Thread(
+                    target=_writer_loop,
+                    args=(q,),
+                    name="proposal-writer",
+                    daemon=True,
+                ).start()
+                atexit.register(q.join)
+                _write_queue = q
+    return _write_queue
+
+
+def flush_pending_writes() -> None:
+    """Block until every queued proposal has been written to disk."""
+    if _write_queue is not None:
+        _write_queue.join()
+
+
+# Lazily-constructed shared validator (FastMCP may dispatch tools concurrently)
+_default_validator: Optional[DesignValidator] = None
+_default_validator_lock = threading.Lock()
+
+
+def get_default_validator() -> DesignValidator:
+    """
+    Return the process-wide DesignValidator, constructing it on first use.
+
+    Avoids re-loading the checklist and re-creating the proposals directory
+    on every tool call.
+    """
+    global _default_validator
+    if _default_validator is None:
+        with _default_validator_lock:
+            if _default_validator is None:
+                _default_validator = DesignValidator()
+    return _default_validator
+
+
 # Convenience function for quick validation
 def validate_tool(
     tool_name: str,
@@ -449,8 +968,7 @@ def validate_tool(
 
     This is the main entry point for validation.
     """
-    validator = DesignValidator()
-    return validator.validate_tool_proposal(
+    return get_default_validator().validate_tool_proposal(
         tool_name=tool_name,
         purpose=purpose,
         layer=layer,
@@ -25,11 +25,16 @@ VERSION: 2.0.0 (Layer Architecture)
 # IMPORTS
 # =============================================================================
 
+import asyncio
+import functools
 import importlib
-import json
 from pathlib import Path
+from types import MappingProxyType
 
-import yaml
+# Startup cost: `python -X importtime -c 'import platform_mcp'` puts ~80% of
+# import time in the mcp SDK itself. The layer modules import the stdlib and
+# small optional extras (orjson) only; heavier packages (yaml) are imported
+# inside the functions that need them - keep new dependencies that way too.
 from mcp.server.fastmcp import FastMCP
 
 # Import layer modules
@@ -41,20 +46,44 @@ from src.layers import personal, platform
 # =============================================================================
 
 
+def _freeze(value):
+    """Recursively convert dicts to read-only mappings and lists to tuples."""
+    if isinstance(value, dict):
+        return MappingProxyType({k: _freeze(v) for k, v in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+@functools.cache
 def load_team_config():
-    """Load team configuration from team-config.yaml"""
+    """
+    Load team configuration from team-config.yaml
+
+    Parsed once per process and returned deep-frozen (nested dicts are
+    read-only mappings, lists are tuples) - the cached object is shared, and
+    the config selects which team layer module gets imported, so it can't
+    meaningfully change while the server is running.
+    """
     config_path = Path(__file__).parent / "team-config.yaml"
 
     if not config_path.exists():
         # Default config if file doesn't exist
-        return {
-            "team_name": "platform-integrations",
-            "team_layer_module": "src.layers.team",
-            "team_description": "Platform Integrations - Connects Wise to payment schemes and 3rd parties",
-        }
-
+        return _freeze(
+            {
+                "team_name": "platform-integrations",
+                "team_layer_module": "src.layers.team",
+                "team_description": "Platform Integrations - Connects Wise to payment schemes and 3rd parties",
+            }
+        )
+
+    # Deferred import: only needed when a team-config.yaml exists.
+    # CSafeLoader exists only when PyYAML was built with libyaml.
+    import yaml
+
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
     with open(config_path) as f:
-        return yaml.safe_load(f)
+        return _freeze(yaml.load(f, Loader=loader) or {})
 
 
 # Load config and dynamically import team layer
@@ -75,56 +104,63 @@ mcp = FastMCP("platform-tools")
 # =============================================================================
 # These tools work for ANYONE in the organization.
 # No team-specific assumptions.
+#
+# The handlers are async and run the (blocking) layer functions in a worker
+# thread via asyncio.to_thread. FastMCP runs sync handlers on the event loop
+# thread itself, so a slow tsh/kubectl call would otherwise stall every other
+# request; this way concurrent tool calls overlap their subprocess waits.
 
 
 @mcp.tool()
-def check_tsh_installed():
+async def check_tsh_installed():
     """Check if Teleport CLI (tsh) is installed and accessible."""
-    return platform.check_tsh_installed()
+    return await asyncio.to_thread(platform.check_tsh_installed)
 
 
 @mcp.tool()
-def get_tsh_client_version():
+async def get_tsh_client_version():
     """Get the installed Teleport CLI (tsh) client version."""
-    return platform.get_tsh_client_version()
+    return await asyncio.to_thread(platform.get_tsh_client_version)
 
 
 @mcp.tool()
-def get_teleport_proxy_version(cluster: str):
+async def get_teleport_proxy_version(cluster: str):
     """Get the Teleport proxy (server) version for a specific cluster."""
-    return platform.get_teleport_proxy_version(cluster)
+    return await asyncio.to_thread(platform.get_teleport_proxy_version, cluster)
 
 
 @mcp.tool()
-def verify_teleport_compatibility():
+async def verify_teleport_compatibility():
     """Complete pre-flight check: Verify tsh installation and compatibility."""
-    return platform.verify_teleport_compatibility()
+    return await asyncio.to_thread(platform.verify_teleport_compatibility)
 
 
 @mcp.tool()
-def list_teleport_nodes(cluster: str, filter: str = None):
+async def list_teleport_nodes(cluster: str, filter: str = None):
     """List available SSH nodes in a Teleport cluster."""
-    return platform.list_teleport_nodes(cluster, filter)
+    return await asyncio.to_thread(platform.list_teleport_nodes, cluster, filter)
 
 
 @mcp.tool()
-def verify_ssh_access(cluster: str, node: str, user: str = "root"):
+async def verify_ssh_access(cluster: str, node: str, user: str = "root"):
     """Verify you can SSH to a specific node via Teleport."""
-    return platform.verify_ssh_access(cluster, node, user)
+    return await asyncio.to_thread(platform.verify_ssh_access, cluster, node, user)
 
 
 @mcp.tool()
-def run_remote_command(
+async def run_remote_command(
     cluster: str, node: str, command: str, user: str = "root", timeout: int = 30
 ):
     """Execute a command on a remote node via Teleport SSH."""
-    return platform.run_remote_command(cluster, node, command, user, timeout)
+    return await asyncio.to_thread(
+        platform.run_remote_command, cluster, node, command, user, timeout
+    )
 
 
 @mcp.tool()
-def list_kube_contexts():
+async def list_kube_contexts():
     """List all available Kubernetes contexts from your kubeconfig."""
-    return platform.list_kube_contexts()
+    return await asyncio.to_thread(platform.list_kube_contexts)
 
 
 # =============================================================================
@@ -132,66 +168,114 @@ def list_kube_contexts():
 # =============================================================================
 # These tools implement YOUR team's specific infrastructure patterns.
 # Other teams might fork and replace this layer with their own.
+#
+# Every team tool shells out over tsh ssh, so like the platform tools above
+# they are async and run the layer function via asyncio.to_thread.
 
 
 @mcp.tool()
-def list_flux_kustomizations(cluster: str, node: str, show_suspend: bool = False):
+async def list_flux_kustomizations(cluster: str, node: str, show_suspend: bool = False):
     """List Flux Kustomizations on a Kubernetes node."""
-    return team.list_flux_kustomizations(cluster, node, show_suspend)
+    return await asyncio.to_thread(
+        team.list_flux_kustomizations, cluster, node, show_suspend
+    )
 
 
 @mcp.tool()
-def get_kustomization_details(
+async def list_flux_kustomizations_batch(
+    cluster: str, nodes: list, show_suspend: bool = False
+):
+    """List Flux Kustomizations on several nodes concurrently."""
+    return await asyncio.to_thread(
+        team.list_flux_kustomizations_batch, cluster, nodes, show_suspend
+    )
+
+
+@mcp.tool()
+async def get_kustomization_details(
     cluster: str, node: str, name: str, namespace: str = "flux-system"
 ):
     """Get detailed information about a specific Flux Kustomization."""
-    return team.get_kustomization_details(cluster, node, name, namespace)
+    return await asyncio.to_thread(
+        team.get_kustomization_details, cluster, node, name, namespace
+    )
 
 
 @mcp.tool()
-def reconcile_flux_kustomization(
-    cluster: str, node: str, name: str, namespace: str = "flux-system"
+async def reconcile_flux_kustomization(
+    cluster: str,
+    node: str,
+    name: str,
+    namespace: str = "flux-system",
+    wait: bool = False,
 ):
-    """Trigger a Flux reconciliation for a specific Kustomization."""
-    return team.reconcile_flux_kustomization(cluster, node, name, namespace)
+    """Trigger a Flux reconciliation (wait=True blocks until it completes)."""
+    return await asyncio.to_thread(
+        team.reconcile_flux_kustomization, cluster, node, name, namespace, wait
+    )
 
 
 @mcp.tool()
-def list_flux_sources(cluster: str, node: str):
+async def list_flux_sources(cluster: str, node: str):
     """List all Flux GitRepository sources."""
-    return team.list_flux_sources(cluster, node)
+    return await asyncio.to_thread(team.list_flux_sources, cluster, node)
 
 
 @mcp.tool()
-def suspend_flux_kustomization(
+async def list_flux_sources_multi(targets: list):
+    """List Flux GitRepository sources on several cluster/node pairs concurrently."""
+    return await asyncio.to_thread(team.list_flux_sources_multi, targets)
+
+
+@mcp.tool()
+async def get_flux_overview(cluster: str, node: str):
+    """Get all Flux Kustomizations and GitRepository sources in one call."""
+    return await asyncio.to_thread(team.get_flux_overview, cluster, node)
+
+
+@mcp.tool()
+async def suspend_flux_kustomization(
     cluster: str, node: str, name: str, namespace: str = "flux-system"
 ):
     """Suspend a Flux Kustomization (pause reconciliation)."""
-    return team.suspend_flux_kustomization(cluster, node, name, namespace)
+    return await asyncio.to_thread(
+        team.suspend_flux_kustomization, cluster, node, name, namespace
+    )
 
 
 @mcp.tool()
-def resume_flux_kustomization(
+async def resume_flux_kustomization(
     cluster: str, node: str, name: str, namespace: str = "flux-system"
 ):
     """Resume a suspended Flux Kustomization."""
-    return team.resume_flux_kustomization(cluster, node, name, namespace)
+    return await asyncio.to_thread(
+        team.resume_flux_kustomization, cluster, node, name, namespace
+    )
 
 
 @mcp.tool()
-def get_flux_logs(
-    cluster: str, node: str, component: str = "kustomize-controller", tail: int = 50
+async def get_flux_logs(
+    cluster: str,
+    node: str,
+    component: str = "kustomize-controller",
+    tail: int = 50,
+    since: str = None,
+    max_bytes: int = team.FLUX_LOGS_DEFAULT_BYTES,
 ):
-    """Get logs from a Flux component."""
-    return team.get_flux_logs(cluster, node, component, tail)
+    """Get logs from a Flux component (optionally only the last `since`, e.g. "5m")."""
+    return await asyncio.to_thread(
+        team.get_flux_logs, cluster, node, component, tail, since, max_bytes
+    )
 
 
 @mcp.tool()
-def get_kustomization_events(
+async def get_kustomization_events(
     cluster: str, node: str, name: str, namespace: str = "flux-system"
 ):
     """Get Kubernetes events for a specific Kustomization."""
-    return team.get_kustomization_events(cluster, node, name, namespace)
+    return await asyncio.to_thread(
+        team.get_kustomization_events, cluster, node, name, namespace
+    )
 
 
 # =============================================================================
@@ -199,10 +283,13 @@ def get_kustomization_events(
 # =============================================================================
 # These tools support individual developer workflows.
 # Highly personalized to your specific setup.
+#
+# Tools that touch the filesystem (proposals, generated tools, session notes)
+# go through asyncio.to_thread; pure in-memory ones stay plain functions.
 
 
 @mcp.tool()
-def propose_tool_design(
+async def propose_tool_design(
     tool_name: str,
     purpose: str,
     layer: str,
@@ -211,7 +298,8 @@ def propose_tool_design(
     implementation_approach: str = "",
 ):
     """Propose a new tool design and validate it against the design checklist."""
-    return personal.propose_tool_design(
+    return await asyncio.to_thread(
+        personal.propose_tool_design,
         tool_name,
         purpose,
         layer,
@@ -222,29 +310,31 @@ def propose_tool_design(
 
 
 @mcp.tool()
-def verify_tool_design_token(token: str):
+async def verify_tool_design_token(token: str):
     """Verify a tool design validation token."""
-    return personal.verify_tool_design_token(token)
+    return await asyncio.to_thread(personal.verify_tool_design_token, token)
 
 
 @mcp.tool()
-def list_tool_proposals():
+async def list_tool_proposals():
     """List all validated tool proposals."""
-    return personal.list_tool_proposals()
+    return await asyncio.to_thread(personal.list_tool_proposals)
 
 
 @mcp.tool()
-def create_mcp_tool(
+async def create_mcp_tool(
     tool_name: str, tool_code: str, validation_token: str, description: str = ""
 ):
     """Create a new MCP tool with ENFORCED design validation."""
-    return personal.create_mcp_tool(tool_name, tool_code, validation_token, description)
+    return await asyncio.to_thread(
+        personal.create_mcp_tool, tool_name, tool_code, validation_token, description
+    )
 
 
 @mcp.tool()
-def list_meta_workflows():
+async def list_meta_workflows():
     """Get available meta-workflows for platform operations."""
-    return personal.list_meta_workflows()
+    return await asyncio.to_thread(personal.list_meta_workflows)
 
 
 @mcp.tool()
@@ -260,23 +350,25 @@ def make_roadmap_decision(tasks: list, analysis_token: str, rationale: str = "")
 
 
 @mcp.tool()
-def create_session_note(
+async def create_session_note(
     content: str, section: str = "Progress", session_name: str = None
 ):
     """Create or append to current session ephemeral note."""
-    return personal.create_session_note(content, section, session_name)
+    return await asyncio.to_thread(
+        personal.create_session_note, content, section, session_name
+    )
 
 
 @mcp.tool()
-def read_session_notes(session_name: str = None, days_back: int = 7):
+async def read_session_notes(session_name: str = None, days_back: int = 7):
     """Read recent session notes from ephemeral directory."""
-    return personal.read_session_notes(session_name, days_back)
+    return await asyncio.to_thread(personal.read_session_notes, session_name, days_back)
 
 
 @mcp.tool()
-def list_session_files(days_back: int = 30):
+async def list_session_files(days_back: int = 30):
     """List all session files in ephemeral directory with metadata."""
-    return personal.list_session_files(days_back)
+    return await asyncio.to_thread(personal.list_session_files, days_back)
 
 
 @mcp.tool()
@@ -312,7 +404,9 @@ mcp.resource("workflow://patterns/session-documentation")(
     personal.get_session_documentation_pattern
 )
 mcp.resource("workflow://architecture/layer-model")(personal.get_layer_model_resource)
-mcp.resource("workflow://rules/design-checklist")(personal.get_design_checklist_resource)
+mcp.resource("workflow://rules/design-checklist")(
+    personal.get_design_checklist_resource
+)
 
 mcp.resource("workflow://team/pi/operating-rules")(team.get_pi_team_rules_resource)
 
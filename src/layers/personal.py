@@ -6,17 +6,93 @@ This module contains personal-layer tools as defined in the 3-layer architecture
 Layer: personal
 """
 
-import json
 import os
 import re
-import shlex
-import subprocess
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
-from design_validation import DesignValidator
-from workflow_state import get_workflow_state
+from design_validation import get_default_validator
+
+from . import platform
+
+# =============================================================================
+# RESOURCE PATHS
+# =============================================================================
+# Resolved once at import. This module lives in src/layers/, while the
+# shared docs and resources/ tree live at the repository root.
+
+_LAYER_DIR = Path(__file__).resolve().parent
+_REPO_ROOT = _LAYER_DIR.parent.parent
+
+_META_WORKFLOWS_PATH = str(_REPO_ROOT / "META-WORKFLOWS.md")
+_STATE_MGMT_PATH = str(_REPO_ROOT / "resources/patterns/state-management.yaml")
+_SESSION_DOC_PATH = str(_REPO_ROOT / "resources/patterns/session-documentation.yaml")
+_LAYER_MODEL_PATH = str(_REPO_ROOT / "resources/architecture/layer-model.yaml")
+_DESIGN_CHECKLIST_PATH = str(_REPO_ROOT / "resources/rules/design-checklist.yaml")
+_PERSONAL_RULES_PATH = str(_LAYER_DIR / "resources/personal_rules.md")
+
+# Target file for create_mcp_tool and the session notes directory. Both stay
+# next to this module, where they were resolved before these were hoisted.
+_SERVER_FILE = _LAYER_DIR / "platform_mcp.py"
+_SESSIONS_DIR = _LAYER_DIR / ".ephemeral" / "sessions"
+
+# =============================================================================
+# FILE CACHES
+# =============================================================================
+# Resource files and META-WORKFLOWS.md change rarely, so they are cached in
+# memory and re-read only when their mtime changes. A warm call costs one
+# os.stat instead of a full read (and, for workflows, a regex parse).
+
+# One row of the META-WORKFLOWS.md registry table
+# Format: | MW-001 | Thread Ending Summary | "This thread is ending" | Active | 2024-11-02 |
+_WORKFLOW_ROW_RE = re.compile(
+    r'\|\s*(MW-\d+)\s*\|\s*([^|]+)\|\s*"([^"]+)"\s*\|\s*(\w+)\s*\|'
+)
+
+# Parsed registry rows of META-WORKFLOWS.md (raw file text is cached by
+# platform.read_text_cached)
+_WORKFLOWS_CACHE: Dict[str, Any] = {"path": None, "mtime": 0, "parsed": None}
+
+
+def _load_meta_workflows(workflows_path: str) -> List[Dict[str, str]]:
+    """
+    Return the parsed registry rows of META-WORKFLOWS.md, cached by mtime.
+
+    The file is streamed line by line and only table rows mentioning "MW-"
+    reach the regex, so the prose never gets scanned or held in memory.
+
+    Raises FileNotFoundError (or other OSError) like open() would.
+    """
+    mtime = os.stat(workflows_path).st_mtime_ns
+    if (
+        _WORKFLOWS_CACHE["path"] == workflows_path
+        and _WORKFLOWS_CACHE["mtime"] == mtime
+    ):
+        return _WORKFLOWS_CACHE["parsed"]
+
+    workflows = []
+    with open(workflows_path, "r") as f:
+        for line in f:
+            # Cheap pre-filter: registry rows look like "| MW-001 | ..."
+            if "MW-" not in line or not line.lstrip().startswith("|"):
+                continue
+            match = _WORKFLOW_ROW_RE.search(line)
+            if match is None:
+                continue
+            workflows.append(
+                {
+                    "id": match.group(1).strip(),
+                    "name": match.group(2).strip(),
+                    "trigger": match.group(3).strip(),
+                    "status": match.group(4).strip().lower(),
+                }
+            )
+
+    _WORKFLOWS_CACHE.update(
+        {"path": workflows_path, "mtime": mtime, "parsed": workflows}
+    )
+    return workflows
 
 
 def propose_tool_design(
@@ -88,7 +164,7 @@ def propose_tool_design(
     enforces the design checklist that was previously only documentation.
     """
     try:
-        validator = DesignValidator()
+        validator = get_default_validator()
         result = validator.validate_tool_proposal(
             tool_name=tool_name,
             purpose=purpose,
@@ -159,7 +235,7 @@ def verify_tool_design_token(token: str) -> Dict[str, Any]:
     - Tokens are tied to specific proposal IDs
     """
     try:
-        validator = DesignValidator()
+        validator = get_default_validator()
         result = validator.verify_token(token)
         return result
     except Exception as e:
@@ -191,7 +267,7 @@ def list_tool_proposals() -> Dict[str, Any]:
     - Shows audit trail for accountability
     """
     try:
-        validator = DesignValidator()
+        validator = get_default_validator()
         proposals = validator.list_proposals()
 
         return {
@@ -251,7 +327,7 @@ def create_mcp_tool(
     """
     try:
         # Verify the validation token
-        validator = DesignValidator()
+        validator = get_default_validator()
         token_result = validator.verify_token(validation_token)
 
         if not token_result["valid"]:
@@ -295,8 +371,7 @@ def create_mcp_tool(
             }
 
         # Find the right place to insert the tool
-        script_dir = Path(__file__).parent
-        server_file = script_dir / "platform_mcp.py"
+        server_file = _SERVER_FILE
 
         with open(server_file, "r") as f:
             current_content = f.read()
@@ -505,12 +580,12 @@ def list_meta_workflows() -> Dict[str, Any]:
     - Workflows provide step-by-step guidance with validation
     """
 
-    # Find META-WORKFLOWS.md relative to this script
-    script_dir = os.path.dirname(os.path.abspath(__file__))
-    workflows_path = os.path.join(script_dir, "META-WORKFLOWS.md")
+    workflows_path = _META_WORKFLOWS_PATH
 
-    # Check if file exists
-    if not os.path.exists(workflows_path):
+    # Read and parse the file (cached until META-WORKFLOWS.md changes)
+    try:
+        parsed = _load_meta_workflows(workflows_path)
+    except FileNotFoundError:
         return {
             "available": False,
             "count": 0,
@@ -523,11 +598,6 @@ def list_meta_workflows() -> Dict[str, Any]:
                 "Check if platform-mcp-server repository is complete",
             ],
         }
-
-    # Read the file
-    try:
-        with open(workflows_path, "r") as f:
-            content = f.read()
     except Exception as e:
         return {
             "available": False,
@@ -537,25 +607,8 @@ def list_meta_workflows() -> Dict[str, Any]:
             "full_doc_path": workflows_path,
         }
 
-    # Parse workflow registry from the content
-    # Look for the Active Workflows table
-    workflows = []
-
-    # Simple regex to extract workflow info from the markdown table
-    # Format: | MW-001 | Thread Ending Summary | "This thread is ending" | Active | 2024-11-02 |
-    import re
-
-    table_pattern = r'\|\s*(MW-\d+)\s*\|\s*([^|]+)\|\s*"([^"]+)"\s*\|\s*(\w+)\s*\|'
-
-    for match in re.finditer(table_pattern, content):
-        workflow_id = match.group(1).strip()
-        name = match.group(2).strip()
-        trigger = match.group(3).strip()
-        status = match.group(4).strip().lower()
-
-        workflows.append(
-            {"id": workflow_id, "name": name, "trigger": trigger, "status": status}
-        )
+    # Copy so callers can't mutate the cached rows
+    workflows = [dict(w) for w in parsed]
 
     # Count active vs draft
     active_count = sum(1 for w in workflows if w["status"] == "active")
@@ -602,18 +655,13 @@ def get_meta_workflows_resource() -> str:
     - No user input accepted
     """
 
-    # Find META-WORKFLOWS.md relative to this script
-    script_dir = os.path.dirname(os.path.abspath(__file__))
-    workflows_path = os.path.join(script_dir, "META-WORKFLOWS.md")
-
-    # Check if file exists
-    if not os.path.exists(workflows_path):
-        return "❌ META-WORKFLOWS.md not found at: " + workflows_path
+    workflows_path = _META_WORKFLOWS_PATH
 
-    # Read and return content
+    # Read and return content (cached until the file changes)
     try:
-        with open(workflows_path, "r") as f:
-            return f.read()
+        return platform.read_text_cached(workflows_path)
+    except FileNotFoundError:
+        return "❌ META-WORKFLOWS.md not found at: " + workflows_path
     except Exception as e:
         return f"❌ Error reading META-WORKFLOWS.md: {str(e)}"
 
@@ -636,15 +684,12 @@ def get_state_management_pattern() -> str:
     - No user input accepted
     """
 
-    script_dir = os.path.dirname(os.path.abspath(__file__))
-    pattern_path = os.path.join(script_dir, "resources/patterns/state-management.yaml")
-
-    if not os.path.exists(pattern_path):
-        return "❌ state-management.yaml not found at: " + pattern_path
+    pattern_path = _STATE_MGMT_PATH
 
     try:
-        with open(pattern_path, "r") as f:
-            return f.read()
+        return platform.read_text_cached(pattern_path)
+    except FileNotFoundError:
+        return "❌ state-management.yaml not found at: " + pattern_path
     except Exception as e:
         return f"❌ Error reading state-management.yaml: {str(e)}"
 
@@ -667,17 +712,12 @@ def get_session_documentation_pattern() -> str:
     - No user input accepted
     """
 
-    script_dir = os.path.dirname(os.path.abspath(__file__))
-    pattern_path = os.path.join(
-        script_dir, "resources/patterns/session-documentation.yaml"
-    )
-
-    if not os.path.exists(pattern_path):
-        return "❌ session-documentation.yaml not found at: " + pattern_path
+    pattern_path = _SESSION_DOC_PATH
 
     try:
-        with open(pattern_path, "r") as f:
-            return f.read()
+        return platform.read_text_cached(pattern_path)
+    except FileNotFoundError:
+        return "❌ session-documentation.yaml not found at: " + pattern_path
     except Exception as e:
         return f"❌ Error reading session-documentation.yaml: {str(e)}"
 
@@ -700,15 +740,12 @@ def get_layer_model_resource() -> str:
     - No user input accepted
     """
 
-    script_dir = os.path.dirname(os.path.abspath(__file__))
-    model_path = os.path.join(script_dir, "resources/architecture/layer-model.yaml")
-
-    if not os.path.exists(model_path):
-        return "❌ layer-model.yaml not found at: " + model_path
+    model_path = _LAYER_MODEL_PATH
 
     try:
-        with open(model_path, "r") as f:
-            return f.read()
+        return platform.read_text_cached(model_path)
+    except FileNotFoundError:
+        return "❌ layer-model.yaml not found at: " + model_path
     except Exception as e:
         return f"❌ Error reading layer-model.yaml: {str(e)}"
 
@@ -731,15 +768,12 @@ def get_design_checklist_resource() -> str:
     - No user input accepted
     """
 
-    script_dir = os.path.dirname(os.path.abspath(__file__))
-    checklist_path = os.path.join(script_dir, "resources/rules/design-checklist.yaml")
-
-    if not os.path.exists(checklist_path):
-        return "❌ design-checklist.yaml not found at: " + checklist_path
+    checklist_path = _DESIGN_CHECKLIST_PATH
 
     try:
-        with open(checklist_path, "r") as f:
-            return f.read()
+        return platform.read_text_cached(checklist_path)
+    except FileNotFoundError:
+        return "❌ design-checklist.yaml not found at: " + checklist_path
     except Exception as e:
         return f"❌ Error reading design-checklist.yaml: {str(e)}"
 
@@ -754,15 +788,12 @@ def get_personal_rules_resource() -> str:
     Returns:
         str: Full content of resources/personal_rules.md
     """
-    script_dir = os.path.dirname(os.path.abspath(__file__))
-    rules_path = os.path.join(script_dir, "resources/personal_rules.md")
-
-    if not os.path.exists(rules_path):
-        return "❌ personal_rules.md not found at: " + rules_path
+    rules_path = _PERSONAL_RULES_PATH
 
     try:
-        with open(rules_path, "r") as f:
-            return f.read()
+        return platform.read_text_cached(rules_path)
+    except FileNotFoundError:
+        return "❌ personal_rules.md not found at: " + rules_path
     except Exception as e:
         return f"❌ Error reading personal_rules.md: {str(e)}"
 
@@ -1238,9 +1269,7 @@ def create_session_note(
     from datetime import datetime
 
     try:
-        # Get script directory
-        script_dir = Path(__file__).parent
-        sessions_dir = script_dir / ".ephemeral" / "sessions"
+        sessions_dir = _SESSIONS_DIR
         sessions_dir.mkdir(parents=True, exist_ok=True)
 
         # Generate session filename
@@ -1368,8 +1397,7 @@ def read_session_notes(
     from datetime import datetime, timedelta
 
     try:
-        script_dir = Path(__file__).parent
-        sessions_dir = script_dir / ".ephemeral" / "sessions"
+        sessions_dir = _SESSIONS_DIR
 
         if not sessions_dir.exists():
             return {
@@ -1466,8 +1494,7 @@ def list_session_files(days_back: int = 30) -> Dict[str, Any]:
     from datetime import datetime, timedelta
 
     try:
-        script_dir = Path(__file__).parent
-        sessions_dir = script_dir / ".ephemeral" / "sessions"
+        sessions_dir = _SESSIONS_DIR
 
         if not sessions_dir.exists():
             return {
@@ -1748,7 +1775,7 @@ result = propose_tool_design(
     requires_system_state_change=False,
     implementation_approach="Uses run_remote_command to execute 'kubectl get pods -A -o json'"
 )
-# Valid! Token: valid-abc123-xyz789
+# Valid! Token: valid2-abc123-xyz789
 ```
 """
 
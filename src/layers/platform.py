@@ -6,14 +6,22 @@ This module contains platform-layer tools as defined in the 3-layer architecture
 Layer: platform
 """
 
+import copy
+import inspect
 import json
 import os
 import re
-import shlex
+import selectors
+import shutil
+import signal
+import stat
 import subprocess
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from pathlib import Path
-from typing import Any, Dict, List, Optional
+from functools import lru_cache, wraps
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 # =============================================================================
 # CONSTANTS: Configuration Values
@@ -30,11 +38,314 @@ ANSIBLE_MAC_PATH = os.path.expanduser("~/personal/git/ansible-mac")
 #   - "production": Production workloads
 #   - "shared-services": Privileged infrastructure cluster (can access both staging & production)
 #                        This is where K8s/Flux infrastructure runs
-ALLOWED_TELEPORT_CLUSTERS = ["staging", "production", "shared-service"]
+# _CLUSTER_ORDER fixes the order for iteration and messages; the frozenset is
+# what membership checks use (O(1), and it can't be mutated at runtime).
+_CLUSTER_ORDER = ("staging", "production", "shared-service")
+ALLOWED_TELEPORT_CLUSTERS = frozenset(_CLUSTER_ORDER)
 
 # Expected tsh binary path
 TSH_BINARY_PATH = "/usr/local/bin/tsh"
 
+# Name looked up on $PATH when tsh isn't at TSH_BINARY_PATH
+TSH_BINARY_NAME = "tsh"
+
+# Where $PATH lookup found tsh (None: using TSH_BINARY_PATH). Set by the
+# install check, so the lookup happens once rather than on every call.
+_resolved_tsh_path: Optional[str] = None
+
+# `tsh ping` timeout (seconds). A healthy proxy answers in well under a
+# second; this bounds how long an unreachable one can stall a pre-flight.
+PING_TIMEOUT = 5
+
+# Proxy version pattern, compiled once. The first X.Y.Z on the line wins,
+# with or without a leading "v":
+#   `tsh ping` -> "Proxy version: 17.7.1" (older releases print "v17.7.1")
+# (`tsh version` output is fixed-format and parsed by _parse_semver instead)
+_VERSION_RE = re.compile(r"v?(\d+\.\d+\.\d+)")
+
+# File contents cached by path: path -> (st_mtime_ns, content)
+_FILE_CACHE: Dict[str, Tuple[int, str]] = {}
+
+
+def read_text_cached(path: str) -> str:
+    """
+    Return a file's content, re-reading only when its mtime has changed.
+
+    Shared by the resource handlers of every layer: the docs they serve
+    change rarely, so a warm call costs one os.stat instead of a full read.
+
+    Raises FileNotFoundError (or other OSError) like open() would.
+    """
+    mtime = os.stat(path).st_mtime_ns
+    cached = _FILE_CACHE.get(path)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+
+    # One bytes read + one explicit UTF-8 decode (no TextIOWrapper, and no
+    # dependence on the locale's default encoding). Warm hits return the
+    # cached str itself - it's immutable, so sharing it is safe.
+    with open(path, "rb") as f:
+        content = f.read().decode("utf-8")
+    _FILE_CACHE[path] = (mtime, content)
+    return content
+
+
+# "Nothing to do" ansible_steps, shared by every success response. Tuples are
+# immutable (safe to share) and JSON-encode exactly like lists.
+_EMPTY_STEPS: Tuple[str, ...] = ()
+
+# The teleport playbook command. ANSIBLE_MAC_PATH is a constant, so the
+# command is too - build it once instead of in every response.
+_BASE_ANSIBLE_CMD = f"ansible-playbook {ANSIBLE_MAC_PATH}/playbooks/teleport.yml"
+
+
+def _versioned_ansible_cmd(version: str) -> str:
+    """Playbook command pinned to a specific Teleport version."""
+    return f"{_BASE_ANSIBLE_CMD} -e 'teleport_version={version}'"
+
+
+# Ansible guidance shared by every "tsh is not installed" response
+# (built once; a tuple, so every response can share it)
+_NOT_INSTALLED_STEPS = (
+    f"cd {ANSIBLE_MAC_PATH}",
+    "ansible-playbook playbooks/teleport.yml",
+    "Verify: tsh version",
+    "",
+    "This will install tsh using the version-pinned Ansible role.",
+)
+
+
+# Same for every tool, so formatted once (public: team-layer tools reuse it)
+INVALID_CLUSTER_MESSAGE = f"❌ Invalid cluster. Must be one of: {list(_CLUSTER_ORDER)}"
+
+
+def _invalid_cluster_response(**fields: Any) -> Dict[str, Any]:
+    """
+    Build a tool's "cluster not in the allow-list" response.
+
+    Like _not_installed_response: `fields` are the tool-specific keys,
+    the message and (empty) guidance are appended last.
+    """
+    return {
+        **fields,
+        "message": INVALID_CLUSTER_MESSAGE,
+        "ansible_command": None,
+        "ansible_steps": _EMPTY_STEPS,
+    }
+
+
+def _not_installed_response(**fields: Any) -> Dict[str, Any]:
+    """
+    Build a tool's "tsh is not installed" response.
+
+    `fields` are the tool-specific keys (cluster, node, ...); the message and
+    Ansible guidance are the same for every tool and appended last.
+    """
+    return {
+        **fields,
+        "message": "❌ tsh is not installed",
+        "ansible_command": _BASE_ANSIBLE_CMD,
+        "ansible_steps": _NOT_INSTALLED_STEPS,
+    }
+
+
+# How long check_tsh_installed's answer is reused (seconds)
+# Short on purpose: not snapshotted at import, because the guidance tells the
+# user to install tsh via Ansible and the next call must notice without a
+# server restart.
+TSH_INSTALL_TTL = 5
+
+# Last install check: monotonic time, TSH_BINARY_PATH it was made for, result
+_tsh_install_cache: Dict[str, Any] = {"ts": 0.0, "path": None, "result": None}
+# The pre-flight's worker threads all hit the check at once; the lock makes
+# them share one probe and never see a half-updated entry
+_tsh_install_lock = threading.Lock()
+
+
+# How long the tsh client version stays cached (seconds)
+# It only changes when tsh is upgraded - and the cache key includes the tsh
+# binary's mtime, so an upgrade invalidates it anyway. An hour is safe.
+VERSION_CACHE_TTL = 3600
+
+# How long proxy versions (and the pre-flight built on them) stay cached
+# A cluster upgrade leaves no local trace to invalidate on, so keep this
+# short: long enough that back-to-back pre-flights share one `tsh ping` per
+# cluster, short enough that an upgraded proxy shows up almost immediately.
+PROXY_VERSION_TTL = 30
+
+# How long read-only SSH tool results are reused (seconds)
+# Node lists change rarely; an SSH reachability check should stay fresh.
+NODE_LIST_TTL = 120
+SSH_CHECK_TTL = 5
+
+# How long a failed refresh may fall back to the last good result (seconds)
+STALE_RESULT_TTL = 300
+
+# On-disk copy of the version caches, so a restarted server (editor reload,
+# dev loop) doesn't start cold. Honours $XDG_CACHE_HOME like other CLI tools.
+CACHE_DIR = os.path.join(
+    os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache"),
+    "platform-mcp",
+)
+
+# Cached results: (function name, args) -> (time.monotonic() when stored,
+# tsh mtime when stored, result)
+_TTL_CACHE: Dict[Tuple, Tuple[float, Optional[int], Any]] = {}
+_TTL_CACHE_LOCK = threading.Lock()
+
+# Characters allowed in cache file names (args are cluster names, but be strict)
+_CACHE_NAME_RE = re.compile(r"[^A-Za-z0-9_.-]")
+
+
+def _tsh_stamp() -> Optional[int]:
+    """mtime of the tsh binary, or None if missing - part of every cache key."""
+    try:
+        return os.stat(_tsh_binary()).st_mtime_ns
+    except OSError:
+        return None
+
+
+def _cache_file(name: str, args: Tuple) -> str:
+    """Path of the on-disk cache entry for one (function, args) pair."""
+    stem = "-".join((name,) + tuple(str(a) for a in args))
+    return os.path.join(CACHE_DIR, _CACHE_NAME_RE.sub("_", stem) + ".json")
+
+
+def _disk_cache_get(path: str, seconds: float, stamp: Optional[int]) -> Any:
+    """Return a cached value from disk, or None if missing, stale or unreadable."""
+    try:
+        with open(path, "rb") as f:
+            entry = json.loads(f.read())
+    except (OSError, ValueError):
+        return None
+    if not isinstance(entry, dict) or entry.get("tsh_mtime") != stamp:
+        return None
+    age = time.time() - entry.get("ts", 0)
+    if not 0 <= age < seconds:
+        return None
+    return entry.get("value")
+
+
+def _disk_cache_put(path: str, stamp: Optional[int], value: Any) -> None:
+    """Best-effort atomic write of a cache entry (errors are ignored)."""
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        tmp = f"{path}.{os.getpid()}.tmp"
+        with open(tmp, "w") as f:
+            json.dump({"ts": time.time(), "tsh_mtime": stamp, "value": value}, f)
+        os.replace(tmp, path)
+    except (OSError, TypeError, ValueError):
+        pass
+
+
+def ttl_cache(
+    seconds: float,
+    ok_key: str = "success",
+    persist: bool = False,
+    stale_for: float = 0,
+) -> Callable:
+    """
+    Cache a tool's successful result for `seconds`.
+
+    ANALOGY: Like a DNS resolver honouring a record's TTL - answer from memory
+    until it expires, then ask upstream again.
+
+    Only results whose `ok_key` is truthy are stored, so a failed lookup (tsh
+    missing, proxy timeout) is retried on the very next call. Entries are tied
+    to the tsh binary's mtime, so upgrading tsh invalidates them at once.
+    With persist=True the entry is also written to CACHE_DIR and read back
+    after a server restart.
+    With stale_for > 0, a failed refresh falls back to the last good result
+    if it is younger than `stale_for` seconds, marked "stale": True and with
+    the failure in "refresh_error" - like serve-stale-on-error in a CDN.
+    The wrapped function gets a `cache_clear()` helper, like functools.lru_cache.
+    Every cached result is handed out as a deep copy, so callers may mutate
+    nested lists and dicts freely.
+
+    Public: higher layers (team.py) cache their SSH-backed reads with it too.
+    """
+
+    def decorator(fn: Callable) -> Callable:
+        signature = inspect.signature(fn)
+
+        @wraps(fn)
+        def wrapper(*args, **kwargs):
+            # Key on the bound arguments, defaults filled in, so f(c, n) and
+            # f(c, n, namespace="flux-system") share one entry
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            key = (fn.__name__, tuple(bound.arguments.values()))
+            try:
+                hash(key)
+            except TypeError:
+                # Unhashable argument (e.g. a list) - let fn validate it
+                return fn(*args, **kwargs)
+            now = time.monotonic()
+            stamp = _tsh_stamp()
+
+            # STEP 1: In-memory hit
+            with _TTL_CACHE_LOCK:
+                cached = _TTL_CACHE.get(key)
+            if cached is not None and now - cached[0] < seconds and cached[1] == stamp:
+                return copy.deepcopy(cached[2])
+
+            # STEP 2: On-disk hit (first call after a restart)
+            if persist:
+                value = _disk_cache_get(_cache_file(*key), seconds, stamp)
+                if isinstance(value, dict):
+                    with _TTL_CACHE_LOCK:
+                        _TTL_CACHE[key] = (now, stamp, value)
+                    return copy.deepcopy(value)
+
+            # STEP 3: Miss - run the real check and store it if it succeeded
+            result = fn(*args, **kwargs)
+            if result.get(ok_key):
+                with _TTL_CACHE_LOCK:
+                    _TTL_CACHE[key] = (now, stamp, result)
+                if persist:
+                    _disk_cache_put(_cache_file(*key), stamp, result)
+                return copy.deepcopy(result)
+            if cached is not None and now - cached[0] < stale_for:
+                # STEP 4: Refresh failed - last good answer beats none
+                stale = copy.deepcopy(cached[2])
+                stale["stale"] = True
+                stale["refresh_error"] = result.get("message")
+                return stale
+            return result
+
+        def cache_clear() -> None:
+            with _TTL_CACHE_LOCK:
+                for key in [k for k in _TTL_CACHE if k[0] == fn.__name__]:
+                    del _TTL_CACHE[key]
+            if persist:
+                prefix = _CACHE_NAME_RE.sub("_", fn.__name__)
+                try:
+                    names = os.listdir(CACHE_DIR)
+                except OSError:
+                    return
+                for name in names:
+                    if name == f"{prefix}.json" or name.startswith(f"{prefix}-"):
+                        try:
+                            os.remove(os.path.join(CACHE_DIR, name))
+                        except OSError:
+                            pass
+
+        wrapper.cache_clear = cache_clear
+        return wrapper
+
+    return decorator
+
+
+# =============================================================================
+# V1a TOOLS: Teleport Discovery & Version Management
+# =============================================================================
+# These tools check Teleport installation and compatibility BEFORE attempting
+# any operations. They provide intelligent guidance on how to fix issues using
+# Ansible.
+#
+# Philosophy: "Check, don't change" - these are read-only discovery tools that
+# give the AI (and user) full visibility into the environment state.
+
 
 def check_tsh_installed() -> Dict[str, Any]:
     """
@@ -85,33 +396,366 @@ def check_tsh_installed() -> Dict[str, Any]:
     - Provides Ansible guidance instead of installing directly
     """
 
-    # STEP 1: Check if tsh exists at expected path
-    if os.path.isfile(TSH_BINARY_PATH) and os.access(TSH_BINARY_PATH, os.X_OK):
+    # STEP 1: Use the (briefly) cached answer
+    # A pre-flight calls this ~4 times in a row (directly, then via the
+    # version tools), so the stat is shared for TSH_INSTALL_TTL seconds.
+    return dict(_cached_check_tsh_installed())
+
+
+def _invalidate_tsh_cache() -> None:
+    """Forget the cached install check (tests, or after installing tsh)."""
+    with _tsh_install_lock:
+        _tsh_install_cache.update({"ts": 0.0, "path": None, "result": None})
+    _run_tsh_version.cache_clear()
+    _forget_login()
+
+
+def _cached_check_tsh_installed() -> Dict[str, Any]:
+    """Return the install check, re-probing at most every TSH_INSTALL_TTL seconds."""
+    cache = _tsh_install_cache
+    with _tsh_install_lock:
+        now = time.monotonic()
+        if (
+            cache["result"] is not None
+            and cache["path"] == TSH_BINARY_PATH
+            and now - cache["ts"] < TSH_INSTALL_TTL
+        ):
+            return cache["result"]
+
+        # A stat or two, so holding the lock across the probe is cheap
+        result = _probe_tsh_installed()
+        previous = cache["result"]
+        cache.update({"ts": now, "path": TSH_BINARY_PATH, "result": result})
+
+    if not result["installed"] and previous and previous["installed"]:
+        # tsh went away - drop the version it reported
+        _run_tsh_version.cache_clear()
+    return result
+
+
+def _is_executable_file(path: str) -> bool:
+    """One stat: is `path` a regular file with an execute bit set?"""
+    # (any x bit - tsh is installed 0755, so this matches os.access in practice)
+    try:
+        mode = os.stat(path).st_mode
+    except OSError:
+        return False
+    return stat.S_ISREG(mode) and bool(mode & 0o111)
+
+
+def _tsh_binary() -> str:
+    """The tsh actually in use: TSH_BINARY_PATH, or where PATH lookup found it."""
+    return _resolved_tsh_path or TSH_BINARY_PATH
+
+
+def _probe_tsh_installed() -> Dict[str, Any]:
+    """The actual check behind check_tsh_installed (no tsh process started)."""
+    global _resolved_tsh_path
+
+    # Expected location first (one stat), then the path PATH lookup found
+    # last time, and only then walk $PATH (e.g. Homebrew's /opt/homebrew/bin)
+    if _is_executable_file(TSH_BINARY_PATH):
+        path = TSH_BINARY_PATH
+    elif _resolved_tsh_path and _is_executable_file(_resolved_tsh_path):
+        path = _resolved_tsh_path
+    else:
+        path = shutil.which(TSH_BINARY_NAME)
+    _resolved_tsh_path = None if path == TSH_BINARY_PATH else path
+
+    if path:
         # tsh exists and is executable
         return {
             "installed": True,
-            "path": TSH_BINARY_PATH,
-            "message": f"✅ tsh is installed at {TSH_BINARY_PATH}",
+            "path": path,
+            "message": f"✅ tsh is installed at {path}",
             "ansible_command": None,
-            "ansible_steps": [],
+            "ansible_steps": _EMPTY_STEPS,
         }
     else:
         # tsh not found - provide installation guidance
-        return {
-            "installed": False,
-            "path": None,
-            "message": "❌ tsh is not installed",
-            "ansible_command": f"ansible-playbook {ANSIBLE_MAC_PATH}/playbooks/teleport.yml",
-            "ansible_steps": [
-                f"cd {ANSIBLE_MAC_PATH}",
-                "ansible-playbook playbooks/teleport.yml",
-                "Verify: tsh version",
-                "",
-                "This will install tsh using the version-pinned Ansible role.",
-            ],
+        return _not_installed_response(installed=False, path=None)
+
+
+def _kill_group(proc: subprocess.Popen) -> None:
+    """SIGKILL the child's whole process group (tsh may have spawned helpers)."""
+    try:
+        os.killpg(proc.pid, signal.SIGKILL)
+    except (AttributeError, ProcessLookupError, PermissionError):
+        # No killpg (non-POSIX) or the group is already gone
+        proc.kill()
+
+
+def _run(
+    command: List[str], timeout: float, check: bool = False
+) -> subprocess.CompletedProcess:
+    """
+    subprocess.run(capture_output=True, text=True) that kills the whole tree.
+
+    The child starts in its own session, so on timeout the entire process
+    group is killed - not just tsh itself, which can leave helpers (e.g. an
+    SSO browser launcher) holding the pipes open and the tool hanging.
+
+    Raises subprocess.TimeoutExpired / CalledProcessError like subprocess.run.
+    """
+    with subprocess.Popen(
+        command,
+        shell=False,  # CRITICAL: No shell=True
+        # Never let tsh read our stdin: under MCP's stdio transport that is
+        # the JSON-RPC stream, and a tsh prompt would swallow requests
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        text=True,
+        start_new_session=True,
+    ) as proc:
+        try:
+            stdout, stderr = proc.communicate(timeout=timeout)
+        except subprocess.TimeoutExpired:
+            _kill_group(proc)
+            proc.communicate()
+            raise
+    if check and proc.returncode:
+        raise subprocess.CalledProcessError(proc.returncode, command, stdout, stderr)
+    return subprocess.CompletedProcess(command, proc.returncode, stdout, stderr)
+
+
+# How long a "not logged in" answer from `tsh status` is trusted (seconds)
+# Short for the same reason as TSH_INSTALL_TTL: the guidance tells the user
+# to run `tsh login`, and the next call must notice. A valid login is
+# trusted until its own expiry.
+LOGIN_RECHECK_TTL = 5
+
+# Last `tsh status` verdict and the wall-clock time it stops being trusted
+_login_state: Dict[str, Any] = {"logged_in": None, "until": 0.0}
+_login_lock = threading.Lock()
+
+# Go writes RFC 3339 with nanoseconds; fromisoformat takes at most 6 digits
+_FRACTION_RE = re.compile(r"\.\d+")
+
+
+def _parse_valid_until(value: Any) -> Optional[float]:
+    """'2025-01-07T18:04:05.123456789Z' -> epoch seconds (None if unparseable)."""
+    text = _FRACTION_RE.sub("", str(value or "")).replace("Z", "+00:00")
+    try:
+        return datetime.fromisoformat(text).timestamp()
+    except ValueError:
+        return None
+
+
+def _tsh_logged_in() -> Optional[bool]:
+    """
+    Is there an unexpired tsh login for our proxy?
+
+    Returns True / False, or None when tsh couldn't tell us (old tsh, odd
+    output, timeout) - callers then just try the real command.
+
+    ANALOGY: Like checking `tsh status` before bothering with `tsh ssh`.
+    Cached, so a session of tool calls normally starts no extra process.
+    """
+    with _login_lock:
+        if (
+            _login_state["logged_in"] is not None
+            and time.time() < _login_state["until"]
+        ):
+            return _login_state["logged_in"]
+
+    try:
+        result = _run([_tsh_binary(), "status", "--format=json"], timeout=PING_TIMEOUT)
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+    now = time.time()
+    if result.returncode != 0:
+        if "not logged in" not in result.stderr.lower():
+            return None
+        logged_in, until = False, now + LOGIN_RECHECK_TTL
+    else:
+        try:
+            data = json.loads(result.stdout)
+        except ValueError:
+            return None
+        if not isinstance(data, dict):
+            return None
+        # The active profile plus any others; only ours count
+        profiles = [data.get("active")] + list(data.get("profiles") or [])
+        expiries = [
+            _parse_valid_until(profile.get("valid_until"))
+            for profile in profiles
+            if isinstance(profile, dict)
+            and "teleport.tw.ee" in str(profile.get("profile_url", ""))
+        ]
+        expiry = max((e for e in expiries if e), default=None)
+        if expiry is None:
+            return None
+        logged_in = expiry > now
+        until = expiry if logged_in else now + LOGIN_RECHECK_TTL
+
+    with _login_lock:
+        _login_state.update({"logged_in": logged_in, "until": until})
+    return logged_in
+
+
+def _forget_login() -> None:
+    """Drop the cached login verdict (a command just said we're not logged in)."""
+    with _login_lock:
+        _login_state.update({"logged_in": None, "until": 0.0})
+
+
+# What a failed tsh call's stderr is about, in one case-insensitive pass
+# (no lower()'d copy of a possibly large stderr, no rescan per phrase)
+_STDERR_CLASSIFIER = re.compile(
+    r"(?P<login>not logged in|please login|tsh login)"
+    r"|(?P<connection>cannot connect|connection)",
+    re.IGNORECASE,
+)
+
+
+def _classify_stderr(stderr: str) -> Optional[str]:
+    """Classify stderr as "login", "connection" or None (login wins if both)."""
+    kind = None
+    for match in _STDERR_CLASSIFIER.finditer(stderr):
+        if match.lastgroup == "login":
+            return "login"
+        kind = "connection"
+    return kind
+
+
+def _not_logged_in_response(**fields: Any) -> Dict[str, Any]:
+    """A tool's 'not logged in' response: its own fields plus login guidance."""
+    cluster = fields["cluster"]
+    fields.update(
+        {
+            "message": f"❌ Not logged into {cluster} Teleport cluster",
+            "ansible_command": None,
+            # Immutable like _EMPTY_STEPS - the response may be cached and shared
+            "ansible_steps": (
+                f"tsh login --proxy=teleport.tw.ee:443 --auth=okta {cluster}",
+            ),
         }
+    )
+    return fields
+
+
+def _tsh_tool(
+    fields: Callable[..., Dict[str, Any]], check_login: bool = True
+) -> Callable:
+    """
+    Run the checks every cluster-scoped tsh tool starts with.
+
+    STEP 1: cluster must be in the allow-list
+    STEP 2: tsh must be installed
+    STEP 3: (check_login) the tsh login must not be known to be expired
+
+    `fields(args)` gets the call's bound arguments (defaults applied) and
+    returns the tool-specific keys of its error responses, e.g.
+    {"success": False, "cluster": ..., "nodes": []}. The tool body only
+    runs once all checks pass.
+
+    ANALOGY: Like a shared `preflight || exit 1` at the top of every script.
+    """
+
+    def decorator(fn: Callable) -> Callable:
+        signature = inspect.signature(fn)
+
+        @wraps(fn)
+        def wrapper(*args, **kwargs):
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            error_fields = fields(bound.arguments)
+
+            if error_fields["cluster"] not in ALLOWED_TELEPORT_CLUSTERS:
+                return _invalid_cluster_response(**error_fields)
+            if not check_tsh_installed()["installed"]:
+                return _not_installed_response(**error_fields)
+            # Known-expired login: say so now instead of after a tsh round-trip
+            if check_login and _tsh_logged_in() is False:
+                return _not_logged_in_response(**error_fields)
+            return fn(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def _run_tsh(
+    args: List[str], timeout: float
+) -> Tuple[subprocess.CompletedProcess, Optional[str]]:
+    """
+    Run `tsh <args>`; return (result, failure kind).
+
+    The kind is None on success, else _classify_stderr()'s verdict. A
+    "login" failure also drops the cached login check, so the next call
+    asks `tsh status` again instead of trusting it.
+    """
+    result = _run([_tsh_binary(), *args], timeout=timeout)
+    kind = None
+    if result.returncode != 0:
+        kind = _classify_stderr(result.stderr)
+        if kind == "login":
+            _forget_login()
+    return result, kind
+
+
+@lru_cache(maxsize=1)
+def _run_tsh_version(tsh_stamp: Optional[int]) -> Tuple[Optional[str], str]:
+    """
+    Run `tsh version --format=json` once and return (version, full_version).
+
+    Keyed on the tsh binary's mtime (`tsh_stamp`), so every caller in a
+    pre-flight - the client check plus one per cluster - shares a single
+    subprocess, and upgrading tsh naturally forces a re-run.
+    `version` is None if the output couldn't be parsed.
+
+    Raises subprocess.TimeoutExpired / CalledProcessError (not cached).
+    """
+    result = _run([_tsh_binary(), "version", "--format=json"], timeout=5, check=True)
+    output = result.stdout.strip()
+
+    # JSON report, e.g.
+    #   {"version": "16.4.8", "gitref": "v16.4.8-0-g...", "runtime": "go1.22.5"}
+    # full_version is rebuilt in the familiar "Teleport v16.4.8 git:..." form
+    try:
+        data = json.loads(output)
+    except ValueError:
+        data = None
+    if isinstance(data, dict) and data.get("version"):
+        version = str(data["version"]).lstrip("v")
+        full_version = " ".join(
+            part
+            for part in (
+                f"Teleport v{version}",
+                f"git:{data['gitref']}" if data.get("gitref") else "",
+                str(data.get("runtime") or ""),
+            )
+            if part
+        )
+        return _parse_semver(full_version), full_version
+
+    # Plain text (tsh without --format support for `version`)
+    return _parse_semver(output), output
+
 
+def _parse_semver(line: str) -> Optional[str]:
+    """
+    Pull "X.Y.Z" out of `tsh version` output without a regex.
 
+    Example: "Teleport v16.4.8 git:v16.4.8-0-g..." -> "16.4.8"
+    Returns None if the first " v" token isn't X.Y.Z (optionally "-suffix").
+    """
+    i = line.find(" v")
+    if i == -1:
+        return None
+    j = line.find(" ", i + 2)
+    candidate = line[i + 2 :] if j == -1 else line[i + 2 : j]
+    # Drop a pre-release/build suffix: "17.0.0-dev" -> "17.0.0"
+    candidate = candidate.partition("-")[0]
+    parts = candidate.split(".")
+    if len(parts) == 3 and all(part.isdigit() for part in parts):
+        return candidate
+    return None
+
+
+@ttl_cache(VERSION_CACHE_TTL, persist=True)
 def get_tsh_client_version() -> Dict[str, Any]:
     """
     Get the installed Teleport CLI (tsh) client version.
@@ -162,44 +806,25 @@ def get_tsh_client_version() -> Dict[str, Any]:
     # STEP 1: Verify tsh is installed (defensive programming)
     install_check = check_tsh_installed()
     if not install_check["installed"]:
-        return {
-            "success": False,
-            "version": None,
-            "full_version": None,
-            "message": install_check["message"],
-            "ansible_command": install_check["ansible_command"],
-            "ansible_steps": install_check["ansible_steps"],
-        }
-
-    # STEP 2: Get version from tsh
-    command = [TSH_BINARY_PATH, "version"]
-
-    try:
-        result = subprocess.run(
-            command,
-            shell=False,
-            capture_output=True,
-            text=True,
-            check=True,
-            timeout=5,
+        return _not_installed_response(
+            success=False,
+            version=None,
+            full_version=None,
         )
 
-        full_version = result.stdout.strip()
-
-        # STEP 3: Parse version number
-        # Example output: "Teleport v16.4.8 git:v16.4.8-0-g..."
-        # We want to extract: "16.4.8"
-        version_match = re.search(r"v(\d+\.\d+\.\d+)", full_version)
+    # STEP 2: Get version from tsh (one `tsh version` per installed binary)
+    try:
+        version, full_version = _run_tsh_version(_tsh_stamp())
 
-        if version_match:
-            version = version_match.group(1)
+        # STEP 3: Format the parsed version
+        if version:
             return {
                 "success": True,
                 "version": version,
                 "full_version": full_version,
                 "message": f"✅ tsh client version: {version}",
                 "ansible_command": None,
-                "ansible_steps": [],
+                "ansible_steps": _EMPTY_STEPS,
             }
         else:
             return {
@@ -229,7 +854,7 @@ def get_tsh_client_version() -> Dict[str, Any]:
             "ansible_command": None,
             "ansible_steps": ["Run 'tsh version' manually to debug"],
         }
-    except Exception as e:
+    except (OSError, subprocess.SubprocessError, ValueError) as e:
         return {
             "success": False,
             "version": None,
@@ -240,6 +865,63 @@ def get_tsh_client_version() -> Dict[str, Any]:
         }
 
 
+@lru_cache(maxsize=64)
+def _version_tuple(version: str) -> Tuple[int, ...]:
+    """
+    "17.10.0" -> (17, 10, 0), so versions compare numerically.
+
+    Memoized: only a handful of distinct versions are ever seen at runtime.
+    """
+    return tuple(map(int, version.split(".")))
+
+
+def _parse_ping_output(stdout: str) -> Tuple[Optional[str], Optional[str]]:
+    """
+    Return (proxy_version, client_version) from `tsh ping` output.
+
+    `--format=json` output is a single object with "server_version" (and
+    "client_version" on newer tsh). Plain text from older releases falls
+    back to scanning for the "Proxy version: v17.7.1" line; it never has
+    the client version, so that comes back as None.
+    """
+    try:
+        data = json.loads(stdout)
+    except ValueError:
+        data = None
+
+    if isinstance(data, dict):
+        versions = []
+        for key in ("server_version", "client_version"):
+            match = _VERSION_RE.search(str(data.get(key) or ""))
+            versions.append(match.group(1) if match else None)
+        return versions[0], versions[1]
+
+    # Plain-text output, e.g. "Proxy version: v17.7.1"
+    # One lower() over the whole text (tsh output is ASCII, so offsets line
+    # up), then the regex runs from the label to the end of its line
+    idx = stdout.lower().find("proxy version")
+    if idx != -1:
+        end = stdout.find("\n", idx)
+        if end == -1:
+            end = len(stdout)
+        version_match = _VERSION_RE.search(stdout, idx, end)
+        if version_match:
+            return version_match.group(1), None
+    return None, None
+
+
+@ttl_cache(PROXY_VERSION_TTL, persist=True)
+@_tsh_tool(
+    lambda a: {
+        "success": False,
+        "cluster": a["cluster"],
+        "proxy_version": None,
+        "proxy_url": None,
+        "client_version": None,
+        "compatible": False,
+    },
+    check_login=False,  # tsh ping needs no login
+)
 def get_teleport_proxy_version(cluster: str) -> Dict[str, Any]:
     """
     Get the Teleport proxy (server) version for a specific cluster.
@@ -300,75 +982,39 @@ def get_teleport_proxy_version(cluster: str) -> Dict[str, Any]:
     - Checks tsh installation first
     """
 
-    # STEP 1: Validate input
-    if cluster not in ALLOWED_TELEPORT_CLUSTERS:
-        return {
-            "success": False,
-            "cluster": cluster,
-            "proxy_version": None,
-            "proxy_url": None,
-            "client_version": None,
-            "compatible": False,
-            "message": f"❌ Invalid cluster. Must be one of: {ALLOWED_TELEPORT_CLUSTERS}",
-            "ansible_command": None,
-            "ansible_steps": [],
-        }
-
-    # STEP 2: Check if tsh is installed
-    install_check = check_tsh_installed()
-    if not install_check["installed"]:
-        return {
-            "success": False,
-            "cluster": cluster,
-            "proxy_version": None,
-            "proxy_url": None,
-            "client_version": None,
-            "compatible": False,
-            "message": "❌ tsh is not installed",
-            "ansible_command": install_check["ansible_command"],
-            "ansible_steps": install_check["ansible_steps"],
-        }
+    # STEP 1-2: Cluster allow-list and tsh install check (@_tsh_tool)
 
-    # STEP 3: Get client version
-    client_info = get_tsh_client_version()
-    if not client_info["success"]:
-        return {
-            "success": False,
-            "cluster": cluster,
-            "proxy_version": None,
-            "proxy_url": None,
-            "client_version": None,
-            "compatible": False,
-            "message": f"❌ Cannot determine client version: {client_info['message']}",
-            "ansible_command": client_info.get("ansible_command"),
-            "ansible_steps": client_info.get("ansible_steps", []),
-        }
-
-    client_version = client_info["version"]
-
-    # STEP 4: Ping the proxy to get server version
-    # We use: tsh ping --proxy=teleport.tw.ee:443
+    # STEP 3: Ping the proxy to get server version
+    # We use: tsh ping --proxy=teleport.tw.ee:443 --format=json
+    # The JSON report carries the server version and, on current tsh, the
+    # client version too - so one process answers both questions.
     proxy_url = "teleport.tw.ee:443"
-    command = [TSH_BINARY_PATH, "ping", f"--proxy={proxy_url}"]
+    client_version = None
 
     try:
-        result = subprocess.run(
-            command,
-            shell=False,
-            capture_output=True,
-            text=True,
-            timeout=10,
+        result, _ = _run_tsh(
+            ["ping", f"--proxy={proxy_url}", "--format=json"], timeout=PING_TIMEOUT
         )
 
-        # Parse output for version
-        # Example: "Proxy version: v17.7.1"
-        proxy_version = None
-        for line in result.stdout.split("\n"):
-            if "proxy version" in line.lower():
-                version_match = re.search(r"v?(\d+\.\d+\.\d+)", line)
-                if version_match:
-                    proxy_version = version_match.group(1)
-                    break
+        proxy_version, client_version = _parse_ping_output(result.stdout)
+
+        # STEP 4: Get client version (only if ping didn't report it)
+        # get_tsh_client_version is cached, so this rarely starts a process
+        if not client_version:
+            client_info = get_tsh_client_version()
+            if not client_info["success"]:
+                return {
+                    "success": False,
+                    "cluster": cluster,
+                    "proxy_version": proxy_version,
+                    "proxy_url": proxy_url,
+                    "client_version": None,
+                    "compatible": False,
+                    "message": f"❌ Cannot determine client version: {client_info['message']}",
+                    "ansible_command": client_info.get("ansible_command"),
+                    "ansible_steps": client_info.get("ansible_steps", []),
+                }
+            client_version = client_info["version"]
 
         if not proxy_version:
             return {
@@ -386,12 +1032,8 @@ def get_teleport_proxy_version(cluster: str) -> Dict[str, Any]:
             }
 
         # STEP 5: Compare versions
-        # Helper function to parse version tuples
-        def version_tuple(v):
-            return tuple(map(int, v.split(".")))
-
-        client_ver_tuple = version_tuple(client_version)
-        proxy_ver_tuple = version_tuple(proxy_version)
+        client_ver_tuple = _version_tuple(client_version)
+        proxy_ver_tuple = _version_tuple(proxy_version)
 
         # Teleport is backwards compatible (old client, new server = OK)
         # But NOT forwards compatible (new client, old server = BAD)
@@ -401,10 +1043,10 @@ def get_teleport_proxy_version(cluster: str) -> Dict[str, Any]:
         if client_ver_tuple == proxy_ver_tuple:
             message = f"✅ Client ({client_version}) is compatible with {cluster} proxy ({proxy_version})"
             ansible_command = None
-            ansible_steps = []
+            ansible_steps = _EMPTY_STEPS
         elif client_ver_tuple < proxy_ver_tuple:
             message = f"⚠️  Client ({client_version}) is older than {cluster} proxy ({proxy_version}). Works due to backwards compatibility, but consider upgrading."
-            ansible_command = f"ansible-playbook {ANSIBLE_MAC_PATH}/playbooks/teleport.yml -e 'teleport_version={proxy_version}'"
+            ansible_command = _versioned_ansible_cmd(proxy_version)
             ansible_steps = [
                 f"cd {ANSIBLE_MAC_PATH}",
                 f"Edit roles/teleport/defaults/main.yml",
@@ -414,7 +1056,7 @@ def get_teleport_proxy_version(cluster: str) -> Dict[str, Any]:
             ]
         else:
             message = f"❌ Client ({client_version}) is NEWER than {cluster} proxy ({proxy_version}). This may cause compatibility issues!"
-            ansible_command = f"ansible-playbook {ANSIBLE_MAC_PATH}/playbooks/teleport.yml -e 'teleport_version={proxy_version}'"
+            ansible_command = _versioned_ansible_cmd(proxy_version)
             ansible_steps = [
                 f"cd {ANSIBLE_MAC_PATH}",
                 f"Edit roles/teleport/defaults/main.yml",
@@ -452,7 +1094,7 @@ def get_teleport_proxy_version(cluster: str) -> Dict[str, Any]:
                 f"Try: tsh ping --proxy={proxy_url}",
             ],
         }
-    except Exception as e:
+    except (OSError, subprocess.SubprocessError, ValueError) as e:
         return {
             "success": False,
             "cluster": cluster,
@@ -466,6 +1108,23 @@ def get_teleport_proxy_version(cluster: str) -> Dict[str, Any]:
         }
 
 
+# Skeleton of verify_teleport_compatibility's "all good" response; the happy
+# path copies it and fills in the per-call fields. Key order matches the
+# other paths. The empty sequences are tuples, so sharing them between
+# copies is safe (they serialize to [] like lists do).
+_ALL_GOOD_TEMPLATE: Dict[str, Any] = {
+    "compatible": True,
+    "tsh_installed": True,
+    "client_version": None,
+    "clusters": None,
+    "issues": (),
+    "recommendation": None,
+    "ansible_command": None,
+    "ansible_steps": _EMPTY_STEPS,
+}
+
+
+@ttl_cache(PROXY_VERSION_TTL, ok_key="compatible", persist=True)
 def verify_teleport_compatibility() -> Dict[str, Any]:
     """
     Complete pre-flight check: Verify tsh installation and compatibility with all clusters.
@@ -541,8 +1200,8 @@ def verify_teleport_compatibility() -> Dict[str, Any]:
             "clusters": {},
             "issues": ["tsh is not installed"],
             "recommendation": "Install Teleport CLI (tsh) using Ansible before proceeding",
-            "ansible_command": install_check["ansible_command"],
-            "ansible_steps": install_check["ansible_steps"],
+            "ansible_command": _BASE_ANSIBLE_CMD,
+            "ansible_steps": _NOT_INSTALLED_STEPS,
         }
 
     # STEP 2: Get client version
@@ -566,9 +1225,15 @@ def verify_teleport_compatibility() -> Dict[str, Any]:
     issues = []
     all_compatible = True
     needs_upgrade_to = None
+    needs_upgrade_tuple: Optional[Tuple[int, ...]] = None
+
+    # The probes are independent network calls, so run them side by side:
+    # worst case is one timeout, not one per cluster.
+    # ANALOGY: Like `parallel tsh ping ::: staging production` instead of a for-loop
+    with ThreadPoolExecutor(max_workers=len(_CLUSTER_ORDER)) as executor:
+        cluster_checks = list(executor.map(get_teleport_proxy_version, _CLUSTER_ORDER))
 
-    for cluster_name in ALLOWED_TELEPORT_CLUSTERS:
-        cluster_check = get_teleport_proxy_version(cluster_name)
+    for cluster_name, cluster_check in zip(_CLUSTER_ORDER, cluster_checks):
         clusters_status[cluster_name] = cluster_check
 
         if not cluster_check["success"]:
@@ -577,22 +1242,28 @@ def verify_teleport_compatibility() -> Dict[str, Any]:
         elif not cluster_check["compatible"]:
             issues.append(cluster_check["message"])
             all_compatible = False
-            # Track highest version we need to upgrade to
-            if cluster_check["proxy_version"]:
-                if (
-                    not needs_upgrade_to
-                    or cluster_check["proxy_version"] > needs_upgrade_to
-                ):
-                    needs_upgrade_to = cluster_check["proxy_version"]
+            # Track highest version we need to upgrade to - a running max
+            # over integer tuples (as strings "17.10.0" < "17.9.0"). The
+            # string is only kept alongside it for the message.
+            proxy_version = cluster_check["proxy_version"]
+            if proxy_version:
+                proxy_tuple = _version_tuple(proxy_version)
+                if needs_upgrade_tuple is None or proxy_tuple > needs_upgrade_tuple:
+                    needs_upgrade_tuple, needs_upgrade_to = proxy_tuple, proxy_version
 
     # STEP 4: Build recommendation based on findings
     if all_compatible and not issues:
-        recommendation = f"✅ All systems compatible. tsh v{client_version} works with all clusters. Ready to run Flux commands."
-        ansible_command = None
-        ansible_steps = []
+        # Fast path (the steady state): fill in the pre-built template
+        response = _ALL_GOOD_TEMPLATE.copy()
+        response["client_version"] = client_version
+        response["clusters"] = clusters_status
+        response["recommendation"] = (
+            f"✅ All systems compatible. tsh v{client_version} works with all clusters. Ready to run Flux commands."
+        )
+        return response
     elif needs_upgrade_to:
         recommendation = f"⚠️  Upgrade tsh to v{needs_upgrade_to} for full compatibility with all clusters."
-        ansible_command = f"ansible-playbook {ANSIBLE_MAC_PATH}/playbooks/teleport.yml -e 'teleport_version={needs_upgrade_to}'"
+        ansible_command = _versioned_ansible_cmd(needs_upgrade_to)
         ansible_steps = [
             f"cd {ANSIBLE_MAC_PATH}",
             f"Edit roles/teleport/defaults/main.yml",
@@ -628,6 +1299,24 @@ def verify_teleport_compatibility() -> Dict[str, Any]:
 # This architecture works for ANY remote command on ANY instance, not just k8s/flux!
 
 
+def _node_summary(server: Dict[str, Any]) -> Dict[str, Any]:
+    """One `tsh ls --format=json` entry -> {"hostname", "address", "labels"}."""
+    metadata = server.get("metadata") or {}
+    spec = server.get("spec") or {}
+    labels = {k: str(v) for k, v in (metadata.get("labels") or {}).items()}
+    # Dynamic (command) labels carry their current value under "result"
+    for name, cmd_label in (spec.get("cmd_labels") or {}).items():
+        labels[name] = str((cmd_label or {}).get("result", "")).strip()
+    return {
+        "hostname": spec.get("hostname") or metadata.get("name", ""),
+        # Empty for nodes that connect through a reverse tunnel
+        "address": spec.get("addr") or None,
+        "labels": labels,
+    }
+
+
+@ttl_cache(NODE_LIST_TTL, stale_for=STALE_RESULT_TTL)
+@_tsh_tool(lambda a: {"success": False, "cluster": a["cluster"], "nodes": []})
 def list_teleport_nodes(cluster: str, filter: Optional[str] = None) -> Dict[str, Any]:
     """
     List available SSH nodes in a Teleport cluster.
@@ -638,7 +1327,8 @@ def list_teleport_nodes(cluster: str, filter: Optional[str] = None) -> Dict[str,
 
     Args:
         cluster: Must be one of ["staging", "production"]
-        filter: Optional filter string (e.g., "k8s", "master", "bastion")
+        filter: Optional filter string (e.g., "k8s", "master", "bastion"),
+            matched case-insensitively against hostnames and label values
 
     Returns:
         dict: Available nodes information
@@ -686,54 +1376,23 @@ def list_teleport_nodes(cluster: str, filter: Optional[str] = None) -> Dict[str,
 
     SECURITY NOTES:
     - Input validation: cluster must be in allow-list
-    - Read-only operation
+    - Read-only operation (results reused for NODE_LIST_TTL seconds)
     - Checks authentication first
     """
 
-    # STEP 1: Validate input
-    if cluster not in ALLOWED_TELEPORT_CLUSTERS:
-        return {
-            "success": False,
-            "cluster": cluster,
-            "nodes": [],
-            "message": f"❌ Invalid cluster. Must be one of: {ALLOWED_TELEPORT_CLUSTERS}",
-            "ansible_command": None,
-            "ansible_steps": [],
-        }
-
-    # STEP 2: Verify tsh is installed
-    install_check = check_tsh_installed()
-    if not install_check["installed"]:
-        return {
-            "success": False,
-            "cluster": cluster,
-            "nodes": [],
-            "message": "❌ tsh is not installed",
-            "ansible_command": install_check["ansible_command"],
-            "ansible_steps": install_check["ansible_steps"],
-        }
+    # STEP 1-2: Cluster allow-list, tsh install and login checks (@_tsh_tool)
 
     # STEP 3: List nodes
-    command = [TSH_BINARY_PATH, "ls", "--cluster", cluster]
-
-    # Add filter if provided
-    if filter:
-        # Note: tsh ls doesn't have a built-in filter flag, so we'll filter in post-processing
-        pass
-
+    # JSON gives hostname, address and labels per node - no column splitting.
+    # tsh ls has no substring filter flag, so filtering happens in STEP 4.
     try:
-        result = subprocess.run(
-            command,
-            shell=False,
-            capture_output=True,
-            text=True,
-            timeout=15,
+        result, failure = _run_tsh(
+            ["ls", "--cluster", cluster, "--format=json"], timeout=15
         )
 
         if result.returncode != 0:
             # Check if it's an auth issue
-            stderr = result.stderr.lower()
-            if "not logged in" in stderr or "login" in stderr:
+            if failure == "login":
                 return {
                     "success": False,
                     "cluster": cluster,
@@ -757,28 +1416,17 @@ def list_teleport_nodes(cluster: str, filter: Optional[str] = None) -> Dict[str,
                 }
 
         # STEP 4: Parse output
-        output = result.stdout.strip()
-        nodes = []
-
-        if output:
-            lines = output.split("\n")
-            # Skip header lines (first 2 lines typically)
-            for line in lines[2:] if len(lines) > 2 else []:
-                if line.strip() and not line.startswith("-"):
-                    # Parse node info (hostname is typically first column)
-                    parts = line.split()
-                    if parts:
-                        hostname = parts[0]
-                        # Apply filter if provided
-                        if filter and filter.lower() not in hostname.lower():
-                            continue
-
-                        nodes.append(
-                            {
-                                "hostname": hostname,
-                                "raw_line": line.strip(),
-                            }
-                        )
+        nodes = [_node_summary(server) for server in json.loads(result.stdout or "[]")]
+
+        if filter:
+            # Match on the hostname or any label value, e.g. "k8s" or "master"
+            needle = filter.lower()
+            nodes = [
+                node
+                for node in nodes
+                if needle in node["hostname"].lower()
+                or any(needle in value.lower() for value in node["labels"].values())
+            ]
 
         # STEP 5: Return results
         filter_msg = f" matching '{filter}'" if filter else ""
@@ -790,7 +1438,7 @@ def list_teleport_nodes(cluster: str, filter: Optional[str] = None) -> Dict[str,
                 "nodes": nodes,
                 "message": f"✅ Found {len(nodes)} node(s) in {cluster}{filter_msg}",
                 "ansible_command": None,
-                "ansible_steps": [],
+                "ansible_steps": _EMPTY_STEPS,
             }
         else:
             return {
@@ -815,7 +1463,7 @@ def list_teleport_nodes(cluster: str, filter: Optional[str] = None) -> Dict[str,
             "ansible_command": None,
             "ansible_steps": ["Check network connectivity to Teleport proxy"],
         }
-    except Exception as e:
+    except (OSError, subprocess.SubprocessError, ValueError) as e:
         return {
             "success": False,
             "cluster": cluster,
@@ -826,6 +1474,16 @@ def list_teleport_nodes(cluster: str, filter: Optional[str] = None) -> Dict[str,
         }
 
 
+@ttl_cache(SSH_CHECK_TTL, ok_key="accessible")
+@_tsh_tool(
+    lambda a: {
+        "success": False,
+        "cluster": a["cluster"],
+        "node": a["node"],
+        "user": a["user"],
+        "accessible": False,
+    }
+)
 def verify_ssh_access(cluster: str, node: str, user: str = "root") -> Dict[str, Any]:
     """
     Verify you can SSH to a specific node via Teleport.
@@ -883,55 +1541,20 @@ def verify_ssh_access(cluster: str, node: str, user: str = "root") -> Dict[str,
     SECURITY NOTES:
     - Input validation on cluster names
     - Read-only test (just checks access, doesn't modify anything)
+    - A successful check is reused for SSH_CHECK_TTL seconds; failures never are
     - Uses safe subprocess calls
     - Command is hardcoded (no user input in the test command)
     """
 
-    # STEP 1: Validate inputs
-    if cluster not in ALLOWED_TELEPORT_CLUSTERS:
-        return {
-            "success": False,
-            "cluster": cluster,
-            "node": node,
-            "user": user,
-            "accessible": False,
-            "message": f"❌ Invalid cluster. Must be one of: {ALLOWED_TELEPORT_CLUSTERS}",
-            "ansible_command": None,
-            "ansible_steps": [],
-        }
-
-    # STEP 2: Verify tsh is installed
-    install_check = check_tsh_installed()
-    if not install_check["installed"]:
-        return {
-            "success": False,
-            "cluster": cluster,
-            "node": node,
-            "user": user,
-            "accessible": False,
-            "message": "❌ tsh is not installed",
-            "ansible_command": install_check["ansible_command"],
-            "ansible_steps": install_check["ansible_steps"],
-        }
+    # STEP 1-2: Cluster allow-list, tsh install and login checks (@_tsh_tool)
 
     # STEP 3: Test SSH connection with a simple command
     # We run: tsh ssh --cluster=X user@node "echo test"
     target = f"{user}@{node}"
-    command = [
-        TSH_BINARY_PATH,
-        "ssh",
-        f"--cluster={cluster}",
-        target,
-        "echo test",
-    ]
 
     try:
-        result = subprocess.run(
-            command,
-            shell=False,
-            capture_output=True,
-            text=True,
-            timeout=15,
+        result, failure = _run_tsh(
+            ["ssh", f"--cluster={cluster}", target, "echo test"], timeout=15
         )
 
         if result.returncode == 0 and "test" in result.stdout:
@@ -943,11 +1566,10 @@ def verify_ssh_access(cluster: str, node: str, user: str = "root") -> Dict[str,
                 "accessible": True,
                 "message": f"✅ Successfully connected to {user}@{node} via {cluster}",
                 "ansible_command": None,
-                "ansible_steps": [],
+                "ansible_steps": _EMPTY_STEPS,
             }
         else:
-            stderr = result.stderr.lower()
-            if "not logged in" in stderr or "please login" in stderr:
+            if failure == "login":
                 return {
                     "success": False,
                     "cluster": cluster,
@@ -991,7 +1613,7 @@ def verify_ssh_access(cluster: str, node: str, user: str = "root") -> Dict[str,
                 f"Verify node is responsive: tsh ssh --cluster={cluster} {target}",
             ],
         }
-    except Exception as e:
+    except (OSError, subprocess.SubprocessError, ValueError) as e:
         return {
             "success": False,
             "cluster": cluster,
@@ -1006,8 +1628,141 @@ def verify_ssh_access(cluster: str, node: str, user: str = "root") -> Dict[str,
         }
 
 
+# Cap on how much remote output run_remote_command keeps (per stream)
+# ANALOGY: Like piping through `head -c 1M` - the rest is read and thrown away
+REMOTE_OUTPUT_MAX_BYTES = 1024 * 1024
+
+
+def _drain_capped(
+    stream, limit: int, sink: Dict[str, Any], stop: threading.Event
+) -> None:
+    """
+    Read `stream` to EOF (or until `stop` is set), keeping at most `limit`
+    bytes and counting the rest.
+
+    sink["data"] and sink["dropped"] are updated as chunks arrive, so a
+    caller that stops waiting still has everything read so far. Waiting
+    with a short timeout (rather than a blocking read) lets `stop` end the
+    loop even while a grandchild keeps the pipe open without writing.
+    DefaultSelector (epoll/poll) has no FD_SETSIZE limit, unlike select().
+    """
+    kept = sink["data"] = bytearray()
+    sink["dropped"] = 0
+    fd = stream.fileno()
+    with selectors.DefaultSelector() as selector:
+        selector.register(fd, selectors.EVENT_READ)
+        while not stop.is_set():
+            if not selector.select(0.1):
+                continue
+            chunk = os.read(fd, 65536)
+            if not chunk:
+                break
+            room = limit - len(kept)
+            if room > 0:
+                kept += chunk[:room]
+            sink["dropped"] += max(0, len(chunk) - max(room, 0))
+
+
+def _run_capped(
+    command: List[str], timeout: int, max_bytes: int
+) -> Tuple[int, str, str]:
+    """
+    Run `command` and return (returncode, stdout, stderr), each capped at `max_bytes`.
+
+    subprocess.run(capture_output=True) holds the child's whole output in
+    memory, then decodes a second copy. Here both pipes are drained by
+    their own thread (so a chatty stderr can't stall stdout), only the first
+    `max_bytes` of each are kept, and a marker says how much was dropped.
+
+    Raises subprocess.TimeoutExpired (after killing the child) like subprocess.run,
+    with the output read up to that point in its stdout/stderr.
+    """
+    proc = subprocess.Popen(
+        command,
+        shell=False,  # CRITICAL: No shell=True
+        # Never let tsh read our stdin: under MCP's stdio transport that is
+        # the JSON-RPC stream, and a tsh prompt would swallow requests
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        start_new_session=True,
+    )
+    out: Dict[str, Any] = {}
+    err: Dict[str, Any] = {}
+    stop = threading.Event()
+    readers = [
+        threading.Thread(
+            target=_drain_capped, args=(stream, max_bytes, sink, stop), daemon=True
+        )
+        for stream, sink in ((proc.stdout, out), (proc.stderr, err))
+    ]
+    for reader in readers:
+        reader.start()
+
+    # The readers hit EOF the moment the child exits, so wait on them rather
+    # than on the child - no extra thread, no poll delay. Short joins let us
+    # notice a child that has exited while a grandchild still holds a pipe.
+    deadline = time.monotonic() + timeout
+    for reader in readers:
+        while reader.is_alive() and proc.poll() is None:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            reader.join(min(remaining, 0.1))
+
+    timed_out = False
+    try:
+        proc.wait(timeout=max(0, deadline - time.monotonic()))
+    except subprocess.TimeoutExpired:
+        timed_out = True
+        _kill_group(proc)
+        proc.wait()
+    # Bounded join (5 s in total): a grandchild holding a pipe must not hang us
+    deadline = time.monotonic() + 5
+    for reader in readers:
+        reader.join(timeout=max(0, deadline - time.monotonic()))
+    # Readers still running after that: stop them, keep what they read so far
+    stop.set()
+    for reader in readers:
+        reader.join()
+    proc.stdout.close()
+    proc.stderr.close()
+
+    def _decode(sink: Dict[str, Any]) -> str:
+        text = sink.get("data", b"").decode("utf-8", errors="replace")
+        if sink.get("dropped"):
+            text += (
+                f"\n... [output truncated: {sink['dropped']} bytes omitted,"
+                f" limit {max_bytes} bytes]"
+            )
+        return text
+
+    stdout, stderr = _decode(out), _decode(err)
+    if timed_out:
+        # Keep what arrived before the kill - often the part worth seeing
+        raise subprocess.TimeoutExpired(command, timeout, output=stdout, stderr=stderr)
+    return proc.returncode, stdout, stderr
+
+
+@_tsh_tool(
+    lambda a: {
+        "success": False,
+        "cluster": a["cluster"],
+        "node": a["node"],
+        "user": a["user"],
+        "command": a["command"],
+        "exit_code": None,
+        "stdout": "",
+        "stderr": "",
+    }
+)
 def run_remote_command(
-    cluster: str, node: str, command: str, user: str = "root", timeout: int = 30
+    cluster: str,
+    node: str,
+    command: str,
+    user: str = "root",
+    timeout: int = 30,
+    max_bytes: int = REMOTE_OUTPUT_MAX_BYTES,
 ) -> Dict[str, Any]:
     """
     Execute a command on a remote node via Teleport SSH.
@@ -1022,6 +1777,8 @@ def run_remote_command(
         command: Command to execute (e.g., "kubectl get pods")
         user: SSH user (default: "root")
         timeout: Command timeout in seconds (default: 30)
+        max_bytes: Max stdout/stderr bytes kept; the rest is dropped with a
+                   truncation marker (default: 1 MiB)
 
     Returns:
         dict: Command execution results
@@ -1073,25 +1830,12 @@ def run_remote_command(
     - Command is passed as a single argument (no shell parsing on remote)
     - Uses shlex.quote() to prevent injection
     - Timeout prevents runaway commands
+    - Output size is capped (a runaway command can't exhaust server memory)
     - User must be explicitly specified
     """
 
     # STEP 1: Validate inputs
-    if cluster not in ALLOWED_TELEPORT_CLUSTERS:
-        return {
-            "success": False,
-            "cluster": cluster,
-            "node": node,
-            "user": user,
-            "command": command,
-            "exit_code": None,
-            "stdout": "",
-            "stderr": "",
-            "message": f"❌ Invalid cluster. Must be one of: {ALLOWED_TELEPORT_CLUSTERS}",
-            "ansible_command": None,
-            "ansible_steps": [],
-        }
-
+    # (cluster allow-list, tsh install and login checks: @_tsh_tool)
     if not command or not command.strip():
         return {
             "success": False,
@@ -1104,24 +1848,7 @@ def run_remote_command(
             "stderr": "",
             "message": "❌ Command cannot be empty",
             "ansible_command": None,
-            "ansible_steps": [],
-        }
-
-    # STEP 2: Verify tsh is installed
-    install_check = check_tsh_installed()
-    if not install_check["installed"]:
-        return {
-            "success": False,
-            "cluster": cluster,
-            "node": node,
-            "user": user,
-            "command": command,
-            "exit_code": None,
-            "stdout": "",
-            "stderr": "",
-            "message": "❌ tsh is not installed",
-            "ansible_command": install_check["ansible_command"],
-            "ansible_steps": install_check["ansible_steps"],
+            "ansible_steps": _EMPTY_STEPS,
         }
 
     # STEP 3: Build and execute SSH command
@@ -1130,7 +1857,7 @@ def run_remote_command(
 
     # Build command as list (safe from injection)
     tsh_command = [
-        TSH_BINARY_PATH,
+        _tsh_binary(),
         "ssh",
         f"--cluster={cluster}",
         target,
@@ -1138,58 +1865,53 @@ def run_remote_command(
     ]
 
     try:
-        result = subprocess.run(
-            tsh_command,
-            shell=False,  # CRITICAL: No shell=True
-            capture_output=True,
-            text=True,
-            timeout=timeout,
-        )
+        returncode, stdout, stderr_text = _run_capped(tsh_command, timeout, max_bytes)
 
         # STEP 4: Build response based on exit code
-        if result.returncode == 0:
+        if returncode == 0:
             return {
                 "success": True,
                 "cluster": cluster,
                 "node": node,
                 "user": user,
                 "command": command,
-                "exit_code": result.returncode,
-                "stdout": result.stdout,
-                "stderr": result.stderr,
+                "exit_code": returncode,
+                "stdout": stdout,
+                "stderr": stderr_text,
                 "message": "✅ Command executed successfully",
                 "ansible_command": None,
-                "ansible_steps": [],
+                "ansible_steps": _EMPTY_STEPS,
             }
         else:
             # Check if it's an SSH/auth issue vs command failure
-            stderr = result.stderr.lower()
-            if "not logged in" in stderr or "please login" in stderr:
+            kind = _classify_stderr(stderr_text)
+            if kind == "login":
+                _forget_login()
                 return {
                     "success": False,
                     "cluster": cluster,
                     "node": node,
                     "user": user,
                     "command": command,
-                    "exit_code": result.returncode,
-                    "stdout": result.stdout,
-                    "stderr": result.stderr,
+                    "exit_code": returncode,
+                    "stdout": stdout,
+                    "stderr": stderr_text,
                     "message": f"❌ Not logged into {cluster} cluster",
                     "ansible_command": None,
                     "ansible_steps": [
                         f"tsh login --proxy=teleport.tw.ee:443 --auth=okta {cluster}"
                     ],
                 }
-            elif "connection" in stderr or "cannot connect" in stderr:
+            elif kind == "connection":
                 return {
                     "success": False,
                     "cluster": cluster,
                     "node": node,
                     "user": user,
                     "command": command,
-                    "exit_code": result.returncode,
-                    "stdout": result.stdout,
-                    "stderr": result.stderr,
+                    "exit_code": returncode,
+                    "stdout": stdout,
+                    "stderr": stderr_text,
                     "message": f"❌ Cannot connect to {user}@{node}",
                     "ansible_command": None,
                     "ansible_steps": [
@@ -1205,10 +1927,10 @@ def run_remote_command(
                     "node": node,
                     "user": user,
                     "command": command,
-                    "exit_code": result.returncode,
-                    "stdout": result.stdout,
-                    "stderr": result.stderr,
-                    "message": f"❌ Command failed with exit code {result.returncode}",
+                    "exit_code": returncode,
+                    "stdout": stdout,
+                    "stderr": stderr_text,
+                    "message": f"❌ Command failed with exit code {returncode}",
                     "ansible_command": None,
                     "ansible_steps": [
                         "Check stderr output above for error details",
@@ -1216,7 +1938,7 @@ def run_remote_command(
                     ],
                 }
 
-    except subprocess.TimeoutExpired:
+    except subprocess.TimeoutExpired as e:
         return {
             "success": False,
             "cluster": cluster,
@@ -1224,8 +1946,9 @@ def run_remote_command(
             "user": user,
             "command": command,
             "exit_code": None,
-            "stdout": "",
-            "stderr": "",
+            # Partial output: whatever the command printed before it was killed
+            "stdout": e.stdout or "",
+            "stderr": e.stderr or "",
             "message": f"❌ Command timed out after {timeout} seconds",
             "ansible_command": None,
             "ansible_steps": [
@@ -1233,7 +1956,7 @@ def run_remote_command(
                 "Consider increasing timeout for long-running commands",
             ],
         }
-    except Exception as e:
+    except (OSError, subprocess.SubprocessError, ValueError) as e:
         return {
             "success": False,
             "cluster": cluster,
@@ -1251,88 +1974,131 @@ def run_remote_command(
         }
 
 
-def list_kube_contexts() -> str:
+# Default kubeconfig location, expanded once (expanduser does a passwd lookup)
+_DEFAULT_KUBECONFIG = os.path.expanduser("~/.kube/config")
+
+
+def _kubeconfig_paths() -> List[str]:
+    """Kubeconfig files in kubectl's lookup order ($KUBECONFIG, else ~/.kube/config)."""
+    env = os.environ.get("KUBECONFIG")
+    if env:
+        return [p for p in env.split(os.pathsep) if p]
+    return [_DEFAULT_KUBECONFIG]
+
+
+# Parsed context names, keyed by kubeconfig paths + their mtimes
+_KUBECONFIG_CACHE: Dict[str, Any] = {"key": None, "contexts": None}
+
+
+def list_kube_contexts() -> Dict[str, Any]:
     """
     List all available Kubernetes contexts from your kubeconfig.
 
     This is a READ-ONLY tool. It doesn't change anything, just shows info.
     Think of it like running `ls` - it's safe because it only looks, never touches.
 
+    The kubeconfig is read directly (same file lookup and merge rules as
+    `kubectl config get-contexts -o name`) instead of starting kubectl, and
+    the result is cached until one of the files changes.
+
     Returns:
-        str: A newline-separated list of context names (e.g., "prod\\nstaging\\ndev")
+        dict: Context names as a list (sorted, like kubectl prints them)
+        {
+            "success": bool,
+            "contexts": List[str],
+            "message": str,
+            "ansible_command": str,
+            "ansible_steps": List[str]
+        }
 
-    Example Output:
-        homelab-admin@homelab
-        docker-desktop
-        kind-local
+    Example Response:
+        {
+            "success": true,
+            "contexts": ["docker-desktop", "homelab-admin@homelab", "kind-local"],
+            "message": "✅ Found 3 Kubernetes context(s)",
+            "ansible_command": null,
+            "ansible_steps": []
+        }
 
     SECURITY NOTES:
     - No user input is accepted (no injection risk)
-    - Uses shell=False (prevents command injection)
+    - No subprocess at all (nothing to inject into)
     - Read-only operation (can't break anything)
+    - yaml safe loader only (no arbitrary object construction)
     """
 
-    # STEP 1: Define the command as a list
-    # ANALOGY: This is like writing each argument on a separate line in a script
-    # We do this instead of a string to prevent shell injection attacks
-    # BAD:  "kubectl config get-contexts -o name"  <- could be manipulated
-    # GOOD: ["kubectl", "config", "get-contexts", "-o", "name"]  <- safe!
-    command = ["kubectl", "config", "get-contexts", "-o", "name"]
+    # STEP 1: Find the kubeconfig files and their mtimes
+    # ANALOGY: Like `ls -l` on the files before deciding whether to re-read them
+    # Missing entries in $KUBECONFIG are skipped, same as kubectl does
+    paths = _kubeconfig_paths()
+    stamps = []
+    for path in paths:
+        try:
+            stamps.append((path, os.stat(path).st_mtime_ns))
+        except FileNotFoundError:
+            continue
+
+    if not stamps:
+        return {
+            "success": False,
+            "contexts": [],
+            "message": f"❌ kubeconfig not found (looked in: {os.pathsep.join(paths)})",
+            "ansible_command": None,
+            "ansible_steps": ["Set KUBECONFIG or create ~/.kube/config"],
+        }
 
-    try:
-        # STEP 2: Run the command safely
-        # ANALOGY: This is like running a command in a sandbox
-        # - shell=False: Don't use the shell (prevents injection)
-        # - capture_output=True: Grab the output so we can return it
-        # - text=True: Treat output as text (not raw bytes)
-        # - check=True: Raise an error if command fails (like `set -e` in Bash)
-        result = subprocess.run(
-            command,
-            shell=False,  # CRITICAL: Never use shell=True with user input!
-            capture_output=True,  # Capture stdout and stderr
-            text=True,  # Return strings, not bytes
-            check=True,  # Raise exception if command fails
-        )
+    # STEP 2: Serve from cache if nothing changed
+    key = tuple(stamps)
+    if _KUBECONFIG_CACHE["key"] == key:
+        contexts = _KUBECONFIG_CACHE["contexts"]
+    else:
+        try:
+            contexts = _read_kube_contexts(stamps)
+        except (OSError, ValueError) as e:
+            # Not cached: the next call re-reads once the file is fixed
+            return {
+                "success": False,
+                "contexts": [],
+                "message": f"❌ Error reading kubeconfig: {e}",
+                "ansible_command": None,
+                "ansible_steps": [
+                    "Check the kubeconfig is valid YAML: kubectl config view"
+                ],
+            }
+        _KUBECONFIG_CACHE.update({"key": key, "contexts": contexts})
 
-        # STEP 3: Return the output
-        # .strip() removes leading/trailing whitespace (like `trim()`)
-        return result.stdout.strip()
+    # STEP 3: Return a fresh list (callers may mutate it; the cache must not change)
+    return {
+        "success": True,
+        "contexts": list(contexts),
+        "message": f"✅ Found {len(contexts)} Kubernetes context(s)",
+        "ansible_command": None,
+        "ansible_steps": _EMPTY_STEPS,
+    }
 
-    except subprocess.CalledProcessError as e:
-        # STEP 4: Handle errors gracefully
-        # ANALOGY: This is like `trap` in Bash - catch errors and report them nicely
-        # The AI will see this error message and can tell the user what went wrong
-        return f"Error running kubectl: {e.stderr}"
-
-    except FileNotFoundError:
-        # STEP 5: Handle missing commands
-        # If kubectl isn't installed, tell the AI clearly
-        return "Error: kubectl command not found. Is kubectl installed and in PATH?"
-# =============================================================================
-# CONSTANTS: Configuration Values
-# =============================================================================
 
-# Ansible-mac repository path
-# ANALOGY: This is like setting a variable at the top of a Bash script
-ANSIBLE_MAC_PATH = os.path.expanduser("~/personal/git/ansible-mac")
+def _read_kube_contexts(stamps: List[Tuple[str, int]]) -> Tuple[str, ...]:
+    """
+    Parse kubeconfig files and return their merged context names, sorted.
 
-# Allowed Teleport clusters (security: only these are permitted)
-# ANALOGY: Like an allow-list in a firewall rule
-# Architecture: 3 environments
-#   - "staging": Lower environment for testing
-#   - "production": Production workloads
-#   - "shared-services": Privileged infrastructure cluster (can access both staging & production)
-#                        This is where K8s/Flux infrastructure runs
-ALLOWED_TELEPORT_CLUSTERS = ["staging", "production", "shared-service"]
+    Raises OSError if a file can't be read, ValueError if it isn't valid YAML.
+    """
 
-# Expected tsh binary path
-TSH_BINARY_PATH = "/usr/local/bin/tsh"
-# =============================================================================
-# V1a TOOLS: Teleport Discovery & Version Management
-# =============================================================================
-# These tools check Teleport installation and compatibility BEFORE attempting
-# any operations. They provide intelligent guidance on how to fix issues using
-# Ansible.
-#
-# Philosophy: "Check, don't change" - these are read-only discovery tools that
-# give the AI (and user) full visibility into the environment state.
+    # Deferred import: only this tool needs yaml in the platform layer
+    import yaml
+
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    names = set()
+    try:
+        for path, _ in stamps:
+            with open(path, "r") as f:
+                config = yaml.load(f, Loader=loader) or {}
+            for context in config.get("contexts") or []:
+                if isinstance(context, dict) and context.get("name"):
+                    names.add(str(context["name"]))
+    except (yaml.YAMLError, AttributeError) as e:
+        # AttributeError: file parsed but isn't a mapping
+        raise ValueError(str(e)) from e
+
+    # Sorted, matching kubectl's output order
+    return tuple(sorted(names))
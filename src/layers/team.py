@@ -10,14 +10,182 @@ import json
 import os
 import re
 import shlex
-import subprocess
-from datetime import datetime
-from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
 from typing import Any, Dict, List, Optional
 
 from . import platform
 
+try:
+    import orjson
+except ImportError:  # optional speed-up - stdlib json is the fallback
+    orjson = None
+
+# kubectl -o json documents run to megabytes on busy clusters; orjson parses
+# them several times faster. Its JSONDecodeError subclasses json's, so the
+# existing `except json.JSONDecodeError` handlers still apply.
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+# Output cap for kubectl `-o json` reads. A truncated JSON document can't be
+# parsed at all, so these get more room than run_remote_command's default
+# (REMOTE_OUTPUT_MAX_BYTES, sized for human-readable output).
+KUBECTL_JSON_MAX_BYTES = 32 * 1024 * 1024
+
+# How long list_flux_kustomizations results are reused (seconds)
+# Reconcile/suspend/resume clear it, so only out-of-band changes (a git push
+# being applied) can be up to this old.
+FLUX_LIST_TTL = 30
+
+# How long the other read-only Flux tools' results are reused (seconds)
+# Short: these back an AI exploring one object - repeated identical calls
+# within a few seconds share one SSH round-trip. Logs move fastest.
+FLUX_READ_TTL = 10
+FLUX_LOGS_TTL = 5
+
+# Flux controllers get_flux_logs may read (the flux-system deployments)
+_ALLOWED_FLUX_COMPONENTS = frozenset(
+    {
+        "kustomize-controller",
+        "source-controller",
+        "helm-controller",
+        "notification-controller",
+    }
+)
+
+# get_flux_logs bounds: the apiserver applies --tail/--limit-bytes before
+# anything crosses SSH, so a noisy controller can't flood the session
+FLUX_LOGS_MAX_TAIL = 10000
+FLUX_LOGS_DEFAULT_BYTES = 256 * 1024
+
+# How much status detail goes back to the model - it all lands in the AI's
+# context. Conditions keep only these fields (one condition per type, so the
+# cap rarely bites); events keep the newest MAX_EVENTS.
+MAX_DETAIL_CONDITIONS = 5
+_CONDITION_FIELDS = ("type", "status", "reason", "message", "lastTransitionTime")
+MAX_EVENTS = 50
+
+# Kubernetes object names (DNS-1123 subdomain) and namespaces (DNS-1123
+# label). Both allow only [a-z0-9.-], so validated values go into the remote
+# command as-is - there is nothing in them for the shell to interpret.
+_K8S_NAME_RE = re.compile(
+    r"[a-z0-9]([-a-z0-9]*[a-z0-9])?(\.[a-z0-9]([-a-z0-9]*[a-z0-9])?)*"
+)
+_K8S_NAMESPACE_RE = re.compile(r"[a-z0-9]([-a-z0-9]*[a-z0-9])?")
+
+# kubectl --since duration, e.g. "5m", "1h30m", "90s"
+_KUBECTL_DURATION_RE = re.compile(r"(?:\d+(?:\.\d+)?(?:h|m|s|ms))+")
+
+# Team resource files, resolved once at import
+_PI_TEAM_RULES_PATH = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "resources/pi_team_rules.md"
+)
+
+
+def _clear_flux_read_caches() -> None:
+    """Forget every cached Flux read - called after reconcile/suspend/resume."""
+    for tool in (
+        list_flux_kustomizations,
+        get_kustomization_details,
+        list_flux_sources,
+        get_flux_overview,
+        get_flux_logs,
+        _namespace_events,
+    ):
+        tool.cache_clear()
+
+
+def _resp(
+    ctx: Dict[str, Any], success: bool, message: str, **extra: Any
+) -> Dict[str, Any]:
+    """
+    Build a tool response: the per-call context fields plus the usual keys.
+
+    `extra` adds tool-specific fields and may override the ansible_* defaults.
+    """
+    return {
+        "success": success,
+        **ctx,
+        "message": message,
+        "ansible_command": None,
+        "ansible_steps": [],
+        **extra,
+    }
+
+
+def _is_int_in(value: Any, low: int, high: int) -> bool:
+    """True for an int in [low, high] - bool (an int subclass) is rejected."""
+    return type(value) is int and low <= value <= high
+
+
+def _k8s_name_error(name: Any, namespace: Any) -> Optional[str]:
+    """Why name/namespace aren't valid Kubernetes names, or None if they are."""
+    if not (
+        isinstance(name, str) and len(name) <= 253 and _K8S_NAME_RE.fullmatch(name)
+    ):
+        return f"Invalid name {name!r}: use lowercase letters, digits, '-' and '.'"
+    if not (
+        isinstance(namespace, str)
+        and len(namespace) <= 63
+        and _K8S_NAMESPACE_RE.fullmatch(namespace)
+    ):
+        return f"Invalid namespace {namespace!r}: use lowercase letters, digits and '-'"
+    return None
+
+
+def _conditions_by_type(status: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+    """status.conditions as {type: condition} - Kubernetes keeps one per type."""
+    return {c.get("type"): c for c in status.get("conditions") or []}
+
+
+def _kustomization_summary(
+    item: Dict[str, Any], show_suspend: bool = False
+) -> Dict[str, Any]:
+    """One Kustomization object -> the fields list_flux_kustomizations reports."""
+    spec = item.get("spec", {})
+    status = item.get("status", {})
+
+    # Get ready condition
+    ready_condition = _conditions_by_type(status).get("Ready", {})
+
+    metadata = item["metadata"]
+
+    kustomization_info = {
+        "name": metadata["name"],
+        "namespace": metadata["namespace"],
+        "ready": ready_condition.get("status", "Unknown"),
+        "message": ready_condition.get("message", ""),
+        "last_applied_revision": status.get("lastAppliedRevision", "N/A"),
+    }
+
+    # Optionally include suspend status
+    if show_suspend:
+        kustomization_info["suspended"] = spec.get("suspend", False)
+
+    return kustomization_info
+
 
+def _source_summary(item: Dict[str, Any]) -> Dict[str, Any]:
+    """One GitRepository object -> the fields list_flux_sources reports."""
+    spec = item.get("spec", {})
+    status = item.get("status", {})
+
+    # Get ready condition
+    ready_condition = _conditions_by_type(status).get("Ready", {})
+
+    metadata = item["metadata"]
+
+    return {
+        "name": metadata["name"],
+        "namespace": metadata["namespace"],
+        "url": spec.get("url", "N/A"),
+        "ref": spec.get("ref", {}),
+        "ready": ready_condition.get("status", "Unknown"),
+        "message": ready_condition.get("message", ""),
+        "artifact": status.get("artifact", {}).get("revision", "N/A"),
+    }
+
+
+@platform.ttl_cache(FLUX_LIST_TTL, stale_for=platform.STALE_RESULT_TTL)
 def list_flux_kustomizations(
     cluster: str, node: str, show_suspend: bool = False
 ) -> Dict[str, Any]:
@@ -78,8 +246,14 @@ def list_flux_kustomizations(
     - Input validation on cluster names
     - Uses run_remote_command() which has its own security checks
     - Command is hardcoded (no user input in kubectl command)
+    - Read-only: results reused for FLUX_LIST_TTL seconds, cleared by
+      reconcile/suspend/resume; a failed refresh may return the last good
+      listing marked "stale"
     """
 
+    # Fields every response carries
+    ctx = {"cluster": cluster, "node": node}
+
     # STEP 1: Build kubectl command
     kubectl_command = (
         "sudo kubectl get kustomizations.kustomize.toolkit.fluxcd.io -A -o json"
@@ -87,7 +261,12 @@ def list_flux_kustomizations(
 
     # STEP 2: Execute command via SSH
     result = platform.run_remote_command(
-        cluster, node, kubectl_command, user="stephen.tan", timeout=30
+        cluster,
+        node,
+        kubectl_command,
+        user="stephen.tan",
+        timeout=30,
+        max_bytes=KUBECTL_JSON_MAX_BYTES,
     )
 
     if not result["success"]:
@@ -96,48 +275,19 @@ def list_flux_kustomizations(
 
     # STEP 3: Parse JSON output
     try:
-        data = json.loads(result["stdout"])
+        data = _json_loads(result["stdout"])
         kustomizations = []
 
         for item in data.get("items", []):
-            name = item["metadata"]["name"]
-            namespace = item["metadata"]["namespace"]
-            spec = item.get("spec", {})
-            status = item.get("status", {})
-
-            # Get ready condition
-            ready = "Unknown"
-            message = ""
-            for condition in status.get("conditions", []):
-                if condition.get("type") == "Ready":
-                    ready = condition.get("status", "Unknown")
-                    message = condition.get("message", "")
-                    break
-
-            kustomization_info = {
-                "name": name,
-                "namespace": namespace,
-                "ready": ready,
-                "message": message,
-                "last_applied_revision": status.get("lastAppliedRevision", "N/A"),
-            }
-
-            # Optionally include suspend status
-            if show_suspend:
-                kustomization_info["suspended"] = spec.get("suspend", False)
-
-            kustomizations.append(kustomization_info)
+            kustomizations.append(_kustomization_summary(item, show_suspend))
 
         # STEP 4: Return results
-        return {
-            "success": True,
-            "cluster": cluster,
-            "node": node,
-            "kustomizations": kustomizations,
-            "message": f"✅ Found {len(kustomizations)} Kustomization(s)",
-            "ansible_command": None,
-            "ansible_steps": [],
-        }
+        return _resp(
+            ctx,
+            True,
+            f"✅ Found {len(kustomizations)} Kustomization(s)",
+            kustomizations=kustomizations,
+        )
 
     except json.JSONDecodeError as e:
         # Check if Flux might not be installed
@@ -145,47 +295,149 @@ def list_flux_kustomizations(
             "error" in result["stderr"].lower()
             or "not found" in result["stderr"].lower()
         ):
-            return {
-                "success": False,
-                "cluster": cluster,
-                "node": node,
-                "kustomizations": [],
-                "message": "❌ Flux may not be installed on this cluster",
-                "ansible_command": None,
-                "ansible_steps": [
+            return _resp(
+                ctx,
+                False,
+                "❌ Flux may not be installed on this cluster",
+                kustomizations=[],
+                ansible_steps=[
                     f"Verify Flux is installed: tsh ssh --cluster={cluster} root@{node} 'flux check'",
                     "Check kubectl access works: kubectl get ns flux-system",
                 ],
-                "raw_error": result.get("stderr", ""),
-            }
+                raw_error=result.get("stderr", ""),
+            )
         else:
-            return {
-                "success": False,
-                "cluster": cluster,
-                "node": node,
-                "kustomizations": [],
-                "message": f"❌ Error parsing kubectl output: {str(e)}",
-                "ansible_command": None,
-                "ansible_steps": [
+            return _resp(
+                ctx,
+                False,
+                f"❌ Error parsing kubectl output: {str(e)}",
+                kustomizations=[],
+                ansible_steps=[
                     "Command executed but output was not valid JSON",
                     f"Try manually: tsh ssh --cluster={cluster} root@{node} 'flux get kustomizations'",
                 ],
-                "raw_output": result.get("stdout", "")[:500],  # First 500 chars
-            }
+                raw_output=result.get("stdout", "")[:500],  # First 500 chars
+            )
     except Exception as e:
-        return {
-            "success": False,
-            "cluster": cluster,
-            "node": node,
-            "kustomizations": [],
-            "message": f"❌ Unexpected error: {str(e)}",
-            "ansible_command": None,
-            "ansible_steps": [
+        return _resp(
+            ctx,
+            False,
+            f"❌ Unexpected error: {str(e)}",
+            kustomizations=[],
+            ansible_steps=[
                 f"Try manually: tsh ssh --cluster={cluster} root@{node} 'flux get kustomizations'"
             ],
+        )
+
+
+# Most nodes a batch tool will query in one call (one tsh ssh process each)
+MAX_BATCH_NODES = 10
+
+# Shared worker threads for the batch tools' fan-out. Created once, so a
+# batch call doesn't start (and tear down) its own pool, and concurrent
+# batch calls together stay within MAX_BATCH_NODES SSH sessions.
+_IO_POOL = ThreadPoolExecutor(max_workers=MAX_BATCH_NODES, thread_name_prefix="flux-io")
+
+
+def list_flux_kustomizations_batch(
+    cluster: str, nodes: List[str], show_suspend: bool = False
+) -> Dict[str, Any]:
+    """
+    List Flux Kustomizations on several nodes at once.
+
+    Runs list_flux_kustomizations() for every node concurrently, so the
+    whole batch takes about as long as the slowest node instead of the sum
+    of all SSH round-trips.
+
+    ANALOGY: Like `parallel tsh ssh ... ::: node-a node-b` instead of a for-loop
+
+    Args:
+        cluster: Teleport cluster name ["staging", "production"]
+        nodes: K8s node hostnames (duplicates are queried once, max 10)
+        show_suspend: Include suspend status in output (default: False)
+
+    Returns:
+        dict: Per-node results, each shaped like list_flux_kustomizations()
+        {
+            "success": bool,           # True only if every node succeeded
+            "cluster": str,
+            "results": Dict[str, Dict],  # node -> list_flux_kustomizations() result
+            "failed_nodes": List[str],
+            "message": str,
+            "ansible_command": str,
+            "ansible_steps": List[str]
         }
 
+    SECURITY NOTES:
+    - Cluster validated before any SSH session is opened
+    - Batch size capped (MAX_BATCH_NODES) so one call can't fan out unbounded
+    - Each node goes through list_flux_kustomizations() and its checks
+    """
+
+    # Fields every response carries
+    ctx = {"cluster": cluster}
+
+    # STEP 1: Validate input
+    if cluster not in platform.ALLOWED_TELEPORT_CLUSTERS:
+        return _resp(
+            ctx, False, platform.INVALID_CLUSTER_MESSAGE, results={}, failed_nodes=[]
+        )
+
+    if not isinstance(nodes, (list, tuple)) or not all(
+        isinstance(node, str) for node in nodes
+    ):
+        return _resp(
+            ctx,
+            False,
+            "❌ nodes must be a list of node hostnames (strings)",
+            results={},
+            failed_nodes=[],
+        )
+
+    # dict.fromkeys: drop duplicates, keep the caller's order
+    unique_nodes = list(dict.fromkeys(nodes))
+    if not unique_nodes or len(unique_nodes) > MAX_BATCH_NODES:
+        return _resp(
+            ctx,
+            False,
+            f"❌ Provide between 1 and {MAX_BATCH_NODES} node(s), got {len(unique_nodes)}",
+            results={},
+            failed_nodes=[],
+        )
+
+    # STEP 2: Query every node concurrently
+    node_results = list(
+        _IO_POOL.map(
+            lambda node: list_flux_kustomizations(cluster, node, show_suspend),
+            unique_nodes,
+        )
+    )
+
+    # STEP 3: Summarize
+    results = dict(zip(unique_nodes, node_results))
+    failed_nodes = [node for node, r in results.items() if not r["success"]]
+    total = sum(len(r.get("kustomizations", [])) for r in node_results)
+
+    if failed_nodes:
+        message = f"⚠️  {len(failed_nodes)} of {len(unique_nodes)} node(s) failed: {', '.join(failed_nodes)}"
+        ansible_steps = ["Check each failed node's result for details"]
+    else:
+        message = (
+            f"✅ Found {total} Kustomization(s) across {len(unique_nodes)} node(s)"
+        )
+        ansible_steps = []
+
+    return _resp(
+        ctx,
+        not failed_nodes,
+        message,
+        results=results,
+        failed_nodes=failed_nodes,
+        ansible_steps=ansible_steps,
+    )
 
+
+@platform.ttl_cache(FLUX_READ_TTL)
 def get_kustomization_details(
     cluster: str, node: str, name: str, namespace: str = "flux-system"
 ) -> Dict[str, Any]:
@@ -219,7 +471,8 @@ def get_kustomization_details(
                 "path": str,
                 "interval": str,
                 "last_applied_revision": str,
-                "conditions": List[dict]
+                "last_handled_reconcile_at": str,  # matches reconcile's requested_at once handled
+                "conditions": List[dict]  # type/status/reason/message/lastTransitionTime, at most 5
             },
             "message": str,
             "ansible_command": str,
@@ -254,8 +507,8 @@ def get_kustomization_details(
 
     SECURITY NOTES:
     - Input validation on cluster names
-    - Uses shlex.quote() for name/namespace to prevent injection
-    - Read-only operation (just queries state)
+    - name/namespace must be valid Kubernetes names (rejected otherwise)
+    - Read-only operation (results reused for FLUX_READ_TTL seconds)
 
     DESIGN VALIDATION (MW-002 Step 2):
     - Layer: TEAM (Flux-specific)
@@ -265,37 +518,41 @@ def get_kustomization_details(
     - Red flags: None detected
     """
 
-    # Safely quote user inputs to prevent injection
-    safe_name = shlex.quote(name)
-    safe_namespace = shlex.quote(namespace)
+    # Fields every response carries
+    ctx = {"cluster": cluster, "node": node, "name": name, "namespace": namespace}
+
+    # Validate name/namespace before they reach the remote shell
+    error = _k8s_name_error(name, namespace)
+    if error:
+        return _resp(ctx, False, f"❌ {error}", details={})
 
     # Build kubectl command to get kustomization details as JSON
-    kubectl_command = (
-        f"sudo kubectl get kustomization {safe_name} -n {safe_namespace} -o json"
-    )
+    kubectl_command = f"sudo kubectl get kustomization {name} -n {namespace} -o json"
 
     # Execute command via Platform primitive
     result = platform.run_remote_command(
-        cluster=cluster, node=node, command=kubectl_command, user="root", timeout=30
+        cluster=cluster,
+        node=node,
+        command=kubectl_command,
+        user="root",
+        timeout=30,
+        max_bytes=KUBECTL_JSON_MAX_BYTES,
     )
 
     # Check if command failed
     if not result["success"]:
-        return {
-            "success": False,
-            "cluster": cluster,
-            "node": node,
-            "name": name,
-            "namespace": namespace,
-            "details": {},
-            "message": f"❌ Failed to get kustomization details: {result['message']}",
-            "ansible_command": result.get("ansible_command"),
-            "ansible_steps": result.get("ansible_steps", []),
-        }
+        return _resp(
+            ctx,
+            False,
+            f"❌ Failed to get kustomization details: {result['message']}",
+            details={},
+            ansible_command=result.get("ansible_command"),
+            ansible_steps=result.get("ansible_steps", []),
+        )
 
     # Parse JSON output
     try:
-        kustomization = json.loads(result["stdout"])
+        kustomization = _json_loads(result["stdout"])
 
         # Extract key details
         spec = kustomization.get("spec", {})
@@ -309,78 +566,85 @@ def get_kustomization_details(
             "prune": spec.get("prune", False),
             "last_applied_revision": status.get("lastAppliedRevision", ""),
             "last_attempted_revision": status.get("lastAttemptedRevision", ""),
-            "conditions": status.get("conditions", []),
+            "last_handled_reconcile_at": status.get("lastHandledReconcileAt", ""),
+            "conditions": [
+                {k: c[k] for k in _CONDITION_FIELDS if k in c}
+                for c in (status.get("conditions") or [])[-MAX_DETAIL_CONDITIONS:]
+            ],
         }
 
-        # Determine overall status
-        ready = False
-        for condition in details["conditions"]:
-            if condition.get("type") == "Ready" and condition.get("status") == "True":
-                ready = True
-                break
+        # Determine overall status (one {type: condition} map, O(1) lookups)
+        ready_condition = _conditions_by_type(status).get("Ready", {})
+        ready = ready_condition.get("status") == "True"
 
         status_emoji = "✅" if ready else "⚠️"
         suspend_status = " (SUSPENDED)" if details["suspended"] else ""
-
-        return {
-            "success": True,
-            "cluster": cluster,
-            "node": node,
-            "name": name,
-            "namespace": namespace,
-            "details": details,
-            "message": f"{status_emoji} Retrieved details for kustomization '{name}'{suspend_status}",
-            "ansible_command": None,
-            "ansible_steps": [],
-        }
+        # Say why it isn't Ready, e.g. "(Ready=False: ReconciliationFailed)"
+        not_ready_reason = (
+            ""
+            if ready
+            else f" (Ready={ready_condition.get('status', 'Unknown')}: {ready_condition.get('reason', 'no reason given')})"
+        )
+
+        return _resp(
+            ctx,
+            True,
+            f"{status_emoji} Retrieved details for kustomization '{name}'{suspend_status}{not_ready_reason}",
+            details=details,
+        )
 
     except json.JSONDecodeError as e:
-        return {
-            "success": False,
-            "cluster": cluster,
-            "node": node,
-            "name": name,
-            "namespace": namespace,
-            "details": {},
-            "message": f"❌ Error parsing kubectl output: {str(e)}",
-            "ansible_command": None,
-            "ansible_steps": [
+        return _resp(
+            ctx,
+            False,
+            f"❌ Error parsing kubectl output: {str(e)}",
+            details={},
+            ansible_steps=[
                 f"Try manually: tsh ssh --cluster={cluster} root@{node} 'kubectl get kustomization {name} -n {namespace}'",
                 "Check if Flux is installed: flux check",
             ],
-            "raw_output": result.get("stdout", "")[:500],
-        }
+            raw_output=result.get("stdout", "")[:500],
+        )
     except Exception as e:
-        return {
-            "success": False,
-            "cluster": cluster,
-            "node": node,
-            "name": name,
-            "namespace": namespace,
-            "details": {},
-            "message": f"❌ Unexpected error: {str(e)}",
-            "ansible_command": None,
-            "ansible_steps": [
+        return _resp(
+            ctx,
+            False,
+            f"❌ Unexpected error: {str(e)}",
+            details={},
+            ansible_steps=[
                 f"Try manually: tsh ssh --cluster={cluster} root@{node} 'kubectl get kustomization {name} -n {namespace} -o json'"
             ],
-        }
+        )
 
 
 def reconcile_flux_kustomization(
-    cluster: str, node: str, name: str, namespace: str = "flux-system"
+    cluster: str,
+    node: str,
+    name: str,
+    namespace: str = "flux-system",
+    wait: bool = False,
 ) -> Dict[str, Any]:
     """
     Trigger a Flux reconciliation for a specific Kustomization.
 
+    By default this only requests the reconciliation - it sets the
+    reconcile.fluxcd.io/requestedAt annotation (what `flux reconcile` does
+    first) and returns straight away instead of holding the SSH session
+    open while the controller works. Poll get_kustomization_details until
+    details.last_handled_reconcile_at equals the returned requested_at.
+    wait=True runs `flux reconcile`, which blocks until it has finished.
+
     This is a HIGH-LEVEL tool that uses run_remote_command() internally.
 
     ANALOGY: Like running `tsh ssh root@node "flux reconcile kustomization X -n Y"`
+    (wait=True) or just annotating the object and walking away (wait=False)
 
     Args:
         cluster: Teleport cluster name ["staging", "production"]
         node: K8s node hostname (e.g., "k8s-master-01")
         name: Kustomization name (e.g., "flux-system", "apps")
         namespace: Kustomization namespace (default: "flux-system")
+        wait: Block until the reconciliation completes (default: False)
 
     Returns:
         dict: Reconciliation results
@@ -392,11 +656,12 @@ def reconcile_flux_kustomization(
             "namespace": str,
             "message": str,
             "output": str,
+            "requested_at": str,   # wait=False only
             "ansible_command": str,
             "ansible_steps": List[str]
         }
 
-    Example Response (Success):
+    Example Response (Success, wait=True):
         {
             "success": true,
             "cluster": "staging",
@@ -412,44 +677,65 @@ def reconcile_flux_kustomization(
     SECURITY NOTES:
     - Input validation on cluster names
     - Uses run_remote_command() which has its own security checks
-    - Uses shlex.quote() for user-provided name/namespace to prevent injection
+    - name/namespace must be valid Kubernetes names (rejected otherwise)
     """
 
-    # STEP 1: Build flux reconcile command (with injection protection)
-    # Use shlex.quote() to safely include user-provided strings
-    safe_name = shlex.quote(name)
-    safe_namespace = shlex.quote(namespace)
-    flux_command = f"sudo flux reconcile kustomization {safe_name} -n {safe_namespace}"
+    # Fields every response carries
+    ctx = {"cluster": cluster, "node": node, "name": name, "namespace": namespace}
+
+    # Validate name/namespace before they reach the remote shell
+    error = _k8s_name_error(name, namespace)
+    if error:
+        return _resp(ctx, False, f"❌ {error}", output="")
+
+    # STEP 1: Build the command
+    if wait:
+        command = f"sudo flux reconcile kustomization {name} -n {namespace}"
+        timeout = 60
+    else:
+        # Same annotation and timestamp format as `flux reconcile` (RFC 3339)
+        requested_at = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.%fZ")
+        command = (
+            f"sudo kubectl annotate --overwrite kustomizations.kustomize.toolkit.fluxcd.io"
+            f" {name} -n {namespace} reconcile.fluxcd.io/requestedAt={requested_at}"
+        )
+        timeout = 30
 
     # STEP 2: Execute command via SSH
     result = platform.run_remote_command(
-        cluster, node, flux_command, user="stephen.tan", timeout=60
+        cluster, node, command, user="stephen.tan", timeout=timeout
     )
 
-    if result["success"]:
-        return {
-            "success": True,
-            "cluster": cluster,
-            "node": node,
-            "name": name,
-            "namespace": namespace,
-            "message": "✅ Reconciliation triggered successfully",
-            "output": result["stdout"],
-            "ansible_command": None,
-            "ansible_steps": [],
-        }
+    # Cached reads would otherwise show the pre-change state
+    _clear_flux_read_caches()
+
+    if result["success"] and wait:
+        return _resp(
+            ctx,
+            True,
+            "✅ Reconciliation triggered successfully",
+            output=result["stdout"],
+        )
+    elif result["success"]:
+        return _resp(
+            ctx,
+            True,
+            f"✅ Reconciliation requested at {requested_at} - check "
+            "get_kustomization_details until last_handled_reconcile_at matches",
+            output=result["stdout"],
+            requested_at=requested_at,
+        )
     else:
-        return {
-            "success": False,
-            "cluster": cluster,
-            "node": node,
-            "name": name,
-            "namespace": namespace,
-            "message": f"❌ Reconciliation failed: {result['message']}",
-            "output": result.get("stderr", ""),
-            "ansible_command": result.get("ansible_command"),
-            "ansible_steps": result.get("ansible_steps", []),
-        }
+        return _resp(
+            ctx,
+            False,
+            f"❌ Reconciliation failed: {result['message']}",
+            output=result.get("stderr", ""),
+            ansible_command=result.get("ansible_command"),
+            ansible_steps=result.get("ansible_steps", []),
+        )
+
+
 # =============================================================================
 # V1c TOOLS: Complete Flux Management Suite
 # =============================================================================
@@ -459,6 +745,7 @@ def reconcile_flux_kustomization(
 # Philosophy: "Complete operational control" - everything you need to manage Flux
 
 
+@platform.ttl_cache(FLUX_READ_TTL)
 def list_flux_sources(cluster: str, node: str) -> Dict[str, Any]:
     """
     List all Flux GitRepository sources.
@@ -486,9 +773,12 @@ def list_flux_sources(cluster: str, node: str) -> Dict[str, Any]:
     SECURITY NOTES:
     - Input validation on cluster names
     - Uses run_remote_command() internally
-    - Read-only operation
+    - Read-only operation (results reused for FLUX_READ_TTL seconds)
     """
 
+    # Fields every response carries
+    ctx = {"cluster": cluster, "node": node}
+
     # Build kubectl command to get GitRepository sources
     kubectl_command = (
         "sudo kubectl get gitrepositories.source.toolkit.fluxcd.io -A -o json"
@@ -496,75 +786,286 @@ def list_flux_sources(cluster: str, node: str) -> Dict[str, Any]:
 
     # Execute command via SSH
     result = platform.run_remote_command(
-        cluster, node, kubectl_command, user="stephen.tan", timeout=30
+        cluster,
+        node,
+        kubectl_command,
+        user="stephen.tan",
+        timeout=30,
+        max_bytes=KUBECTL_JSON_MAX_BYTES,
     )
 
     if not result["success"]:
-        return {
-            "success": False,
-            "cluster": cluster,
-            "node": node,
-            "sources": [],
-            "message": result["message"],
-            "ansible_command": result.get("ansible_command"),
-            "ansible_steps": result.get("ansible_steps", []),
-        }
+        return _resp(
+            ctx,
+            False,
+            result["message"],
+            sources=[],
+            ansible_command=result.get("ansible_command"),
+            ansible_steps=result.get("ansible_steps", []),
+        )
 
     # Parse JSON output
     try:
-        data = json.loads(result["stdout"])
+        data = _json_loads(result["stdout"])
         sources = []
 
         for item in data.get("items", []):
-            name = item["metadata"]["name"]
-            namespace = item["metadata"]["namespace"]
-            spec = item.get("spec", {})
-            status = item.get("status", {})
-
-            # Get ready condition
-            ready = "Unknown"
-            message = ""
-            for condition in status.get("conditions", []):
-                if condition.get("type") == "Ready":
-                    ready = condition.get("status", "Unknown")
-                    message = condition.get("message", "")
-                    break
-
-            sources.append(
-                {
-                    "name": name,
-                    "namespace": namespace,
-                    "url": spec.get("url", "N/A"),
-                    "ref": spec.get("ref", {}),
-                    "ready": ready,
-                    "message": message,
-                    "artifact": status.get("artifact", {}).get("revision", "N/A"),
-                }
-            )
+            sources.append(_source_summary(item))
 
-        return {
-            "success": True,
-            "cluster": cluster,
-            "node": node,
-            "sources": sources,
-            "message": f"✅ Found {len(sources)} GitRepository source(s)",
-            "ansible_command": None,
-            "ansible_steps": [],
-        }
+        return _resp(
+            ctx,
+            True,
+            f"✅ Found {len(sources)} GitRepository source(s)",
+            sources=sources,
+        )
 
     except json.JSONDecodeError as e:
-        return {
-            "success": False,
-            "cluster": cluster,
-            "node": node,
-            "sources": [],
-            "message": f"❌ Error parsing kubectl output: {str(e)}",
-            "ansible_command": None,
-            "ansible_steps": [
+        return _resp(
+            ctx,
+            False,
+            f"❌ Error parsing kubectl output: {str(e)}",
+            sources=[],
+            ansible_steps=[
                 f"Try manually: tsh ssh --cluster={cluster} root@{node} 'flux get sources git'"
             ],
+        )
+
+
+def list_flux_sources_multi(targets: List[Dict[str, str]]) -> Dict[str, Any]:
+    """
+    List Flux GitRepository sources on several cluster/node pairs at once.
+
+    Runs list_flux_sources() for every target concurrently (e.g. staging and
+    production side by side), so the call takes about as long as the
+    slowest target.
+
+    ANALOGY: Like `parallel` over `tsh ssh --cluster=X node flux get sources git`
+
+    Args:
+        targets: [{"cluster": "staging", "node": "k8s-master-01"}, ...]
+            (duplicates are queried once, max 10)
+
+    Returns:
+        dict: Per-target results, each shaped like list_flux_sources()
+        {
+            "success": bool,             # True only if every target succeeded
+            "results": Dict[str, Dict],  # "cluster/node" -> list_flux_sources() result
+            "failed_targets": List[str],
+            "total_sources": int,
+            "message": str,
+            "ansible_command": str,
+            "ansible_steps": List[str]
+        }
+
+    SECURITY NOTES:
+    - Batch size capped (MAX_BATCH_NODES) so one call can't fan out unbounded
+    - Each target goes through list_flux_sources() and its checks (cluster
+      allow-list included)
+    - Read-only operation
+    """
+
+    # No single cluster/node - each result carries its own
+    ctx: Dict[str, Any] = {}
+
+    # STEP 1: Validate input
+    if not isinstance(targets, (list, tuple)) or not all(
+        isinstance(t, dict)
+        and isinstance(t.get("cluster"), str)
+        and isinstance(t.get("node"), str)
+        for t in targets
+    ):
+        return _resp(
+            ctx,
+            False,
+            '❌ targets must be a list of {"cluster": str, "node": str} objects',
+            results={},
+            failed_targets=[],
+            total_sources=0,
+        )
+
+    # dict.fromkeys: drop duplicates, keep the caller's order
+    pairs = list(dict.fromkeys((t["cluster"], t["node"]) for t in targets))
+    if not pairs or len(pairs) > MAX_BATCH_NODES:
+        return _resp(
+            ctx,
+            False,
+            f"❌ Provide between 1 and {MAX_BATCH_NODES} {{cluster, node}} target(s), got {len(pairs)}",
+            results={},
+            failed_targets=[],
+            total_sources=0,
+        )
+
+    # STEP 2: Query every target concurrently
+    target_results = list(_IO_POOL.map(lambda pair: list_flux_sources(*pair), pairs))
+
+    # STEP 3: Summarize
+    results = {
+        f"{cluster}/{node}": result
+        for (cluster, node), result in zip(pairs, target_results)
+    }
+    failed_targets = [key for key, r in results.items() if not r["success"]]
+    total = sum(len(r.get("sources", [])) for r in target_results)
+
+    if failed_targets:
+        message = f"⚠️  {len(failed_targets)} of {len(pairs)} target(s) failed: {', '.join(failed_targets)}"
+        ansible_steps = ["Check each failed target's result for details"]
+    else:
+        message = (
+            f"✅ Found {total} GitRepository source(s) across {len(pairs)} target(s)"
+        )
+        ansible_steps = []
+
+    return _resp(
+        ctx,
+        not failed_targets,
+        message,
+        results=results,
+        failed_targets=failed_targets,
+        total_sources=total,
+        ansible_steps=ansible_steps,
+    )
+
+
+@platform.ttl_cache(FLUX_READ_TTL)
+def get_flux_overview(cluster: str, node: str) -> Dict[str, Any]:
+    """
+    Get all Flux Kustomizations and GitRepository sources in one call.
+
+    The usual "show me the state" question otherwise takes
+    list_flux_kustomizations + list_flux_sources: two SSH sessions and two
+    kubectl runs. Here one `kubectl get` lists both kinds (a single List
+    object), and the items are split by kind locally.
+
+    ANALOGY: Like `kubectl get kustomizations,gitrepositories -A` instead of
+    two separate commands.
+
+    Args:
+        cluster: Teleport cluster name ["staging", "production"]
+        node: K8s node hostname (e.g., "k8s-master-01")
+
+    Returns:
+        dict: Both listings, shaped like the individual tools' entries
+        {
+            "success": bool,
+            "cluster": str,
+            "node": str,
+            "kustomizations": List[Dict],  # as list_flux_kustomizations(show_suspend=True)
+            "sources": List[Dict],         # as list_flux_sources()
+            "not_ready": List[str],        # "Kind/namespace/name" not Ready=True
+            "message": str,
+            "ansible_command": str,
+            "ansible_steps": List[str]
         }
 
+    SECURITY NOTES:
+    - Input validation on cluster names
+    - Uses run_remote_command() which has its own security checks
+    - Command is hardcoded (no user input in kubectl command)
+    - Read-only operation (results reused for FLUX_READ_TTL seconds)
+    """
+
+    # Fields every response carries
+    ctx = {"cluster": cluster, "node": node}
+
+    # STEP 1: One kubectl call for both resource kinds
+    kubectl_command = (
+        "sudo kubectl get kustomizations.kustomize.toolkit.fluxcd.io,"
+        "gitrepositories.source.toolkit.fluxcd.io -A -o json"
+    )
+
+    # STEP 2: Execute command via SSH
+    result = platform.run_remote_command(
+        cluster,
+        node,
+        kubectl_command,
+        user="stephen.tan",
+        timeout=30,
+        max_bytes=KUBECTL_JSON_MAX_BYTES,
+    )
+
+    if not result["success"]:
+        return _resp(
+            ctx,
+            False,
+            result["message"],
+            kustomizations=[],
+            sources=[],
+            not_ready=[],
+            ansible_command=result.get("ansible_command"),
+            ansible_steps=result.get("ansible_steps", []),
+        )
+
+    # STEP 3: Split the List by kind
+    try:
+        data = _json_loads(result["stdout"])
+    except json.JSONDecodeError as e:
+        return _resp(
+            ctx,
+            False,
+            f"❌ Error parsing kubectl output: {str(e)}",
+            kustomizations=[],
+            sources=[],
+            not_ready=[],
+            ansible_steps=[
+                f"Try manually: tsh ssh --cluster={cluster} root@{node} 'flux get all -A'"
+            ],
+        )
+
+    kustomizations = []
+    sources = []
+    not_ready = []
+    for item in data.get("items", []):
+        kind = item.get("kind")
+        if kind == "Kustomization":
+            entry = _kustomization_summary(item, show_suspend=True)
+            kustomizations.append(entry)
+        elif kind == "GitRepository":
+            entry = _source_summary(item)
+            sources.append(entry)
+        else:
+            continue
+        if entry["ready"] != "True":
+            not_ready.append(f"{kind}/{entry['namespace']}/{entry['name']}")
+
+    # STEP 4: Return results
+    summary = f"{len(kustomizations)} Kustomization(s), {len(sources)} GitRepository source(s)"
+    if not_ready:
+        message = f"⚠️  {summary}; {len(not_ready)} not ready"
+    else:
+        message = f"✅ {summary}, all ready"
+
+    return _resp(
+        ctx,
+        True,
+        message,
+        kustomizations=kustomizations,
+        sources=sources,
+        not_ready=not_ready,
+    )
+
+
+# Printed on the node when suspend/resume had nothing to do
+_NOOP_MARKER = "platform-mcp: already in requested state"
+
+
+def _suspend_toggle_command(verb: str, name: str, namespace: str) -> str:
+    """
+    `flux suspend|resume` guarded by a check of spec.suspend on the node.
+
+    If the Kustomization is already in the requested state, print
+    _NOOP_MARKER instead of running flux - no patch, no update event, and
+    (for resume) no wait for a reconciliation. One SSH round-trip either way,
+    and the check reads live state rather than a possibly stale cache.
+    A failed lookup (e.g. not found) fails the whole command.
+    """
+    already = "=" if verb == "suspend" else "!="
+    return (
+        f"state=$(sudo kubectl get kustomizations.kustomize.toolkit.fluxcd.io {name}"
+        f" -n {namespace} -o jsonpath='{{.spec.suspend}}')"
+        f' && if [ "$state" {already} true ]; then echo "{_NOOP_MARKER}";'
+        f" else sudo flux {verb} kustomization {name} -n {namespace}; fi"
+    )
+
 
 def suspend_flux_kustomization(
     cluster: str, node: str, name: str, namespace: str = "flux-system"
@@ -592,50 +1093,64 @@ def suspend_flux_kustomization(
             "namespace": str,
             "message": str,
             "output": str,
+            "noop": bool,          # True if it was already in that state (on success)
             "ansible_command": str,
             "ansible_steps": List[str]
         }
 
     SECURITY NOTES:
     - Input validation on cluster names
-    - Uses shlex.quote() for user input
-    - Modifies cluster state (use with caution)
+    - name/namespace must be valid Kubernetes names (rejected otherwise)
+    - Modifies cluster state (use with caution) - unless it's already in the
+      requested state, which is checked on the node first
     """
 
-    # Build flux suspend command (with injection protection)
-    safe_name = shlex.quote(name)
-    safe_namespace = shlex.quote(namespace)
-    flux_command = f"sudo flux suspend kustomization {safe_name} -n {safe_namespace}"
+    # Fields every response carries
+    ctx = {"cluster": cluster, "node": node, "name": name, "namespace": namespace}
+
+    # Validate name/namespace before they reach the remote shell
+    error = _k8s_name_error(name, namespace)
+    if error:
+        return _resp(ctx, False, f"❌ {error}", output="")
+
+    # Build flux suspend command (skipped on the node if already suspended)
+    flux_command = _suspend_toggle_command("suspend", name, namespace)
 
     # Execute command via SSH
     result = platform.run_remote_command(
         cluster, node, flux_command, user="stephen.tan", timeout=30
     )
 
+    if result["success"] and _NOOP_MARKER in result["stdout"]:
+        # Nothing changed, so cached reads are still valid
+        return _resp(
+            ctx,
+            True,
+            f"✅ {name} in {namespace} is already suspended - nothing to do",
+            output="",
+            noop=True,
+        )
+
+    # Cached reads would otherwise show the pre-change state
+    _clear_flux_read_caches()
+
     if result["success"]:
-        return {
-            "success": True,
-            "cluster": cluster,
-            "node": node,
-            "name": name,
-            "namespace": namespace,
-            "message": f"✅ Suspended {name} in {namespace}",
-            "output": result["stdout"],
-            "ansible_command": None,
-            "ansible_steps": [],
-        }
+        return _resp(
+            ctx,
+            True,
+            f"✅ Suspended {name} in {namespace}",
+            output=result["stdout"],
+            noop=False,
+        )
     else:
-        return {
-            "success": False,
-            "cluster": cluster,
-            "node": node,
-            "name": name,
-            "namespace": namespace,
-            "message": f"❌ Failed to suspend: {result['message']}",
-            "output": result.get("stderr", ""),
-            "ansible_command": result.get("ansible_command"),
-            "ansible_steps": result.get("ansible_steps", []),
-        }
+        return _resp(
+            ctx,
+            False,
+            f"❌ Failed to suspend: {result['message']}",
+            output=result.get("stderr", ""),
+            ansible_command=result.get("ansible_command"),
+            ansible_steps=result.get("ansible_steps", []),
+        )
 
 
 def resume_flux_kustomization(
@@ -664,54 +1179,74 @@ def resume_flux_kustomization(
             "namespace": str,
             "message": str,
             "output": str,
+            "noop": bool,          # True if it was already in that state (on success)
             "ansible_command": str,
             "ansible_steps": List[str]
         }
 
     SECURITY NOTES:
     - Input validation on cluster names
-    - Uses shlex.quote() for user input
-    - Modifies cluster state (use with caution)
+    - name/namespace must be valid Kubernetes names (rejected otherwise)
+    - Modifies cluster state (use with caution) - unless it's already in the
+      requested state, which is checked on the node first
     """
 
-    # Build flux resume command (with injection protection)
-    safe_name = shlex.quote(name)
-    safe_namespace = shlex.quote(namespace)
-    flux_command = f"sudo flux resume kustomization {safe_name} -n {safe_namespace}"
+    # Fields every response carries
+    ctx = {"cluster": cluster, "node": node, "name": name, "namespace": namespace}
+
+    # Validate name/namespace before they reach the remote shell
+    error = _k8s_name_error(name, namespace)
+    if error:
+        return _resp(ctx, False, f"❌ {error}", output="")
+
+    # Build flux resume command (skipped on the node if already resumed)
+    flux_command = _suspend_toggle_command("resume", name, namespace)
 
     # Execute command via SSH
     result = platform.run_remote_command(
         cluster, node, flux_command, user="stephen.tan", timeout=30
     )
 
+    if result["success"] and _NOOP_MARKER in result["stdout"]:
+        # Nothing changed, so cached reads are still valid
+        return _resp(
+            ctx,
+            True,
+            f"✅ {name} in {namespace} is already resumed - nothing to do",
+            output="",
+            noop=True,
+        )
+
+    # Cached reads would otherwise show the pre-change state
+    _clear_flux_read_caches()
+
     if result["success"]:
-        return {
-            "success": True,
-            "cluster": cluster,
-            "node": node,
-            "name": name,
-            "namespace": namespace,
-            "message": f"✅ Resumed {name} in {namespace}",
-            "output": result["stdout"],
-            "ansible_command": None,
-            "ansible_steps": [],
-        }
+        return _resp(
+            ctx,
+            True,
+            f"✅ Resumed {name} in {namespace}",
+            output=result["stdout"],
+            noop=False,
+        )
     else:
-        return {
-            "success": False,
-            "cluster": cluster,
-            "node": node,
-            "name": name,
-            "namespace": namespace,
-            "message": f"❌ Failed to resume: {result['message']}",
-            "output": result.get("stderr", ""),
-            "ansible_command": result.get("ansible_command"),
-            "ansible_steps": result.get("ansible_steps", []),
-        }
+        return _resp(
+            ctx,
+            False,
+            f"❌ Failed to resume: {result['message']}",
+            output=result.get("stderr", ""),
+            ansible_command=result.get("ansible_command"),
+            ansible_steps=result.get("ansible_steps", []),
+        )
 
 
+@platform.ttl_cache(FLUX_LOGS_TTL)
 def get_flux_logs(
-    cluster: str, node: str, component: str = "kustomize-controller", tail: int = 50
+    cluster: str,
+    node: str,
+    component: str = "kustomize-controller",
+    tail: int = 50,
+    since: Optional[str] = None,
+    max_bytes: int = FLUX_LOGS_DEFAULT_BYTES,
 ) -> Dict[str, Any]:
     """
     Get logs from a Flux component.
@@ -725,7 +1260,9 @@ def get_flux_logs(
         node: K8s node hostname (e.g., "k8s-master-01")
         component: Flux component ["kustomize-controller", "source-controller",
                    "helm-controller", "notification-controller"]
-        tail: Number of lines to show (default: 50)
+        tail: Number of lines to show (default: 50, max 10000)
+        since: Only logs newer than this duration (e.g., "5m", "1h")
+        max_bytes: Most log bytes to return (default: 256 KiB, max 1 MiB)
 
     Returns:
         dict: Log output
@@ -735,6 +1272,8 @@ def get_flux_logs(
             "node": str,
             "component": str,
             "logs": str,
+            "lines": int,          # lines actually returned (on success)
+            "truncated": bool,     # True if max_bytes cut the logs short
             "message": str,
             "ansible_command": str,
             "ansible_steps": List[str]
@@ -743,60 +1282,143 @@ def get_flux_logs(
     SECURITY NOTES:
     - Input validation on cluster names
     - Component name is validated against allow-list
-    - Read-only operation
+    - tail, since and max_bytes are validated before reaching the shell
+    - Read-only operation (results reused for FLUX_LOGS_TTL seconds)
     """
 
-    # Validate component name
-    allowed_components = [
-        "kustomize-controller",
-        "source-controller",
-        "helm-controller",
-        "notification-controller",
-    ]
-    if component not in allowed_components:
-        return {
-            "success": False,
-            "cluster": cluster,
-            "node": node,
-            "component": component,
-            "logs": "",
-            "message": f"❌ Invalid component. Must be one of: {allowed_components}",
-            "ansible_command": None,
-            "ansible_steps": [],
-        }
-
-    # Build kubectl logs command
+    # Fields every response carries
+    ctx = {"cluster": cluster, "node": node, "component": component}
+
+    # STEP 1: Validate inputs
+    error = None
+    if component not in _ALLOWED_FLUX_COMPONENTS:
+        error = f"Invalid component. Must be one of: {sorted(_ALLOWED_FLUX_COMPONENTS)}"
+    elif not _is_int_in(tail, 1, FLUX_LOGS_MAX_TAIL):
+        error = (
+            f"Invalid tail {tail!r}. Must be an integer from 1 to {FLUX_LOGS_MAX_TAIL}"
+        )
+    elif not _is_int_in(max_bytes, 1, platform.REMOTE_OUTPUT_MAX_BYTES):
+        error = f"Invalid max_bytes {max_bytes!r}. Must be an integer from 1 to {platform.REMOTE_OUTPUT_MAX_BYTES}"
+    elif since is not None and not (
+        isinstance(since, str) and _KUBECTL_DURATION_RE.fullmatch(since)
+    ):
+        error = f"Invalid since {since!r}. Use a duration like 5m, 1h or 1h30m"
+
+    if error:
+        return _resp(ctx, False, f"❌ {error}", logs="")
+
+    # STEP 2: Build kubectl logs command
+    # --tail/--limit-bytes/--since are applied by the apiserver, so only the
+    # requested slice of the log is sent back over SSH
     kubectl_command = (
-        f"sudo kubectl logs -n flux-system deploy/{component} --tail={tail}"
+        f"sudo kubectl logs -n flux-system deploy/{component}"
+        f" --tail={tail} --limit-bytes={max_bytes}"
     )
+    if since is not None:
+        kubectl_command += f" --since={shlex.quote(since)}"
 
-    # Execute command via SSH
+    # STEP 3: Execute command via SSH
     result = platform.run_remote_command(
-        cluster, node, kubectl_command, user="stephen.tan", timeout=30
+        cluster,
+        node,
+        kubectl_command,
+        user="stephen.tan",
+        timeout=30,
+        max_bytes=max_bytes,
     )
 
     if result["success"]:
-        return {
-            "success": True,
-            "cluster": cluster,
-            "node": node,
-            "component": component,
-            "logs": result["stdout"],
-            "message": f"✅ Retrieved {tail} lines from {component}",
-            "ansible_command": None,
-            "ansible_steps": [],
-        }
+        logs = result["stdout"]
+        lines = len(logs.splitlines())
+        # kubectl stops at --limit-bytes without saying so; reaching the
+        # limit (or the local cap's marker) means there was more
+        truncated = len(logs.encode("utf-8")) >= max_bytes
+        note = (
+            f" (truncated at {max_bytes} bytes - lower tail or raise max_bytes)"
+            if truncated
+            else ""
+        )
+        return _resp(
+            ctx,
+            True,
+            f"✅ Retrieved {lines} line(s) from {component}{note}",
+            logs=logs,
+            lines=lines,
+            truncated=truncated,
+        )
     else:
+        return _resp(
+            ctx,
+            False,
+            f"❌ Failed to get logs: {result['message']}",
+            logs=result.get("stderr", ""),
+            ansible_command=result.get("ansible_command"),
+            ansible_steps=result.get("ansible_steps", []),
+        )
+
+
+@platform.ttl_cache(FLUX_READ_TTL)
+def _namespace_events(cluster: str, node: str, namespace: str) -> Dict[str, Any]:
+    """
+    Every event in `namespace` as parsed JSON, oldest first.
+
+    `namespace` must already be validated (_k8s_name_error) - it is
+    interpolated into the command as-is.
+
+    Shared by get_kustomization_events: asking about five kustomizations
+    costs one events LIST (reused for FLUX_READ_TTL seconds) instead of five
+    field-selector queries.
+    """
+    # No --sort-by: kubectl would sort on the node before printing; the
+    # items are sorted here instead, once per cached listing
+    kubectl_command = f"sudo kubectl get events -n {namespace} -o json"
+
+    result = platform.run_remote_command(
+        cluster,
+        node,
+        kubectl_command,
+        user="stephen.tan",
+        timeout=30,
+        max_bytes=KUBECTL_JSON_MAX_BYTES,
+    )
+    if not result["success"]:
+        return result
+
+    try:
+        items = _json_loads(result["stdout"]).get("items", [])
+    except json.JSONDecodeError as e:
         return {
             "success": False,
-            "cluster": cluster,
-            "node": node,
-            "component": component,
-            "logs": result.get("stderr", ""),
-            "message": f"❌ Failed to get logs: {result['message']}",
-            "ansible_command": result.get("ansible_command"),
-            "ansible_steps": result.get("ansible_steps", []),
+            "stderr": "",
+            "message": f"Error parsing kubectl output: {str(e)}",
         }
+    # RFC 3339 timestamps sort correctly as strings; undated events go first
+    items.sort(key=_event_time)
+    return {"success": True, "items": items}
+
+
+def _event_time(event: Dict[str, Any]) -> str:
+    """When an event last happened (core/v1 and events.k8s.io fields), or ""."""
+    return (
+        event.get("lastTimestamp")
+        or event.get("eventTime")
+        or event.get("firstTimestamp")
+        or ""
+    )
+
+
+def _format_event(event: Dict[str, Any]) -> str:
+    """One event as a `kubectl get events` row: LAST SEEN, TYPE, REASON, OBJECT, MESSAGE."""
+    obj = event.get("involvedObject", {})
+    return "  ".join(
+        [
+            _event_time(event) or "<unknown>",
+            event.get("type", ""),
+            event.get("reason", ""),
+            f"{obj.get('kind', '').lower()}/{obj.get('name', '')}",
+            (event.get("message") or "").strip(),
+        ]
+    )
 
 
 def get_kustomization_events(
@@ -806,6 +1428,7 @@ def get_kustomization_events(
     Get Kubernetes events for a specific Kustomization.
 
     This shows recent events related to a kustomization for debugging.
+    Only the newest MAX_EVENTS (50) are returned, oldest first.
 
     ANALOGY: Like running `kubectl describe kustomization X` to see events.
 
@@ -823,7 +1446,7 @@ def get_kustomization_events(
             "node": str,
             "name": str,
             "namespace": str,
-            "events": str,
+            "events": str,         # one line per event, at most 50
             "message": str,
             "ansible_command": str,
             "ansible_steps": List[str]
@@ -831,44 +1454,48 @@ def get_kustomization_events(
 
     SECURITY NOTES:
     - Input validation on cluster names
-    - Uses shlex.quote() for user input
-    - Read-only operation
+    - name/namespace must be valid Kubernetes names (rejected otherwise)
+    - Read-only operation (the namespace's events are fetched once and
+      reused for FLUX_READ_TTL seconds)
     """
 
-    # Build kubectl get events command (with injection protection)
-    safe_name = shlex.quote(name)
-    safe_namespace = shlex.quote(namespace)
-    kubectl_command = f"sudo kubectl get events -n {safe_namespace} --field-selector involvedObject.name={safe_name} --sort-by='.lastTimestamp'"
+    # Fields every response carries
+    ctx = {"cluster": cluster, "node": node, "name": name, "namespace": namespace}
 
-    # Execute command via SSH
-    result = platform.run_remote_command(
-        cluster, node, kubectl_command, user="stephen.tan", timeout=30
-    )
+    # Validate name/namespace before they reach the remote shell
+    error = _k8s_name_error(name, namespace)
+    if error:
+        return _resp(ctx, False, f"❌ {error}", events="")
 
+    # STEP 1: All events in the namespace (one LIST, shared across names)
+    result = _namespace_events(cluster, node, namespace)
+
+    # STEP 2: Keep the ones about this object
     if result["success"]:
-        return {
-            "success": True,
-            "cluster": cluster,
-            "node": node,
-            "name": name,
-            "namespace": namespace,
-            "events": result["stdout"],
-            "message": f"✅ Retrieved events for {name}",
-            "ansible_command": None,
-            "ansible_steps": [],
-        }
+        matching = [
+            e
+            for e in result["items"]
+            if e.get("involvedObject", {}).get("name") == name
+        ]
+        # Events come oldest first - keep the newest MAX_EVENTS
+        shown = matching[-MAX_EVENTS:]
+        capped = f" (newest of {len(matching)})" if len(shown) < len(matching) else ""
+        return _resp(
+            ctx,
+            True,
+            f"✅ Retrieved {len(shown)} event(s) for {name}{capped}",
+            events="\n".join(_format_event(e) for e in shown),
+        )
     else:
-        return {
-            "success": False,
-            "cluster": cluster,
-            "node": node,
-            "name": name,
-            "namespace": namespace,
-            "events": result.get("stderr", ""),
-            "message": f"❌ Failed to get events: {result['message']}",
-            "ansible_command": result.get("ansible_command"),
-            "ansible_steps": result.get("ansible_steps", []),
-        }
+        return _resp(
+            ctx,
+            False,
+            f"❌ Failed to get events: {result['message']}",
+            events=result.get("stderr", ""),
+            ansible_command=result.get("ansible_command"),
+            ansible_steps=result.get("ansible_steps", []),
+        )
+
 
 def get_pi_team_rules_resource() -> str:
     """
@@ -879,17 +1506,16 @@ def get_pi_team_rules_resource() -> str:
     Returns:
         str: Full content of resources/pi_team_rules.md
     """
-    script_dir = os.path.dirname(os.path.abspath(__file__))
-    rules_path = os.path.join(script_dir, "resources/pi_team_rules.md")
-
-    if not os.path.exists(rules_path):
-        return "❌ pi_team_rules.md not found at: " + rules_path
+    rules_path = _PI_TEAM_RULES_PATH
 
     try:
-        with open(rules_path, "r") as f:
-            return f.read()
+        return platform.read_text_cached(rules_path)
+    except FileNotFoundError:
+        return "❌ pi_team_rules.md not found at: " + rules_path
     except Exception as e:
         return f"❌ Error reading pi_team_rules.md: {str(e)}"
+
+
 # =============================================================================
 # DECORATOR EXPLANATION (for the Python newbie)
 # =============================================================================
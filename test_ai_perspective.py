@@ -4,6 +4,7 @@ Simulate what an AI agent sees when discovering and calling tools.
 This mimics the MCP protocol's tool discovery and execution flow.
 """
 from platform_mcp import mcp, list_kube_contexts
+import asyncio
 import inspect
 
 print("🤖 AI Agent Perspective: Tool Discovery\n")
@@ -31,7 +32,7 @@ print("AI Decision: 'The user wants to see their Kubernetes contexts.'")
 print("AI Action: Calling list_kube_contexts()")
 print("\nExecuting...")
 
-result = list_kube_contexts()
+result = asyncio.run(list_kube_contexts())
 
 print("\n3️⃣  TOOL RESPONSE (What the AI receives)")
 print("=" * 60)
@@ -41,7 +42,7 @@ print(f"Content:\n{result}")
 # Step 3: AI interprets the result
 print("\n\n4️⃣  AI INTERPRETATION")
 print("=" * 60)
-contexts = result.splitlines()
+contexts = result["contexts"]
 print(f"AI Understanding: 'The user has {len(contexts)} Kubernetes contexts available:'")
 for i, ctx in enumerate(contexts, 1):
     print(f"  {i}. {ctx}")
@@ -13,7 +13,7 @@ import json
 import os
 from pathlib import Path
 
-from design_validation import DesignValidator
+from design_validation import DesignValidator, flush_pending_writes
 
 
 def test_valid_proposal():
@@ -41,7 +41,8 @@ def test_valid_proposal():
         print(f"✅ Proposal ID: {result['proposal_id']}")
         print(f"✅ Saved to: {result['proposal_path']}")
 
-        # Verify the file was created
+        # Verify the file was created (saves happen on a background thread)
+        flush_pending_writes()
         assert Path(result["proposal_path"]).exists()
         print("✅ Proposal file exists")
 
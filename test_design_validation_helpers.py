@@ -0,0 +1,197 @@
+#!/usr/bin/env python3
+"""
+Test the design validation helpers
+
+Covers the pieces the end-to-end workflow tests don't reach directly:
+1. Built-in pattern checks (each match reported, case-insensitive)
+2. Proposal schema checks
+3. Verification of current and legacy tokens
+"""
+
+import builtins
+import hashlib
+import json
+
+import design_validation
+from design_validation import (
+    DesignValidator,
+    _proposal_schema_errors,
+    flush_pending_writes,
+)
+
+
+def _propose(tool_name="list_kubernetes_pods"):
+    """Validate a known-good proposal and return (validator, result)."""
+    validator = DesignValidator()
+    result = validator.validate_tool_proposal(
+        tool_name=tool_name,
+        purpose="List all pods in a Kubernetes cluster",
+        layer="team",
+        dependencies=["run_remote_command", "kubectl"],
+        requires_system_state_change=False,
+        implementation_approach="Uses run_remote_command to execute 'kubectl get pods -A -o json'",
+    )
+    assert result["valid"], result.get("issues")
+    flush_pending_writes()
+    return validator, result
+
+
+def test_configuration_check_reports_each_pattern():
+    """Every hardcoded-config pattern that matches is reported, case-insensitively."""
+    validator = DesignValidator()
+
+    result = validator._check_configuration(
+        "tool", "Set ALLOWED_CLUSTERS = ['Staging'] via teleport.tw.ee"
+    )
+
+    assert not result["pass"]
+    assert [issue.split("'")[1] for issue in result["issues"]] == [
+        r"staging",
+        r"teleport\.tw\.ee",
+        r"ALLOWED_CLUSTERS\s*=",
+    ]
+    assert validator._check_configuration("tool", "Reads config/clusters.yaml")["pass"]
+
+
+def test_ansible_and_dependency_checks():
+    """Anti-patterns are found in any case; clean text passes."""
+    validator = DesignValidator()
+
+    ansible = validator._check_ansible_first(
+        "Runs an INSTALL.SH script via Bash to install"
+    )
+    assert [issue.split("'")[1] for issue in ansible["issues"]] == [
+        r"\.sh\s+script",
+        r"bash.*install",
+        r"install\.sh",
+    ]
+    assert validator._check_ansible_first("Runs an Ansible playbook")["pass"]
+
+    deps = validator._check_dependencies("Directly calls SSH", "platform")
+    assert not deps["pass"]
+    assert validator._check_dependencies("run_remote_command kubectl", "team")["pass"]
+
+
+_SCHEMA = {
+    "type": "object",
+    "required": ["name", "layer"],
+    "properties": {
+        "name": {"type": "string", "minLength": 3},
+        "layer": {"type": "string", "enum": ["platform", "team", "personal"]},
+        "deps": {"type": "array", "items": {"type": "string"}},
+        "flag": {"type": "boolean"},
+    },
+}
+
+
+def test_proposal_schema_errors_without_jsonschema(monkeypatch):
+    """The direct fallback reports each declared rule with the field name."""
+    monkeypatch.setattr(design_validation, "jsonschema", None)
+
+    assert _proposal_schema_errors(_SCHEMA, {"name": "abc", "layer": "team"}) == []
+    assert _proposal_schema_errors(_SCHEMA, {"name": "abc"}) == ["'layer' is required"]
+    assert _proposal_schema_errors(_SCHEMA, {"name": "ab", "layer": "team"}) == [
+        "'name' must be at least 3 character(s)"
+    ]
+    assert _proposal_schema_errors(_SCHEMA, {"name": "abc", "layer": "other"}) == [
+        "'layer' must be one of: ['platform', 'team', 'personal'] (got 'other')"
+    ]
+    assert _proposal_schema_errors(
+        _SCHEMA, {"name": "abc", "layer": "team", "flag": "yes"}
+    ) == ["'flag' must be of type boolean"]
+    assert _proposal_schema_errors(
+        _SCHEMA, {"name": "abc", "layer": "team", "deps": ["a", 1]}
+    ) == ["'deps[1]' must be of type string"]
+
+
+def test_schema_check_rejects_bad_proposals():
+    """validate_tool_proposal reports schema errors before any other check."""
+    validator = DesignValidator()
+
+    result = validator.validate_tool_proposal(
+        tool_name="",
+        purpose="List pods",
+        layer="cluster",
+        dependencies=["run_remote_command"],
+    )
+
+    assert not result["valid"]
+    assert len(result["issues"]) == 2
+    assert all(i.startswith("❌ Invalid proposal:") for i in result["issues"])
+    assert "'tool_name'" in result["issues"][0]
+    assert "'layer'" in result["issues"][1]
+
+
+def test_verify_current_token():
+    """A freshly issued valid2 token verifies, with or without a warm cache."""
+    validator, result = _propose()
+
+    assert result["token"].startswith("valid2-")
+    assert validator.verify_token(result["token"])["valid"]
+    assert DesignValidator().verify_token(result["token"])["valid"]
+
+
+def test_verify_legacy_token():
+    """Tokens in the baseline SHA-256 "valid-" format still verify."""
+    validator, result = _propose()
+    proposal_id = result["proposal_id"]
+    data = validator.verify_token(result["token"])["proposal_data"]
+    tool_name = data["tool_name"]
+    timestamp = data["validation_results"]["timestamp"]
+
+    token_str = json.dumps(
+        {"proposal_id": proposal_id, "tool_name": tool_name, "timestamp": timestamp},
+        sort_keys=True,
+    ).encode()
+    sha_token = f"valid-{proposal_id}-{hashlib.sha256(token_str).hexdigest()[:16]}"
+
+    assert validator.verify_token(sha_token)["valid"]
+    assert DesignValidator().verify_token(sha_token)["valid"]
+
+
+def test_verify_rejects_tampered_tokens():
+    """Bad hashes, unknown IDs and malformed tokens are all rejected."""
+    validator, result = _propose()
+    token = result["token"]
+    tampered = token[:-1] + ("0" if token[-1] != "0" else "1")
+
+    assert not validator.verify_token(tampered)["valid"]
+    assert not validator.verify_token(f"valid2-ffffffff-{'0' * 16}")["valid"]
+    assert not validator.verify_token("invalid-token-xyz")["valid"]
+    assert not validator.verify_token("valid2")["valid"]
+
+
+def test_verify_returns_a_copy():
+    """Mutating proposal_data doesn't leak into later verifications."""
+    validator, result = _propose()
+
+    first = validator.verify_token(result["token"])
+    first["proposal_data"]["tool_name"] = "mutated"
+
+    second = validator.verify_token(result["token"])
+    assert second["valid"]
+    assert second["proposal_data"]["tool_name"] == "list_kubernetes_pods"
+
+
+def test_failed_write_invalidates_token(monkeypatch):
+    """A token whose proposal file couldn't be written never verifies."""
+
+    def failing_open(path, mode="r", *args, **kwargs):
+        if mode == "wb":
+            raise OSError("disk full")
+        return builtins.open(path, mode, *args, **kwargs)
+
+    validator = DesignValidator()
+    monkeypatch.setattr(design_validation, "open", failing_open, raising=False)
+    result = validator.validate_tool_proposal(
+        tool_name="list_kubernetes_nodes",
+        purpose="List all nodes in a Kubernetes cluster",
+        layer="team",
+        dependencies=["run_remote_command", "kubectl"],
+        requires_system_state_change=False,
+        implementation_approach="Uses run_remote_command to execute 'kubectl get nodes -o json'",
+    )
+    flush_pending_writes()
+
+    assert not validator.verify_token(result["token"])["valid"]
+    assert not validator.verify_token(result["token"])["valid"]
@@ -0,0 +1,299 @@
+#!/usr/bin/env python3
+"""
+Test the platform and team layer helpers
+
+Runs without tsh or a cluster: remote commands are replaced by a fake
+run_remote_command, and _run_capped is exercised with local processes.
+1. ttl_cache expiry, stale fallback and cache_clear
+2. _run_capped truncation and timeout
+3. Kubernetes name validation
+4. Batch tools rejecting bad list arguments
+5. reconcile with wait=False, suspend/resume no-op detection
+"""
+
+import subprocess
+import sys
+import time
+
+import pytest
+
+from src.layers import platform, team
+
+
+def _fake_remote(calls, success=True, stdout="", message=""):
+    """A run_remote_command stand-in that records each call's command."""
+
+    def run_remote_command(cluster, node, command, user="root", timeout=30):
+        calls.append(command)
+        return {
+            "success": success,
+            "cluster": cluster,
+            "node": node,
+            "stdout": stdout,
+            "stderr": "" if success else message,
+            "message": message,
+        }
+
+    return run_remote_command
+
+
+def test_ttl_cache_hit_and_expiry():
+    """Successful results are reused until the TTL runs out."""
+    calls = []
+
+    @platform.ttl_cache(0.2)
+    def ttl_probe(cluster, node="n1"):
+        calls.append((cluster, node))
+        return {"success": True, "n": len(calls)}
+
+    assert ttl_probe("staging")["n"] == 1
+    # Defaults are bound into the key, so these share the first entry
+    assert ttl_probe("staging", "n1")["n"] == 1
+    assert ttl_probe("staging", node="n1")["n"] == 1
+    assert ttl_probe("staging", "n2")["n"] == 2
+
+    time.sleep(0.25)
+    assert ttl_probe("staging")["n"] == 3
+
+    ttl_probe.cache_clear()
+    assert ttl_probe("staging")["n"] == 4
+
+
+def test_ttl_cache_failures_are_not_cached():
+    """A failed result is returned as-is and retried on the next call."""
+    results = iter([{"success": False, "message": "down"}, {"success": True}])
+
+    @platform.ttl_cache(60)
+    def ttl_flaky():
+        return next(results)
+
+    assert ttl_flaky() == {"success": False, "message": "down"}
+    assert ttl_flaky() == {"success": True}
+
+
+def test_ttl_cache_unhashable_arguments(monkeypatch):
+    """An unhashable argument bypasses the cache and reaches the tool's checks."""
+    calls = []
+    monkeypatch.setattr(platform, "run_remote_command", _fake_remote(calls))
+
+    result = team.get_flux_logs("staging", "k8s-master-01", tail=[1])
+
+    assert result["success"] is False
+    assert "tail" in result["message"]
+    assert calls == []
+
+
+def test_ttl_cache_stale_fallback():
+    """With stale_for, a failed refresh returns the last good result, marked stale."""
+    results = iter(
+        [{"success": True, "value": 1}, {"success": False, "message": "timeout"}]
+    )
+
+    @platform.ttl_cache(0.05, stale_for=60)
+    def ttl_stale_probe():
+        return next(results)
+
+    assert ttl_stale_probe() == {"success": True, "value": 1}
+    time.sleep(0.1)
+    stale = ttl_stale_probe()
+    assert stale["value"] == 1
+    assert stale["stale"] is True
+    assert stale["refresh_error"] == "timeout"
+    ttl_stale_probe.cache_clear()
+
+
+def test_ttl_cache_returns_copies():
+    """Callers can't mutate the cached entry."""
+
+    @platform.ttl_cache(60)
+    def ttl_copy_probe():
+        return {"success": True, "value": 1, "items": [{"name": "apps"}]}
+
+    first = ttl_copy_probe()
+    first["value"] = 2
+    first["items"].append({"name": "extra"})
+    first["items"][0]["name"] = "mutated"
+
+    assert ttl_copy_probe() == {
+        "success": True,
+        "value": 1,
+        "items": [{"name": "apps"}],
+    }
+    ttl_copy_probe.cache_clear()
+
+
+def test_run_capped_truncates():
+    """Output past max_bytes is dropped and reported with a marker."""
+    returncode, stdout, stderr = platform._run_capped(
+        [sys.executable, "-c", "print('x' * 5000)"], timeout=10, max_bytes=100
+    )
+
+    assert returncode == 0
+    assert stdout.startswith("x" * 100)
+    assert "output truncated: 4901 bytes omitted, limit 100 bytes" in stdout
+    assert stderr == ""
+
+
+def test_run_capped_timeout_keeps_partial_output():
+    """A timeout kills the child and raises with what it printed so far."""
+    command = [
+        sys.executable,
+        "-c",
+        "import sys, time; print('started', flush=True); time.sleep(30)",
+    ]
+
+    start = time.monotonic()
+    with pytest.raises(subprocess.TimeoutExpired) as excinfo:
+        platform._run_capped(command, timeout=1, max_bytes=1024)
+
+    assert time.monotonic() - start < 10
+    assert excinfo.value.output == "started\n"
+
+
+def test_k8s_name_error():
+    """Only DNS-1123 names and namespaces get through."""
+    assert team._k8s_name_error("apps", "flux-system") is None
+    assert team._k8s_name_error("my.app-1", "default") is None
+
+    assert "Invalid name" in team._k8s_name_error("Apps", "flux-system")
+    assert "Invalid name" in team._k8s_name_error("apps; rm -rf /", "flux-system")
+    assert "Invalid name" in team._k8s_name_error("a" * 254, "flux-system")
+    assert "Invalid name" in team._k8s_name_error(None, "flux-system")
+    assert "Invalid namespace" in team._k8s_name_error("apps", "flux.system")
+    assert "Invalid namespace" in team._k8s_name_error("apps", "a" * 64)
+    assert "Invalid namespace" in team._k8s_name_error("apps", "$(id)")
+
+
+@pytest.mark.parametrize(
+    "nodes",
+    [
+        "k8s-master-01",
+        None,
+        [],
+        ["k8s-master-01", 1],
+        [f"k8s-node-{i:02d}" for i in range(team.MAX_BATCH_NODES + 1)],
+    ],
+)
+def test_batch_rejects_bad_nodes(monkeypatch, nodes):
+    """nodes must be a non-empty list of hostnames, at most MAX_BATCH_NODES."""
+    calls = []
+    monkeypatch.setattr(platform, "run_remote_command", _fake_remote(calls))
+
+    result = team.list_flux_kustomizations_batch("staging", nodes)
+
+    assert result["success"] is False
+    assert result["cluster"] == "staging"
+    assert result["results"] == {}
+    assert result["failed_nodes"] == []
+    assert result["message"].startswith("❌")
+    assert calls == []
+
+
+def test_batch_rejects_unknown_cluster(monkeypatch):
+    """The cluster is checked before any node is queried."""
+    calls = []
+    monkeypatch.setattr(platform, "run_remote_command", _fake_remote(calls))
+
+    result = team.list_flux_kustomizations_batch("nonexistent", ["k8s-master-01"])
+
+    assert result["success"] is False
+    assert result["message"] == platform.INVALID_CLUSTER_MESSAGE
+    assert calls == []
+
+
+@pytest.mark.parametrize(
+    "targets",
+    ["staging", [], [{"cluster": "staging"}], [{"cluster": "staging", "node": 1}]],
+)
+def test_multi_rejects_bad_targets(monkeypatch, targets):
+    """targets must be a non-empty list of {cluster, node} string pairs."""
+    calls = []
+    monkeypatch.setattr(platform, "run_remote_command", _fake_remote(calls))
+
+    result = team.list_flux_sources_multi(targets)
+
+    assert result["success"] is False
+    assert result["results"] == {}
+    assert result["failed_targets"] == []
+    assert calls == []
+
+
+def test_reconcile_without_wait_annotates(monkeypatch):
+    """wait=False sets requestedAt and returns the timestamp it used."""
+    calls = []
+    monkeypatch.setattr(platform, "run_remote_command", _fake_remote(calls))
+
+    result = team.reconcile_flux_kustomization("staging", "k8s-master-01", "apps")
+
+    assert result["success"] is True
+    assert len(calls) == 1
+    assert "kubectl annotate --overwrite" in calls[0]
+    assert f"reconcile.fluxcd.io/requestedAt={result['requested_at']}" in calls[0]
+    assert " apps -n flux-system " in calls[0]
+    assert "flux reconcile" not in calls[0]
+
+
+def test_reconcile_with_wait_runs_flux(monkeypatch):
+    """wait=True runs the blocking `flux reconcile`."""
+    calls = []
+    monkeypatch.setattr(platform, "run_remote_command", _fake_remote(calls))
+
+    result = team.reconcile_flux_kustomization(
+        "staging", "k8s-master-01", "apps", wait=True
+    )
+
+    assert result["success"] is True
+    assert "requested_at" not in result
+    assert calls == ["sudo flux reconcile kustomization apps -n flux-system"]
+
+
+def test_reconcile_rejects_bad_name(monkeypatch):
+    """An invalid name never reaches the remote shell."""
+    calls = []
+    monkeypatch.setattr(platform, "run_remote_command", _fake_remote(calls))
+
+    result = team.reconcile_flux_kustomization("staging", "k8s-master-01", "a;b")
+
+    assert result["success"] is False
+    assert calls == []
+
+
+@pytest.mark.parametrize(
+    "tool, verb",
+    [
+        (team.suspend_flux_kustomization, "suspend"),
+        (team.resume_flux_kustomization, "resume"),
+    ],
+)
+def test_suspend_resume_noop(monkeypatch, tool, verb):
+    """The on-node state check's marker is reported as a no-op."""
+    calls = []
+    monkeypatch.setattr(
+        platform,
+        "run_remote_command",
+        _fake_remote(calls, stdout=team._NOOP_MARKER + "\n"),
+    )
+
+    result = tool("staging", "k8s-master-01", "apps")
+
+    assert result["success"] is True
+    assert result["noop"] is True
+    assert result["output"] == ""
+    assert f"sudo flux {verb} kustomization apps -n flux-system" in calls[0]
+
+
+@pytest.mark.parametrize(
+    "tool", [team.suspend_flux_kustomization, team.resume_flux_kustomization]
+)
+def test_suspend_resume_change(monkeypatch, tool):
+    """Without the marker, the flux output is returned and noop is False."""
+    calls = []
+    monkeypatch.setattr(
+        platform, "run_remote_command", _fake_remote(calls, stdout="✔ done\n")
+    )
+
+    result = tool("staging", "k8s-master-01", "apps")
+
+    assert result["success"] is True
+    assert result["noop"] is False
+    assert result["output"] == "✔ done\n"
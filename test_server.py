@@ -7,10 +7,12 @@ print("✅ MCP Server module loaded successfully!")
 
 print("\n🧪 Testing list_kube_contexts tool directly...")
 try:
+    import asyncio
+
     from platform_mcp import list_kube_contexts
-    result = list_kube_contexts()
-    print(f"✅ Success! Found {len(result.splitlines())} Kubernetes context(s):")
-    for ctx in result.splitlines():
+    result = asyncio.run(list_kube_contexts())
+    print(f"✅ Success! Found {len(result['contexts'])} Kubernetes context(s):")
+    for ctx in result["contexts"]:
         print(f"  - {ctx}")
 except Exception as e:
     print(f"❌ Error: {e}")
@@ -11,6 +11,7 @@ Usage:
     python test_teleport_v1b.py
 """
 
+import asyncio
 import sys
 
 from platform_mcp import (
@@ -66,7 +67,7 @@ def test_list_nodes():
         print(f"\nTesting: list_teleport_nodes('{cluster}')")
         print(f"Expected: Show SSH nodes in {cluster}\n")
 
-        result = list_teleport_nodes(cluster)
+        result = asyncio.run(list_teleport_nodes(cluster))
         print_result(result)
         results[cluster] = result
         print("\n" + "-" * 80)
@@ -74,7 +75,7 @@ def test_list_nodes():
     # Also test with filter
     print(f"\nTesting: list_teleport_nodes('staging', filter='k8s')")
     print("Expected: Show only k8s nodes\n")
-    result = list_teleport_nodes("staging", filter="k8s")
+    result = asyncio.run(list_teleport_nodes("staging", filter="k8s"))
     print_result(result)
     results["staging_k8s"] = result
 
@@ -87,7 +88,7 @@ def test_verify_access(cluster, node):
     print(f"Testing: verify_ssh_access('{cluster}', '{node}')")
     print("Expected: Confirm SSH connection works\n")
 
-    result = verify_ssh_access(cluster, node, user="root")
+    result = asyncio.run(verify_ssh_access(cluster, node, user="root"))
     print_result(result)
 
     return result
@@ -99,7 +100,7 @@ def test_run_command(cluster, node):
     print(f"Testing: run_remote_command('{cluster}', '{node}', 'whoami')")
     print("Expected: Execute 'whoami' and return output\n")
 
-    result = run_remote_command(cluster, node, "whoami", user="root")
+    result = asyncio.run(run_remote_command(cluster, node, "whoami", user="root"))
     print_result(result)
 
     return result
@@ -111,7 +112,7 @@ def test_list_flux(cluster, node):
     print(f"Testing: list_flux_kustomizations('{cluster}', '{node}')")
     print("Expected: Show all Flux Kustomizations\n")
 
-    result = list_flux_kustomizations(cluster, node)
+    result = asyncio.run(list_flux_kustomizations(cluster, node))
     print_result(result)
 
     return result
@@ -125,8 +126,10 @@ def test_reconcile_flux(cluster, node, kustomization_name):
     )
     print("Expected: Trigger Flux reconciliation\n")
 
-    result = reconcile_flux_kustomization(
-        cluster, node, kustomization_name, namespace="flux-system"
+    result = asyncio.run(
+        reconcile_flux_kustomization(
+            cluster, node, kustomization_name, namespace="flux-system"
+        )
     )
     print_result(result)
 